@@ -0,0 +1,34 @@
+__all__ = [
+    "BatchException",
+    "BatchPipeline",
+    "ChunkResult",
+    "Engine",
+    "INVALID",
+    "LatencyHistogram",
+    "Puzzle",
+    "RatingChunk",
+    "RatingPipeline",
+    "SolutionStore",
+    "StoreRecord",
+    "StreamReport",
+    "UNSOLVED",
+    "check_givens",
+    "load_dataset",
+    "parse_line",
+    "solve_quiz",
+    "solve_stream",
+]
+
+from .dataset import Puzzle, load_dataset, parse_line
+from .exceptions import BatchException
+from .pipeline import BatchPipeline, ChunkResult, Engine, solve_quiz
+from .rating import RatingChunk, RatingPipeline
+from .store import SolutionStore, StoreRecord
+from .stream import (
+    INVALID,
+    UNSOLVED,
+    LatencyHistogram,
+    StreamReport,
+    check_givens,
+    solve_stream,
+)
@@ -0,0 +1,82 @@
+import argparse
+import logging
+from collections import Counter
+from time import perf_counter
+
+from solver import Level
+
+from .dataset import Puzzle, load_dataset
+from .pipeline import BatchPipeline, Engine
+from .rating import RatingPipeline
+from .store import SolutionStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m batch", description="Solve a dataset file on a process pool")
+    parser.add_argument("path", help="file with quiz[,solution] lines")
+    parser.add_argument("--engine", choices=[engine.value for engine in Engine], default=Engine.BITBOARD.value)
+    parser.add_argument("--rate", action="store_true", help="rate the difficulty instead of solving")
+    parser.add_argument("--workers", type=int, help="worker processes, CPU count by default")
+    parser.add_argument("--chunk-size", type=int, help="puzzles per chunk, 4 chunks per worker by default")
+    parser.add_argument("--store", help="sqlite file with the known solutions, new results are added to it")
+    parser.add_argument("--check-uniqueness", action="store_true", help="count the solutions of the solved puzzles")
+    args = parser.parse_args()
+
+    puzzles = load_dataset(args.path)
+    store = SolutionStore(args.store) if args.store else None
+    start_time = perf_counter()
+    if args.rate:
+        rating_pipeline = RatingPipeline(workers=args.workers, chunk_size=args.chunk_size, store=store)
+        workers, summary = rating_pipeline.workers, _rate(rating_pipeline, puzzles)
+    else:
+        pipeline = BatchPipeline(
+            Engine(args.engine),
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            store=store,
+            check_uniqueness=args.check_uniqueness,
+        )
+        workers, summary = pipeline.workers, _solve(pipeline, puzzles)
+    total_time = perf_counter() - start_time
+    if store:
+        store.close()
+    print(
+        f"Puzzles: {len(puzzles)}. {summary}. Workers: {workers}. "
+        f"Time: {total_time:.3f} s ({len(puzzles) / total_time:.0f} puzzles/s)"
+    )
+
+
+def _solve(pipeline: BatchPipeline, puzzles: list[Puzzle]) -> str:
+    solved = wrong = multiple = 0
+    for chunk in pipeline.iter_chunks([quiz for quiz, _ in puzzles]):
+        print(f"Chunk {chunk.index}: {len(chunk.solutions)} puzzles in {chunk.time:.3f} s (pid {chunk.pid})")
+        for (_, expected), solution in zip(puzzles[chunk.start :], chunk.solutions):
+            solved += solution is not None
+            wrong += solution is not None and bool(expected) and solution not in expected
+        multiple += chunk.solutions_counts.count(2)
+    return f"Solved: {solved}. Wrong: {wrong}. Multiple solutions: {multiple}"
+
+
+def _rate(pipeline: RatingPipeline, puzzles: list[Puzzle]) -> str:
+    levels = Counter[Level]()
+    techniques = Counter[str | None]()
+    score = invalid = 0
+    for chunk in pipeline.iter_chunks([quiz for quiz, _ in puzzles]):
+        print(f"Chunk {chunk.index}: {len(chunk.ratings)} puzzles in {chunk.time:.3f} s (pid {chunk.pid})")
+        ratings = [rating for rating in chunk.ratings if rating]
+        invalid += len(chunk.ratings) - len(ratings)
+        levels.update(rating.level for rating in ratings)
+        techniques.update(rating.technique for rating in ratings)
+        score += sum(rating.score for rating in ratings)
+    for technique, count in techniques.most_common():
+        print(f"{technique or '-'}: {count}")
+    return ". ".join(
+        [f"Average score: {score / len(puzzles) if puzzles else 0:.0f}"]
+        + [f"{level.value}: {levels[level]}" for level in Level]
+        + [f"Invalid: {invalid}"]
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
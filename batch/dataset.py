@@ -0,0 +1,12 @@
+Puzzle = tuple[str, tuple[str, ...]]  # quiz, known solutions
+
+
+def load_dataset(path: str) -> list[Puzzle]:
+    """Reads `quiz[,solution...]` lines, empty lines and lines starting with # are skipped"""
+    with open(path) as file:
+        return [parse_line(line) for line in file if line.strip() and not line.startswith("#")]
+
+
+def parse_line(line: str) -> Puzzle:
+    quiz, *solutions = line.strip().split(",")
+    return quiz, tuple(solutions)
@@ -0,0 +1,2 @@
+class BatchException(Exception):
+    pass
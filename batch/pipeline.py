@@ -0,0 +1,211 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial
+from logging import getLogger
+from time import perf_counter
+from typing import Callable, Iterator, Sequence, TypeVar
+
+from solver import BatchSolver, BitboardSolver, BruteForcer, Solver, SolverException
+from sudoku import Grid, SudokuException
+
+from .exceptions import BatchException
+from .store import SolutionStore, StoreRecord
+
+T = TypeVar("T")
+
+
+class Engine(Enum):
+    LOGICAL = "logical"  # Solver: puzzles not solved by the strategies have no solution in the result
+    BRUTE_FORCE = "brute-force"  # BruteForcer
+    BITBOARD = "bitboard"  # BitboardSolver
+    VECTORIZED = "vectorized"  # BatchSolver: the whole chunk is solved at once
+
+
+@dataclass(frozen=True)
+class ChunkResult:
+    index: int
+    start: int  # index of the chunk first puzzle in the input
+    solutions: list[str | None]
+    solutions_counts: list[int | None]  # 0, 1 or 2 (multiple solutions), None if uniqueness is not checked
+    time: float  # solving time in the worker process
+    pid: int
+
+
+class ChunkedPipeline:
+    """Common part of the pipelines: puzzles are split in chunks processed on a process pool,
+    chunks results are returned in input order
+    """
+
+    def __init__(
+        self, *, workers: int | None = None, chunk_size: int | None = None, store: SolutionStore | None = None
+    ):
+        self._logger = getLogger(__name__)
+        if (workers is not None and workers < 1) or (chunk_size is not None and chunk_size < 1):
+            raise BatchException(f"{self}: Unexpected workers {workers} or chunk size {chunk_size}")
+        self._workers = workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._store = store
+
+    def __str__(self) -> str:
+        return "ChunkedPipeline"
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def _split(self, quizzes: Sequence[str]) -> tuple[range, list[list[str]]]:
+        """Chunks starts (indices in the input) and chunks"""
+        # Several chunks per worker: slow chunks are balanced by the fast ones
+        chunk_size = self._chunk_size or max(1, math.ceil(len(quizzes) / (self._workers * 4)))
+        starts = range(0, len(quizzes), chunk_size)
+        return starts, [list(quizzes[start : start + chunk_size]) for start in starts]
+
+    def _map(
+        self, function: Callable[[int, int, list[str]], T], starts: range, chunks: list[list[str]]
+    ) -> Iterator[T]:
+        """Runs `function(index, start, chunk)` in parallel, results are yielded in input order as soon as ready"""
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            yield from executor.map(function, range(len(starts)), starts, chunks)
+
+
+class BatchPipeline(ChunkedPipeline):
+    """Solves puzzles in chunks on a process pool. Chunks results are returned in input order.
+    Optional store is consulted before solving: only unknown puzzles are sent to the workers,
+    new results are written back in one transaction per chunk.
+    With `check_uniqueness` the solutions are counted (up to 2) as well, the verdicts are stored with the solutions
+    """
+
+    def __init__(
+        self,
+        engine: Engine = Engine.BITBOARD,
+        *,
+        workers: int | None = None,
+        chunk_size: int | None = None,
+        store: SolutionStore | None = None,
+        check_uniqueness: bool = False,
+    ):
+        super().__init__(workers=workers, chunk_size=chunk_size, store=store)
+        self._engine = engine
+        self._check_uniqueness = check_uniqueness
+
+    def __str__(self) -> str:
+        return "BatchPipeline"
+
+    @property
+    def engine(self) -> Engine:
+        return self._engine
+
+    def solve(self, quizzes: Sequence[str]) -> list[str | None]:
+        return [solution for chunk in self.iter_chunks(quizzes) for solution in chunk.solutions]
+
+    def iter_chunks(self, quizzes: Sequence[str]) -> Iterator[ChunkResult]:
+        """Chunks are solved in parallel, results are yielded in input order as soon as they are ready"""
+        starts, chunks = self._split(quizzes)
+        self._logger.info(
+            "%s: %d puzzles, %d chunks, %d workers, %s", self, len(quizzes), len(starts), self._workers, self._engine
+        )
+        store = self._store
+        records = [store.get_many(chunk) if store else [None] * len(chunk) for chunk in chunks]
+        known = [[self._is_known(record) for record in chunk_records] for chunk_records in records]
+        unknown = [
+            [quiz for quiz, is_known in zip(chunk, chunk_known) if not is_known]
+            for chunk, chunk_known in zip(chunks, known)
+        ]
+        results = self._map(
+            partial(solve_chunk, self._engine, check_uniqueness=self._check_uniqueness), starts, unknown
+        )
+        for chunk, chunk_quizzes, chunk_records, chunk_known in zip(results, unknown, records, known):
+            self._logger.info(
+                "%s: Chunk %d: %d puzzles solved in %.3f s", self, chunk.index, len(chunk.solutions), chunk.time
+            )
+            if not store:
+                yield chunk
+                continue
+            self._put(store, chunk_quizzes, chunk.solutions, chunk.solutions_counts)
+            new_results = iter(zip(chunk.solutions, chunk.solutions_counts))
+            results_known = [
+                (record.solution, record.solutions_count) if record and is_known else next(new_results)
+                for record, is_known in zip(chunk_records, chunk_known)
+            ]
+            yield ChunkResult(
+                chunk.index,
+                chunk.start,
+                [solution for solution, _ in results_known],
+                [count for _, count in results_known],
+                chunk.time,
+                chunk.pid,
+            )
+
+    def _is_known(self, record: StoreRecord | None) -> bool:
+        """Solving is not needed: the stored record has everything this pipeline finds out"""
+        if not record or not record.is_solved:
+            return False
+        return not self._check_uniqueness or record.solutions_count is not None
+
+    def _put(
+        self,
+        store: SolutionStore,
+        quizzes: list[str],
+        solutions: list[str | None],
+        solutions_counts: list[int | None],
+    ) -> None:
+        """New results of a chunk are committed in one transaction"""
+        for quiz, solution, count in zip(quizzes, solutions, solutions_counts):
+            if solution is not None:
+                store.put(quiz, StoreRecord(solution, count))
+            elif self._engine != Engine.LOGICAL:  # logical solving failure does not mean there are no solutions
+                store.put(quiz, StoreRecord(solutions_count=0))
+        store.flush()
+
+
+def solve_chunk(
+    engine: Engine, index: int, start: int, quizzes: list[str], *, check_uniqueness: bool = False
+) -> ChunkResult:
+    """Worker process entry point"""
+    start_time = perf_counter()
+    solutions: list[str | None] | None = None
+    if engine == Engine.VECTORIZED:
+        try:
+            solutions = BatchSolver().solve(quizzes)
+        except SolverException:
+            pass  # one malformed quiz fails the whole batch: the chunk is solved quiz by quiz
+    if solutions is None:
+        solutions = [_solve_checked_quiz(engine, quiz) for quiz in quizzes]
+    counts: list[int | None] = [None] * len(quizzes)
+    if check_uniqueness:
+        counts = [_count_solutions(engine, quiz, solution) for quiz, solution in zip(quizzes, solutions)]
+    return ChunkResult(index, start, solutions, counts, perf_counter() - start_time, os.getpid())
+
+
+def _count_solutions(engine: Engine, quiz: str, solution: str | None) -> int | None:
+    """Uniqueness verdict of a solved quiz: the search stops at the second solution"""
+    if solution is None:
+        return None if engine == Engine.LOGICAL else 0
+    return BitboardSolver(quiz).count_solutions(limit=2)
+
+
+def _solve_checked_quiz(engine: Engine, quiz: str) -> str | None:
+    """Malformed quiz has no solution: it does not abort the rest of the chunk"""
+    try:
+        return solve_quiz(engine, quiz)
+    except (SolverException, SudokuException) as e:
+        getLogger(__name__).warning("Invalid quiz %r: %s", quiz, e)
+        return None
+
+
+def solve_quiz(engine: Engine, quiz: str) -> str | None:
+    match engine:
+        case Engine.LOGICAL:
+            grid = Grid(quiz, observable=False)
+            grid.init_candidates()
+            Solver(grid).solve()  # reports no progress for an already complete grid
+            return "".join(str(cell.value) for cell in grid.cells) if grid.is_solved else None
+        case Engine.BRUTE_FORCE:
+            return BruteForcer(Grid(quiz, observable=False)).create_solution()
+        case Engine.BITBOARD:
+            return BitboardSolver(quiz).create_solution()
+        case Engine.VECTORIZED:
+            return BatchSolver().solve([quiz])[0]
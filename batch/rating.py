@@ -0,0 +1,98 @@
+import os
+from dataclasses import dataclass
+from logging import getLogger
+from time import perf_counter
+from typing import Iterator, Sequence
+
+from solver import DifficultyRater, Level, Rating, SolverException
+from sudoku import SudokuException
+
+from .pipeline import ChunkedPipeline
+from .store import StoreRecord
+
+
+@dataclass(frozen=True)
+class RatingChunk:
+    index: int
+    start: int  # index of the chunk first puzzle in the input
+    ratings: list[Rating | None]  # None for malformed quizzes
+    time: float  # rating time in the worker process
+    pid: int
+
+
+class RatingPipeline(ChunkedPipeline):
+    """Rates puzzles in chunks on a process pool. Chunks results are returned in input order.
+    Optional store is consulted before rating: only puzzles without a stored rating are sent to the workers.
+    Store gets the new ratings (and the solutions of the logically solved puzzles), one transaction per chunk.
+    Stored ratings have no per technique applications
+    """
+
+    def __str__(self) -> str:
+        return "RatingPipeline"
+
+    def rate(self, quizzes: Sequence[str]) -> list[Rating | None]:
+        return [rating for chunk in self.iter_chunks(quizzes) for rating in chunk.ratings]
+
+    def iter_chunks(self, quizzes: Sequence[str]) -> Iterator[RatingChunk]:
+        starts, chunks = self._split(quizzes)
+        self._logger.info("%s: %d puzzles, %d chunks, %d workers", self, len(quizzes), len(starts), self._workers)
+        store = self._store
+        stored = [
+            [_get_stored_rating(record) for record in store.get_many(chunk)] if store else [None] * len(chunk)
+            for chunk in chunks
+        ]
+        unknown = [
+            [quiz for quiz, rating in zip(chunk, chunk_stored) if rating is None]
+            for chunk, chunk_stored in zip(chunks, stored)
+        ]
+        for chunk, chunk_quizzes, chunk_stored in zip(self._map(rate_chunk, starts, unknown), unknown, stored):
+            self._logger.info(
+                "%s: Chunk %d: %d puzzles rated in %.3f s", self, chunk.index, len(chunk.ratings), chunk.time
+            )
+            if not store:
+                yield chunk
+                continue
+            store.put_many(
+                (
+                    quiz,
+                    StoreRecord(
+                        rating.solution, rating=rating.score, technique=rating.technique, level=rating.level.value
+                    ),
+                )
+                for quiz, rating in zip(chunk_quizzes, chunk.ratings)
+                if rating
+            )
+            store.flush()
+            ratings = iter(chunk.ratings)
+            yield RatingChunk(
+                chunk.index,
+                chunk.start,
+                [rating if rating else next(ratings) for rating in chunk_stored],
+                chunk.time,
+                chunk.pid,
+            )
+
+
+def rate_chunk(index: int, start: int, quizzes: list[str]) -> RatingChunk:
+    """Worker process entry point"""
+    start_time = perf_counter()
+    rater = DifficultyRater()
+    ratings = [_rate_checked_quiz(rater, quiz) for quiz in quizzes]
+    return RatingChunk(index, start, ratings, perf_counter() - start_time, os.getpid())
+
+
+def _get_stored_rating(record: StoreRecord | None) -> Rating | None:
+    if not record or record.rating is None or record.level is None:
+        return None
+    level = Level(record.level)
+    solution = record.solution if level != Level.EXTREME else None  # the solution may come from a search
+    return Rating(int(record.rating), level, record.technique, solution, {})
+
+
+def _rate_checked_quiz(rater: DifficultyRater, quiz: str) -> Rating | None:
+    """Malformed quiz has no rating: it does not abort the rest of the chunk"""
+    try:
+        return rater.rate(quiz)
+    except (SolverException, SudokuException) as e:
+        getLogger(__name__).warning("Invalid quiz %r: %s", quiz, e)
+        return None
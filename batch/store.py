@@ -0,0 +1,141 @@
+import hashlib
+import sqlite3
+from dataclasses import dataclass
+from logging import getLogger
+from types import TracebackType
+from typing import Iterable, Sequence
+
+from .exceptions import BatchException
+
+
+@dataclass(frozen=True)
+class StoreRecord:
+    """Known facts about a puzzle, None for the unknown ones"""
+
+    solution: str | None = None
+    solutions_count: int | None = None  # uniqueness verdict: 0 no solutions, 1 unique, 2 multiple solutions
+    rating: float | None = None
+    technique: str | None = None  # hardest technique of the logical solving
+    level: str | None = None  # difficulty level of the rating
+
+    @property
+    def is_solved(self) -> bool:
+        """Solving is not needed: either the solution or the absence of solutions is known"""
+        return self.solution is not None or self.solutions_count == 0
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS puzzles (
+    key BLOB PRIMARY KEY,
+    solution TEXT,
+    solutions_count INTEGER,
+    rating REAL,
+    technique TEXT,
+    level TEXT
+) WITHOUT ROWID
+"""
+# Known facts are never forgotten: a record without the solution does not erase the stored one
+_UPSERT = """
+INSERT INTO puzzles VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET
+    solution = coalesce(excluded.solution, solution),
+    solutions_count = coalesce(excluded.solutions_count, solutions_count),
+    rating = coalesce(excluded.rating, rating),
+    technique = coalesce(excluded.technique, technique),
+    level = coalesce(excluded.level, level)
+"""
+_SELECT_BATCH = 500  # keys per select: below the sqlite variables limit
+
+
+class SolutionStore:
+    """Persistent puzzles facts in a sqlite file, keyed by the quiz hash.
+    Writes are buffered and committed in one transaction per `batch_size` records (or on `flush` and `close`)
+    """
+
+    def __init__(self, path: str, *, batch_size: int = 10000):
+        self._logger = getLogger(__name__)
+        if batch_size < 1:
+            raise BatchException(f"{self}: Unexpected batch size {batch_size}")
+        self._path = path
+        self._batch_size = batch_size
+        self._pending: dict[bytes, StoreRecord] = {}
+        self._connection = sqlite3.connect(path)
+        # Write-ahead log: readers do not block the writer, commits do not wait for the full disk sync
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def __str__(self) -> str:
+        return "SolutionStore"
+
+    def __enter__(self) -> "SolutionStore":
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    @property
+    def size(self) -> int:
+        self.flush()
+        return int(self._connection.execute("SELECT count(*) FROM puzzles").fetchone()[0])
+
+    def get(self, quiz: str) -> StoreRecord | None:
+        return self.get_many([quiz])[0]
+
+    def get_many(self, quizzes: Sequence[str]) -> list[StoreRecord | None]:
+        """Stored record for each quiz, None for unknown puzzles"""
+        self.flush()
+        keys = [_get_key(quiz) for quiz in quizzes]
+        records: dict[bytes, StoreRecord] = {}
+        for start in range(0, len(keys), _SELECT_BATCH):
+            batch = keys[start : start + _SELECT_BATCH]
+            rows = self._connection.execute(
+                f"SELECT * FROM puzzles WHERE key IN ({', '.join('?' * len(batch))})", batch
+            )
+            records.update((key, StoreRecord(*values)) for key, *values in rows)
+        return [records.get(key) for key in keys]
+
+    def put(self, quiz: str, record: StoreRecord) -> None:
+        self.put_many([(quiz, record)])
+
+    def put_many(self, records: Iterable[tuple[str, StoreRecord]]) -> None:
+        for quiz, record in records:
+            key = _get_key(quiz)
+            pending = self._pending.get(key)
+            self._pending[key] = _merge(pending, record) if pending else record
+            if len(self._pending) >= self._batch_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Commits the buffered records in one transaction"""
+        if not self._pending:
+            return
+        rows = [
+            (key, record.solution, record.solutions_count, record.rating, record.technique, record.level)
+            for key, record in self._pending.items()
+        ]
+        with self._connection:
+            self._connection.executemany(_UPSERT, rows)
+        self._logger.debug("%s: %d records committed", self, len(rows))
+        self._pending.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self._connection.close()
+
+
+def _get_key(quiz: str) -> bytes:
+    """Hash of the quiz: empty cells as "0" and "." give the same key"""
+    return hashlib.blake2b(quiz.replace(".", "0").encode(), digest_size=16).digest()
+
+
+def _merge(old: StoreRecord, new: StoreRecord) -> StoreRecord:
+    return StoreRecord(
+        new.solution if new.solution is not None else old.solution,
+        new.solutions_count if new.solutions_count is not None else old.solutions_count,
+        new.rating if new.rating is not None else old.rating,
+        new.technique if new.technique is not None else old.technique,
+        new.level if new.level is not None else old.level,
+    )
@@ -0,0 +1,126 @@
+import math
+from dataclasses import dataclass, field
+from logging import getLogger
+from time import perf_counter
+from typing import Iterable, TextIO
+
+from solver import SolverException
+from sudoku import HOUSE_CELLS, SudokuException
+
+from .dataset import parse_line
+from .exceptions import BatchException
+from .pipeline import Engine, solve_quiz
+
+UNSOLVED = "unsolved"
+INVALID = "invalid"
+
+
+class LatencyHistogram:
+    """Fixed memory latency distribution: log scale buckets from 1 µs to 1000 s, 20 buckets per decade.
+    Percentiles are bucket upper bounds: within 12% of the exact value
+    """
+
+    _MIN_LATENCY = 1e-6
+    _BUCKETS_PER_DECADE = 20
+    _BUCKETS = 9 * _BUCKETS_PER_DECADE
+
+    def __init__(self) -> None:
+        self._counts = [0] * self._BUCKETS
+        self._count = 0
+        self._max = 0.0
+
+    def __str__(self) -> str:
+        return "LatencyHistogram"
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    def add(self, latency: float) -> None:
+        bucket = math.ceil(math.log10(max(latency, self._MIN_LATENCY) / self._MIN_LATENCY) * self._BUCKETS_PER_DECADE)
+        self._counts[min(bucket, self._BUCKETS - 1)] += 1
+        self._count += 1
+        self._max = max(self._max, latency)
+
+    def percentile(self, percent: float) -> float:
+        if not self._count:
+            return 0.0
+        rank = math.ceil(self._count * percent / 100) or 1
+        seen = 0
+        for bucket, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return min(self._MIN_LATENCY * 10 ** (bucket / self._BUCKETS_PER_DECADE), self._max)
+        return self._max
+
+
+@dataclass
+class StreamReport:
+    puzzles: int = 0
+    solved: int = 0
+    unsolved: int = 0
+    invalid: int = 0
+    wrong: int = 0  # solved, but the solution differs from the known ones
+    time: float = 0.0
+    latencies: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def rate(self) -> float:
+        return self.puzzles / self.time if self.time else 0.0
+
+    def format(self) -> str:
+        percentiles = ", ".join(
+            f"p{percent:g}: {self.latencies.percentile(percent) * 1000:.3f}" for percent in (50, 90, 99, 99.9)
+        )
+        return (
+            f"Puzzles: {self.puzzles}. Solved: {self.solved}. Unsolved: {self.unsolved}. Invalid: {self.invalid}. "
+            f"Wrong: {self.wrong}\n"
+            f"Time: {self.time:.3f} s. Puzzles/s: {self.rate:.1f}\n"
+            f"Latency, ms: {percentiles}, max: {self.latencies.max * 1000:.3f}"
+        )
+
+
+def solve_stream(lines: Iterable[str], output: TextIO, engine: Engine = Engine.BITBOARD) -> StreamReport:
+    """Solves `quiz[,solution...]` lines one by one and writes a solution (or a marker) line for each of them.
+    Input is never held in memory: lines can come from a file or a pipe of any size
+    """
+    logger = getLogger(__name__)
+    report = StreamReport()
+    start_time = perf_counter()
+    for line in lines:
+        if not line.strip() or line.startswith("#"):
+            continue
+        quiz, expected = parse_line(line)
+        quiz_start_time = perf_counter()
+        try:
+            check_givens(quiz)
+            solution = solve_quiz(engine, quiz)
+        except (BatchException, SolverException, SudokuException) as e:
+            logger.warning("Invalid quiz %r: %s", quiz, e)
+            result = INVALID
+            report.invalid += 1
+        else:
+            result = solution or UNSOLVED
+            report.solved += solution is not None
+            report.unsolved += solution is None
+            report.wrong += solution is not None and bool(expected) and solution not in expected
+        report.latencies.add(perf_counter() - quiz_start_time)
+        report.puzzles += 1
+        output.write(f"{result}\n")
+        output.flush()  # a pipe is block buffered: every result is passed on as soon as it is ready
+    report.time = perf_counter() - start_time
+    return report
+
+
+def check_givens(quiz: str) -> None:
+    """Contradictory givens make the quiz invalid rather than unsolved. Malformed quizzes are left to the solvers"""
+    if len(quiz) != 81:
+        return
+    for house, cells in enumerate(HOUSE_CELLS):
+        givens = [quiz[idx] for idx in cells if quiz[idx] not in "0."]
+        if len(givens) != len(set(givens)):
+            raise BatchException(f"Duplicate givens in house {house}")
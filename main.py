@@ -1,9 +1,41 @@
+import argparse
 import logging
 import logging.config
+import sys
+from contextlib import ExitStack
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Sudoku. Without arguments the UI is launched")
+    parser.add_argument("input", nargs="?", help="file with quiz[,solution] lines to solve, - for stdin")
+    parser.add_argument("-o", "--output", help="solutions file, stdout by default")
+    parser.add_argument("--engine", default="bitboard", help="logical, brute-force, bitboard (default) or vectorized")
+    parser.add_argument("--log-level", default="ERROR", help="log level of the command line mode (stderr)")
+    return parser.parse_args()
+
+
+def run_cli(args: argparse.Namespace) -> None:
+    from batch import Engine, solve_stream  # NumPy pipeline is not needed by the UI
+
+    try:
+        engine = Engine(args.engine)
+    except ValueError:
+        sys.exit(f"Unexpected engine {args.engine}, expected one of: {', '.join(item.value for item in Engine)}")
+    logging.basicConfig(level=args.log_level.upper(), stream=sys.stderr)
+    with ExitStack() as stack:  # only the files opened here are closed, not the standard streams
+        input_file = stack.enter_context(open(args.input)) if args.input != "-" else sys.stdin
+        output_file = stack.enter_context(open(args.output, "w")) if args.output else sys.stdout
+        report = solve_stream(input_file, output_file, engine)
+    print(report.format(), file=sys.stderr)
 
-from ui import App
 
 if __name__ == "__main__":
-    logging.config.fileConfig("logging.conf")
-    logging.info("Running app")
-    App().start()
+    args = parse_args()
+    if args.input:
+        run_cli(args)
+    else:
+        from ui import App  # Tk is needed only by the UI
+
+        logging.config.fileConfig("logging.conf")
+        logging.info("Running app")
+        App().start()
@@ -0,0 +1,5 @@
+__all__ = ["BUSY", "SOLVED", "TIMEOUT", "ServiceException", "SolverService"]
+
+from .exceptions import ServiceException
+from .server import BUSY, SolverService
+from .worker import SOLVED, TIMEOUT
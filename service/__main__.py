@@ -0,0 +1,33 @@
+import argparse
+import asyncio
+import logging
+
+from batch import Engine
+
+from .server import SolverService
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m service", description="Newline-delimited solving service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Unix socket path, used instead of TCP")
+    parser.add_argument("--engine", choices=[engine.value for engine in Engine], default=Engine.BITBOARD.value)
+    parser.add_argument("--workers", type=int, help="worker processes, CPU count by default")
+    parser.add_argument("--queue-limit", type=int, default=1000, help="requests over the limit get busy response")
+    parser.add_argument("--timeout", type=float, default=10.0, help="request deadline, seconds")
+    args = parser.parse_args()
+
+    service = SolverService(
+        engine=Engine(args.engine), workers=args.workers, queue_limit=args.queue_limit, timeout=args.timeout
+    )
+    await service.start(host=args.host, port=args.port, path=args.unix)
+    try:
+        await service.serve_forever()
+    finally:
+        await service.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
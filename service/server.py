@@ -0,0 +1,165 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from logging import getLogger
+
+from batch import INVALID, Engine
+
+from .exceptions import ServiceException
+from .worker import TIMEOUT, init_worker, solve_request
+
+BUSY = "busy"
+
+
+class SolverService:
+    """Newline-delimited solving service on a TCP or Unix socket.
+    Request line is `[engine] quiz`, response lines come in requests order (see `solve_request` for the format).
+    Solving runs on a bounded pool of warm worker processes. Requests over `queue_limit` are rejected with `busy`,
+    requests not solved within `timeout` seconds get `timeout`. Requests of a disconnected client are cancelled,
+    closing the service cancels the handling of all connections
+    """
+
+    def __init__(
+        self,
+        *,
+        engine: Engine = Engine.BITBOARD,
+        workers: int | None = None,
+        queue_limit: int = 1000,
+        timeout: float = 10.0,
+        connection_limit: int = 100,
+    ):
+        self._logger = getLogger(__name__)
+        self._engine = engine
+        self._workers = workers or os.cpu_count() or 1
+        self._queue_limit = queue_limit
+        self._timeout = timeout
+        self._connection_limit = connection_limit  # requests of one connection waiting for the response
+        self._pending = 0
+        self._pending_lock = threading.Lock()  # released in the executor thread when a worker is done
+        self._executor: ProcessPoolExecutor | None = None
+        self._server: asyncio.Server | None = None
+        self._handlers: set[asyncio.Task[None]] = set()  # connections being handled
+
+    def __str__(self) -> str:
+        return "SolverService"
+
+    @property
+    def pending(self) -> int:
+        """Requests queued or being solved: timed out requests count until their worker is done"""
+        return self._pending
+
+    @property
+    def connections(self) -> int:
+        return len(self._handlers)
+
+    async def start(self, *, host: str = "127.0.0.1", port: int = 0, path: str | None = None) -> None:
+        """Listens on the Unix socket `path` if it is given, on TCP `host:port` otherwise"""
+        if self._server:
+            raise ServiceException(f"{self}: Already started")
+        # Spawned (not forked) workers do not inherit the sockets of the accepted connections
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._workers, mp_context=multiprocessing.get_context("spawn"), initializer=init_worker
+        )
+        # Workers are started and warmed up before the first request
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._executor, os.getpid) for _ in range(self._workers)))
+        if path:
+            self._server = await asyncio.start_unix_server(self._handle, path)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+        self._logger.info("%s: Listening on %s", self, self.addresses)
+
+    @property
+    def addresses(self) -> list[str]:
+        """`host:port` for TCP, path for Unix socket"""
+        if not self._server:
+            return []
+        names = [socket.getsockname() for socket in self._server.sockets]
+        return [name if isinstance(name, str) else f"{name[0]}:{name[1]}" for name in names]
+
+    async def serve_forever(self) -> None:
+        if not self._server:
+            raise ServiceException(f"{self}: Not started")
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server:
+            self._server.close()
+            handlers = list(self._handlers)
+            for handler in handlers:
+                handler.cancel()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        self._logger.info("%s: Closed", self)
+
+    async def solve(self, request: str) -> str:
+        """Response line for one request line"""
+        if not self._executor:
+            raise ServiceException(f"{self}: Not started")
+        engine_name, _, quiz = request.strip().rpartition(" ")
+        try:
+            engine = Engine(engine_name) if engine_name else self._engine
+        except ValueError:
+            return INVALID
+        if self._pending >= self._queue_limit:
+            self._logger.warning("%s: Queue limit %d reached", self, self._queue_limit)
+            return BUSY
+        with self._pending_lock:
+            self._pending += 1
+        try:
+            future = self._executor.submit(solve_request, engine, quiz, time.time() + self._timeout)
+        except BaseException:
+            self._release(None)
+            raise
+        # Timeout does not stop the worker: the request is pending until the worker is done with it
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self._timeout)
+        except TimeoutError:
+            return TIMEOUT
+
+    def _release(self, _: Future[str] | None) -> None:
+        with self._pending_lock:
+            self._pending -= 1
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # Reading stops when too many responses are waiting: backpressure for a client that does not read them
+        responses: asyncio.Queue[asyncio.Task[str] | None] = asyncio.Queue(self._connection_limit)
+        sender = asyncio.create_task(self._send(responses, writer))
+        handler = asyncio.current_task()
+        if handler:
+            self._handlers.add(handler)
+            # Failed sender stops reading, otherwise reading may wait for a free place in the queue forever
+            sender.add_done_callback(lambda task: task.cancelled() or not task.exception() or handler.cancel())
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    await responses.put(asyncio.create_task(self.solve(line.decode())))
+            await responses.put(None)
+            await sender
+        except ConnectionError:
+            self._logger.info("%s: Client disconnected", self)
+        except asyncio.CancelledError:
+            self._logger.info("%s: Connection handling cancelled", self)
+            raise
+        finally:
+            sender.cancel()
+            while not responses.empty():
+                task = responses.get_nowait()
+                if task:
+                    task.cancel()
+            writer.close()
+            if handler:
+                self._handlers.discard(handler)
+
+    async def _send(self, responses: asyncio.Queue[asyncio.Task[str] | None], writer: asyncio.StreamWriter) -> None:
+        while task := await responses.get():
+            writer.write(f"{await task}\n".encode())
+            await writer.drain()
@@ -0,0 +1,40 @@
+"""Worker process side of the service: functions run in the process pool"""
+
+import time
+
+from batch import INVALID, UNSOLVED, BatchException, Engine, check_givens, solve_quiz
+from solver import Solver, SolverException, StrategyScheduler
+from sudoku import Grid, SudokuException
+
+SOLVED = "solved"
+TIMEOUT = "timeout"
+
+# Warm-up puzzle: every engine runs once in a new worker, so the first request does not pay for lazy initialization
+_WARM_UP_QUIZ = "004300209005009001070060043006002087190007400050083000600000105003508690042910300"
+
+_scheduler: StrategyScheduler | None = None  # learns the strategies order across the requests of the worker
+
+
+def init_worker() -> None:
+    global _scheduler
+    _scheduler = StrategyScheduler()
+    for engine in Engine:
+        solve_request(engine, _WARM_UP_QUIZ, time.time() + 60)
+
+
+def solve_request(engine: Engine, quiz: str, deadline: float) -> str:
+    """Response line: `solved <solution>`, `unsolved [<logically solved part>]`, `invalid` or `timeout`"""
+    if time.time() > deadline:
+        return TIMEOUT  # expired while waiting in the queue
+    try:
+        check_givens(quiz)  # the same verdict as the stream solver for contradictory givens
+        if engine == Engine.LOGICAL:
+            grid = Grid(quiz, observable=False)
+            grid.init_candidates()
+            Solver(grid, scheduler=_scheduler).solve()
+            solved = grid.is_solved  # solve() reports no progress for an already complete grid
+            return f"{SOLVED if solved else UNSOLVED} {''.join(str(cell.value) for cell in grid.cells)}"
+        solution = solve_quiz(engine, quiz)
+    except (BatchException, SolverException, SudokuException):
+        return INVALID
+    return f"{SOLVED} {solution}" if solution else UNSOLVED
@@ -1,5 +1,33 @@
-__all__ = ["BruteForcer", "Solver", "SolverException"]
+__all__ = [
+    "BatchSolver",
+    "BitboardSolver",
+    "BranchingHeuristic",
+    "BruteForcer",
+    "ClueSymmetry",
+    "DifficultyRater",
+    "ExactCoverSolver",
+    "GeneratedPuzzle",
+    "Level",
+    "PuzzleGenerator",
+    "Rating",
+    "SearchBackend",
+    "Solver",
+    "SolverException",
+    "SolutionCache",
+    "SolverStats",
+    "StrategyScheduler",
+    "StrategyStats",
+]
 
-from .brute_forcer import BruteForcer
+from .batch_solver import BatchSolver
+from .bitboard_solver import BitboardSolver
+from .brute_forcer import BranchingHeuristic, BruteForcer
+from .exact_cover_solver import ExactCoverSolver
 from .exceptions import SolverException
+from .generator import ClueSymmetry, GeneratedPuzzle, PuzzleGenerator
+from .rating import DifficultyRater, Level, Rating
+from .scheduler import StrategyScheduler
+from .search_backend import SearchBackend
+from .solution_cache import SolutionCache
 from .solver import Solver
+from .stats import SolverStats, StrategyStats
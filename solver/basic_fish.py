@@ -2,7 +2,7 @@ import logging
 from itertools import combinations
 from typing import Iterable
 
-from sudoku import Cell, Container, Grid
+from sudoku import CANDIDATE_BITS, MASK_POSITIONS, Cell, Container, Grid
 
 from .exceptions import SolverException
 from .multi_containers_strategy import MultiContainersStrategy
@@ -46,10 +46,10 @@ class BasicFish(MultiContainersStrategy):
             if not affected_conts:
                 continue
             affected_cells = [
-                cell
+                cont.cells[pos]
                 for cont in affected_conts
-                for cell in cont.filter_cells(has_candidate=candidate)
-                if cell not in cells
+                for pos in MASK_POSITIONS[self._grid.get_candidate_positions(cont, candidate)]
+                if cont.cells[pos] not in cells
             ]
             if not affected_cells:
                 continue
@@ -69,7 +69,7 @@ class BasicFish(MultiContainersStrategy):
                         f"{self}: {cont}: {[(cell, cell.candidates) for cell in cont.filter_cells(solved=False)]}"
                     )
             for cell in affected_cells:
-                cell.candidates -= {candidate}
+                cell.candidates_mask &= ~CANDIDATE_BITS[candidate]
             return True
         return False
 
@@ -7,9 +7,13 @@ from .strategy import Strategy
 
 
 class BasicStrategy(Strategy):
+    """Containers that gave no result are skipped until they (or containers they depend on) are changed"""
+
     def __init__(self, grid: Grid):
         super().__init__(grid)
         self._SUBSET_NAME = {2: "pair", 3: "triple", 4: "quadruple"}
+        self._dependencies: dict[int, tuple[Container, ...]] = {}
+        self._idle_versions: dict[int, int] = {}
 
     @abstractmethod
     def _get_base_containers(self) -> Iterable[Container]:
@@ -20,4 +24,22 @@ class BasicStrategy(Strategy):
         pass
 
     def solve(self) -> bool:
-        return any(self._solve_container(cont) for cont in self._get_base_containers())
+        for cont in self._get_base_containers():
+            version = self._get_version(cont)
+            if self._idle_versions.get(cont.house_idx) == version:
+                continue
+            if self._solve_container(cont):
+                return True
+            self._idle_versions[cont.house_idx] = version
+        return False
+
+    def _get_dependent_containers(self, container: Container) -> Iterable[Container]:
+        """Containers whose cells are read by `_solve_container`"""
+        return (container,)
+
+    def _get_version(self, container: Container) -> int:
+        dependencies = self._dependencies.get(container.house_idx)
+        if dependencies is None:
+            dependencies = tuple(self._get_dependent_containers(container))
+            self._dependencies[container.house_idx] = dependencies
+        return sum(self._grid.get_version(cont) for cont in dependencies)
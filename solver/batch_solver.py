@@ -0,0 +1,128 @@
+from logging import getLogger
+from typing import Callable, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from sudoku import (
+    ALL_CANDIDATES_MASK,
+    CANDIDATE_BITS,
+    CELL_HOUSES,
+    HOUSE_CELLS,
+    MASK_DIGITS,
+    MASK_SIZES,
+)
+
+from .bitboard_solver import BitboardSolver
+from .exceptions import SolverException
+from .search_backend import SearchBackend
+
+Values = NDArray[np.uint8]
+Masks = NDArray[np.uint16]
+Flags = NDArray[np.bool[bool]]
+
+_HOUSE_CELLS = np.array(HOUSE_CELLS, dtype=np.intp)
+_CELL_HOUSES = np.array(CELL_HOUSES, dtype=np.intp)
+_VALUE_BITS = np.array(CANDIDATE_BITS, dtype=np.uint16)
+_MASK_SIZES = np.array(MASK_SIZES, dtype=np.uint8)
+_MASK_FIRST_DIGIT = np.array([digits[0] if digits else 0 for digits in MASK_DIGITS], dtype=np.uint8)
+
+
+class BatchSolver:
+    """Solves many puzzles at once: values and candidates masks of the whole batch are (N, 81) arrays.
+    Naked singles, hidden singles and intersections (pointing and claiming) are applied to all puzzles
+    with array operations until nothing changes. Only the puzzles left unsolved are passed to the search backend
+    """
+
+    def __init__(self, backend: Callable[[str], SearchBackend] = BitboardSolver):
+        self._logger = getLogger(__name__)
+        self._backend = backend
+
+    def __str__(self) -> str:
+        return "Batch solver"
+
+    def solve(self, quizzes: Sequence[str]) -> list[str | None]:
+        """Solution for each quiz, None for puzzles without solutions"""
+        values = self._parse(quizzes)
+        cands = np.full(values.shape, ALL_CANDIDATES_MASK, dtype=np.uint16)
+        failed = np.zeros(len(values), dtype=np.bool_)
+        active = np.arange(len(values))
+        steps = 0
+        while active.size:
+            steps += 1
+            active_values, active_cands = values[active], cands[active]
+            consistent, changed = self._step(active_values, active_cands)
+            values[active], cands[active] = active_values, active_cands
+            failed[active[~consistent]] = True
+            active = active[consistent & changed]
+        solved = (values != 0).all(axis=1) & ~failed
+        self._logger.info(
+            "%s: %d puzzles, %d steps. Solved: %d, without solution: %d, passed to search: %d",
+            self,
+            len(values),
+            steps,
+            solved.sum(),
+            failed.sum(),
+            len(values) - solved.sum() - failed.sum(),
+        )
+        text = (values + ord("0")).astype(np.uint8).tobytes().decode()
+        lines = [text[idx : idx + 81] for idx in range(0, len(text), 81)]
+        return [
+            None if is_failed else line if is_solved else self._backend(line).create_solution()
+            for line, is_solved, is_failed in zip(lines, solved.tolist(), failed.tolist())
+        ]
+
+    def _parse(self, quizzes: Sequence[str]) -> Values:
+        data = "".join(quizzes).replace(".", "0").encode()
+        if any(len(quiz) != 81 for quiz in quizzes) or (data and not data.isdigit()):
+            raise SolverException(f"{self}: Unexpected quizzes format")
+        return (np.frombuffer(data, dtype=np.uint8) - ord("0")).reshape(len(quizzes), 81)
+
+    def _step(self, values: Values, cands: Masks) -> tuple[Flags, Flags]:
+        """One round of eliminations and placements in place. Returns consistency and change flags per puzzle"""
+        house_bits = _VALUE_BITS[values][:, _HOUSE_CELLS]
+        used = np.bitwise_or.reduce(house_bits, axis=2)
+        consistent = (_MASK_SIZES[used] == np.count_nonzero(house_bits, axis=2)).all(axis=1)  # no duplicates
+        cells_used = used[:, _CELL_HOUSES[:, 0]] | used[:, _CELL_HOUSES[:, 1]] | used[:, _CELL_HOUSES[:, 2]]
+        new_cands = np.where(values == 0, cands & ~cells_used, 0).astype(np.uint16)
+        new_cands &= ~self._get_intersection_eliminations(new_cands)
+        consistent &= ~((values == 0) & (new_cands == 0)).any(axis=1)
+
+        new_values = np.where((values == 0) & (_MASK_SIZES[new_cands] == 1), _MASK_FIRST_DIGIT[new_cands], values)
+        houses_cands = new_cands[:, _HOUSE_CELLS]
+        once = np.zeros_like(used)  # candidates seen at least once / at least twice in the house
+        twice = np.zeros_like(used)
+        for position in range(9):
+            twice |= once & houses_cands[:, :, position]
+            once |= houses_cands[:, :, position]
+        consistent &= ((once | used) == ALL_CANDIDATES_MASK).all(axis=1)  # every digit has a place in every house
+        hidden = houses_cands & (once & ~twice)[..., None]
+        puzzles, houses, positions = np.nonzero(hidden)
+        new_values[puzzles, _HOUSE_CELLS[houses, positions]] = _MASK_FIRST_DIGIT[hidden[puzzles, houses, positions]]
+
+        changed = (new_values != values).any(axis=1) | (new_cands != cands).any(axis=1)
+        values[:], cands[:] = new_values, new_cands
+        return consistent, changed
+
+    @classmethod
+    def _get_intersection_eliminations(cls, cands: Masks) -> Masks:
+        """Pointing and claiming eliminations for rows and columns"""
+        rows = cands.reshape(-1, 3, 3, 3, 3)  # band, row in band, stack, column in stack
+        columns = cands.reshape(-1, 9, 9).transpose(0, 2, 1).reshape(-1, 3, 3, 3, 3)
+        rows_elims = cls._get_segment_eliminations(rows).reshape(-1, 81)
+        columns_elims = cls._get_segment_eliminations(columns).reshape(-1, 9, 9).transpose(0, 2, 1).reshape(-1, 81)
+        return rows_elims | columns_elims
+
+    @staticmethod
+    def _get_segment_eliminations(lines: Masks) -> Masks:
+        """Lines are grouped by boxes: (puzzle, lines group, line in group, box in line, cell in segment).
+        Segment is an intersection of a line and a box
+        """
+        segments = np.bitwise_or.reduce(lines, axis=4)
+        box_others = np.roll(segments, 1, axis=2) | np.roll(segments, 2, axis=2)
+        line_others = np.roll(segments, 1, axis=3) | np.roll(segments, 2, axis=3)
+        pointing = segments & ~box_others  # box digits confined to the segment: removed from the rest of the line
+        claiming = segments & ~line_others  # line digits confined to the segment: removed from the rest of the box
+        elims = np.roll(pointing, 1, axis=3) | np.roll(pointing, 2, axis=3)
+        elims |= np.roll(claiming, 1, axis=2) | np.roll(claiming, 2, axis=2)
+        return np.broadcast_to(elims[..., None], lines.shape)
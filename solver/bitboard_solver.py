@@ -0,0 +1,104 @@
+from typing import Generator
+
+from sudoku import (
+    ALL_CANDIDATES_MASK,
+    CANDIDATE_BITS,
+    CELL_HOUSES,
+    HOUSE_CELLS,
+    MASK_DIGITS,
+    MASK_SIZES,
+)
+
+from .search_backend import SearchBackend
+
+
+class BitboardSolver(SearchBackend):
+    """Constraint propagation over bit masks: the whole state is 81 values and 27 houses used digits masks.
+    Cell candidates are the digits not used in its 3 houses. Naked and hidden singles are placed until
+    nothing changes, then the cell with the fewest candidates is guessed on a copy of the state
+    """
+
+    def __str__(self) -> str:
+        return "Bitboard solver"
+
+    def iter_solutions(self) -> Generator[str, None, None]:
+        for values in self._iter_raw_solutions():
+            yield "".join(map(str, values))
+
+    def _iter_raw_solutions(self) -> Generator[list[int], None, None]:
+        values = self._values[:]
+        used = [0] * 27
+        for idx, value in enumerate(values):
+            if not value:
+                continue
+            bit = CANDIDATE_BITS[value]
+            houses = CELL_HOUSES[idx]
+            if any(used[house] & bit for house in houses):
+                self._logger.warning("%s: Quiz is inconsistent", self)
+                return
+            for house in houses:
+                used[house] |= bit
+        yield from self._search(values, used)
+
+    def _search(self, values: list[int], used: list[int]) -> Generator[list[int], None, None]:
+        idx = self._propagate(values, used)
+        if idx is None:
+            return
+        if idx < 0:
+            yield values
+            return
+        row, column, box = CELL_HOUSES[idx]
+        for value in MASK_DIGITS[ALL_CANDIDATES_MASK & ~(used[row] | used[column] | used[box])]:
+            branch_values, branch_used = values[:], used[:]
+            self._place(branch_values, branch_used, idx, value)
+            yield from self._search(branch_values, branch_used)
+
+    @staticmethod
+    def _place(values: list[int], used: list[int], idx: int, value: int) -> None:
+        values[idx] = value
+        bit = CANDIDATE_BITS[value]
+        for house in CELL_HOUSES[idx]:
+            used[house] |= bit
+
+    def _propagate(self, values: list[int], used: list[int]) -> int | None:
+        """Places singles. Returns None on contradiction, -1 if solved, otherwise the cell with the fewest candidates"""
+        while True:
+            placed = False
+            best_idx, best_size = -1, 10
+            for idx, houses in enumerate(CELL_HOUSES):
+                if values[idx]:
+                    continue
+                row, column, box = houses
+                cands = ALL_CANDIDATES_MASK & ~(used[row] | used[column] | used[box])
+                size = MASK_SIZES[cands]
+                if not size:
+                    return None
+                if size == 1:
+                    self._place(values, used, idx, MASK_DIGITS[cands][0])
+                    placed = True
+                elif size < best_size:
+                    best_idx, best_size = idx, size
+            if placed:
+                continue
+            for house, cells in enumerate(HOUSE_CELLS):
+                once = twice = 0  # candidates seen at least once / at least twice in the house
+                for idx in cells:
+                    if not values[idx]:
+                        row, column, box = CELL_HOUSES[idx]
+                        cands = ALL_CANDIDATES_MASK & ~(used[row] | used[column] | used[box])
+                        twice |= once & cands
+                        once |= cands
+                if once | used[house] != ALL_CANDIDATES_MASK:
+                    return None  # some digit has no place in the house
+                for value in MASK_DIGITS[once & ~twice]:
+                    bit = CANDIDATE_BITS[value]
+                    for idx in cells:
+                        row, column, box = CELL_HOUSES[idx]
+                        if not values[idx] and not (used[row] | used[column] | used[box]) & bit:
+                            self._place(values, used, idx, value)
+                            placed = True
+                            break
+                    else:
+                        return None  # the only place is taken by another hidden single
+            if not placed:
+                return best_idx
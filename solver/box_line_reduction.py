@@ -16,6 +16,9 @@ class BoxLineReduction(IntersectionStrategy):
             if len(tuple(cont.filter_cells(solved=False))) > 1:
                 yield cont
 
+    def _get_dependent_containers(self, container: Container) -> Iterable[Container]:
+        return {container} | {self._grid.get_box(cell) for cell in container.cells}
+
     def _get_affected_container(self, cells: tuple[Cell, ...]) -> Container | None:
         boxes = {self._grid.get_box(cell) for cell in cells}
         return boxes.pop() if len(boxes) == 1 else None
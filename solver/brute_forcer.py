@@ -1,85 +1,100 @@
-from logging import getLogger
+from enum import Enum
+from typing import Generator
 
-from sudoku import Cell, Grid
+from sudoku import CANDIDATE_BITS, MASK_DIGITS, MASK_SIZES, Cell, Grid
 
-from .hidden_single import HiddenSingle
-from .naked_single import NakedSingle
+from .search_backend import SearchBackend
+from .singles_propagator import SinglesPropagator
+from .solution_cache import SolutionCache
 
+RestorePoint = tuple[Cell, int, int]  # cell, remaining candidates mask, trail size
 
-class BruteForcer:
-    def __init__(self, grid: Grid):
-        self._logger = getLogger(__name__)
-        self._grid = Grid([cell.value if cell.is_given else 0 for cell in grid.cells])
+
+class BranchingHeuristic(Enum):
+    FIRST = "first"  # first not solved cell in row-major order
+    MRV = "mrv"  # minimum remaining values: fewest candidates, ties broken by max not solved peers count
+
+
+class BruteForcer(SearchBackend):
+    """Backtracking search over the grid model with singles propagation. Grid changes are recorded in the grid trail:
+    restore point keeps only the trail size, backtracking rolls back the cells changed after it
+    """
+
+    def __init__(
+        self,
+        grid: Grid,
+        *,
+        branching: BranchingHeuristic = BranchingHeuristic.MRV,
+        cache: SolutionCache | None = None,
+    ):
+        super().__init__(grid, cache=cache)
+        self._branching = branching
+        self._grid = Grid(self._values, observable=False)
         self._grid.init_candidates()
-        self._force_restore = False
-        self._restore_points: list[tuple[frozenset[int], tuple[tuple[Cell, tuple[int, frozenset[int]]], ...]]] = []
-        self._solvers = (NakedSingle(self._grid), HiddenSingle(self._grid))
 
     def __str__(self) -> str:
         return "Brute forcer"
 
-    def create_solution(self) -> str | None:
-        self._logger.info("%s: Creating solution for %s", self, self._grid)
+    def iter_solutions(self) -> Generator[str, None, None]:
+        for grid in self._search():
+            yield "".join(str(cell.value) for cell in grid.cells)
+
+    def _iter_raw_solutions(self) -> Generator[Grid, None, None]:
+        return self._search()
+
+    def _search(self) -> Generator[Grid, None, None]:
+        """Yields the searched grid every time it is solved, the next solution is searched on resume"""
         if not self._grid.is_consistent:
             self._logger.warning("%s: %s is inconsistent", self, self._grid)
-            return None
-        force_restore = self._force_restore
-        self._force_restore = True
-        if not self._solve(force_restore):
-            self._logger.warning("%s: Solution not found for %s", self, self._grid)
-            return None
-        self._logger.info("%s: Solution found for %s", self, self._grid)
-        return "".join(str(cell.value) for cell in self._grid.cells)
-
-    def reset(self) -> None:
-        if not self._force_restore:
-            self._logger.info("%s: Nothing to reset", self)
             return
-        self._logger.info("%s: Resetting", self)
-        self._grid.reset()
-        self._grid.init_candidates()
-        self._force_restore = False
-        self._restore_points.clear()
-
-    def _solve(self, force_restore: bool) -> bool:
-        if force_restore:
-            cands = self._restore()
-            if not cands:
-                return False
-            self._make_prediction(candidates=cands)
+        grid = self._grid.clone()
+        grid.enable_trail()
+        propagator = SinglesPropagator(grid)
+        restore_points: list[RestorePoint] = []
         step = 0
-        while not self._grid.is_solved:
+        while True:
             step += 1
-            self._logger.debug("%s: Step=%d. Restore points: %d", self, step, len(self._restore_points))
-            if any(self._grid.filter_cells(solved=False, candidates=frozenset())):
-                cands = self._restore()
-                if not cands:
-                    return False
-                self._make_prediction(candidates=cands)
-            elif not any(solver.solve() for solver in self._solvers):
-                self._make_prediction()
-        self._logger.info("%s: Total steps %d. Restore points: %d", self, step, len(self._restore_points))
-        return bool(step)
+            self._logger.debug("%s: Step=%d. Restore points: %d", self, step, len(restore_points))
+            if any(grid.filter_cells(solved=False, candidates=frozenset())):
+                if not self._backtrack(grid, restore_points):
+                    return
+            elif grid.is_solved:
+                self._logger.info("%s: Total steps %d. Restore points: %d", self, step, len(restore_points))
+                yield grid
+                if not self._backtrack(grid, restore_points):
+                    return
+            elif not propagator.solve():
+                cell = self._select_cell(grid)
+                self._make_prediction(grid, restore_points, cell, cell.candidates_mask)
 
-    def _make_prediction(self, *, candidates: frozenset[int] | None = None) -> None:
-        cell = next(self._grid.filter_cells(solved=False))
-        cands = candidates or cell.candidates
-        value = next(iter(cands))
-        cands -= {value}
+    def _make_prediction(self, grid: Grid, restore_points: list[RestorePoint], cell: Cell, cands: int) -> None:
+        value = MASK_DIGITS[cands][0]
+        cands &= ~CANDIDATE_BITS[value]
         if cands:
-            state = tuple((cell, cell.get_state()) for cell in self._grid.filter_cells(solved=False))
-            self._restore_points.append((cands, state))
-            self._logger.debug("%s: Restore point [%d]: %s %s", self, len(self._restore_points), cell, cands)
-        self._logger.debug("%s: %s %s = %d. Remaining: %s", self, cell, cell.candidates, value, cands)
-        self._grid.set_value(cell, value)
+            restore_points.append((cell, cands, grid.trail_size))
+            self._logger.debug("%s: Restore point [%d]: %s %#x", self, len(restore_points), cell, cands)
+        self._logger.debug("%s: %s %s = %d. Remaining: %#x", self, cell, cell.candidates, value, cands)
+        grid.set_value(cell, value)
+
+    def _select_cell(self, grid: Grid) -> Cell:
+        match self._branching:
+            case BranchingHeuristic.FIRST:
+                return next(grid.filter_cells(solved=False))
+            case BranchingHeuristic.MRV:
+                cells = tuple(grid.filter_cells(solved=False))
+                min_size = min(MASK_SIZES[cell.candidates_mask] for cell in cells)
+                return max(
+                    (cell for cell in cells if MASK_SIZES[cell.candidates_mask] == min_size),
+                    key=lambda cell: sum(not peer.is_solved for peer in grid.get_peers(cell)),
+                )
 
-    def _restore(self) -> frozenset[int] | None:
-        """Returns restored version candidates"""
-        if not self._restore_points:
+    def _backtrack(self, grid: Grid, restore_points: list[RestorePoint]) -> bool:
+        """Rolls back to the last restore point and tries its next candidate. Returns False if there are none"""
+        if not restore_points:
             self._logger.debug("%s: No restore points found", self)
-            return None
-        self._logger.debug("%s: Restoring [%d]", self, len(self._restore_points))
-        cands, state = self._restore_points.pop()
-        for cell, version in state:
-            cell.restore(version)
-        return cands
+            return False
+        self._logger.debug("%s: Restoring [%d]", self, len(restore_points))
+        cell, cands, trail_size = restore_points.pop()
+        grid.rollback_trail(trail_size)
+        self._make_prediction(grid, restore_points, cell, cands)
+        return True
@@ -0,0 +1,88 @@
+from typing import Generator
+
+from sudoku import CELL_BOX, CELL_COLUMN, CELL_ROW
+
+from .search_backend import SearchBackend
+
+Columns = dict[int, set[int]]  # constraint -> rows (placements) satisfying it
+
+# Placement (row of the exact cover matrix) is `cell index * 9 + digit - 1`, it satisfies 4 of 324 constraints:
+# cell has a value, row has a digit, column has a digit, box has a digit
+PLACEMENT_CONSTRAINTS: tuple[tuple[int, int, int, int], ...] = tuple(
+    (idx, 81 + CELL_ROW[idx] * 9 + digit, 162 + CELL_COLUMN[idx] * 9 + digit, 243 + CELL_BOX[idx] * 9 + digit)
+    for idx in range(81)
+    for digit in range(9)
+)
+CONSTRAINT_PLACEMENTS: tuple[frozenset[int], ...] = tuple(
+    frozenset(placement for placement in range(729) if constraint in PLACEMENT_CONSTRAINTS[placement])
+    for constraint in range(324)
+)
+
+
+class ExactCoverSolver(SearchBackend):
+    """Algorithm X over the 324 sudoku constraints. Works on puzzle strings, the grid model is not used.
+    Dancing links are replaced with constraint -> placements sets: covering a constraint removes the conflicting
+    placements from the other constraints sets, uncovering puts them back in reverse order.
+    The constraint with the fewest placements is covered first
+    """
+
+    def __str__(self) -> str:
+        return "Exact cover solver"
+
+    def iter_solutions(self) -> Generator[str, None, None]:
+        solution = self._values[:]
+        for placements in self._iter_raw_solutions():
+            for placement in placements:
+                solution[placement // 9] = placement % 9 + 1
+            yield "".join(map(str, solution))
+
+    def _iter_raw_solutions(self) -> Generator[list[int], None, None]:
+        """Placements of the empty cells, the list is reused by the search"""
+        columns: Columns = {constraint: set(placements) for constraint, placements in enumerate(CONSTRAINT_PLACEMENTS)}
+        for idx, value in enumerate(self._values):
+            if not value:
+                continue
+            placement = idx * 9 + value - 1
+            if any(constraint not in columns for constraint in PLACEMENT_CONSTRAINTS[placement]):
+                self._logger.warning("%s: Quiz is inconsistent", self)
+                return
+            self._cover(columns, placement)
+        yield from self._search(columns, [])
+
+    def _search(self, columns: Columns, placements: list[int]) -> Generator[list[int], None, None]:
+        """Yields chosen placements every time all constraints are covered"""
+        if not columns:
+            yield placements
+            return
+        constraint, size = -1, 10
+        for key, options in columns.items():
+            if len(options) < size:
+                constraint, size = key, len(options)
+                if size < 2:
+                    break  # dead end or forced placement: no need to look further
+        for placement in list(columns[constraint]):
+            placements.append(placement)
+            covered = self._cover(columns, placement)
+            yield from self._search(columns, placements)
+            self._uncover(columns, placement, covered)
+            placements.pop()
+
+    @staticmethod
+    def _cover(columns: Columns, placement: int) -> list[set[int]]:
+        covered: list[set[int]] = []
+        for constraint in PLACEMENT_CONSTRAINTS[placement]:
+            for conflicting in columns[constraint]:
+                for other in PLACEMENT_CONSTRAINTS[conflicting]:
+                    if other != constraint:
+                        columns[other].remove(conflicting)
+            covered.append(columns.pop(constraint))
+        return covered
+
+    @staticmethod
+    def _uncover(columns: Columns, placement: int, covered: list[set[int]]) -> None:
+        for constraint in reversed(PLACEMENT_CONSTRAINTS[placement]):
+            columns[constraint] = covered.pop()
+            for conflicting in columns[constraint]:
+                for other in PLACEMENT_CONSTRAINTS[conflicting]:
+                    if other != constraint:
+                        columns[other].add(conflicting)
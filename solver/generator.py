@@ -0,0 +1,152 @@
+import random
+from dataclasses import dataclass
+from enum import Enum
+from logging import INFO, getLogger
+from typing import Collection
+
+from sudoku import (
+    ALL_CANDIDATES_MASK,
+    CANDIDATE_BITS,
+    CELL_HOUSES,
+    LINE_PERMUTATIONS,
+    MASK_DIGITS,
+    Symmetry,
+)
+
+from .bitboard_solver import BitboardSolver
+from .exceptions import SolverException
+from .rating import DifficultyRater, Level, Rating
+
+
+class ClueSymmetry(Enum):
+    NONE = "none"
+    ROTATIONAL = "rotational"  # 180 degrees rotation
+    MIRROR = "mirror"  # left-right reflection
+    DIAGONAL = "diagonal"  # main diagonal reflection
+
+    @property
+    def orbits(self) -> tuple[tuple[int, ...], ...]:
+        """Cells groups removed together: each cell belongs to exactly one group"""
+        result: dict[int, tuple[int, ...]] = {}
+        for idx in range(81):
+            image = self._get_image(idx)
+            result.setdefault(min(idx, image), tuple(sorted({idx, image})))
+        return tuple(result.values())
+
+    def _get_image(self, idx: int) -> int:
+        row, column = divmod(idx, 9)
+        match self:
+            case ClueSymmetry.ROTATIONAL:
+                return (8 - row) * 9 + 8 - column
+            case ClueSymmetry.MIRROR:
+                return row * 9 + 8 - column
+            case ClueSymmetry.DIAGONAL:
+                return column * 9 + row
+        return idx
+
+
+@dataclass(frozen=True)
+class GeneratedPuzzle:
+    quiz: str
+    solution: str
+    rating: Rating | None  # None if no difficulty band is requested
+
+
+class PuzzleGenerator:
+    """Generates minimal (under the clue symmetry) unique puzzles: clues of a random full solution are removed
+    in random order while the puzzle stays unique. Uniqueness is checked incrementally: the solution is known,
+    so removal is rejected as soon as one solution differing in the removed cells is found
+    (a clue that can not be removed stays: fewer clues never make the puzzle unique again).
+    Optional difficulty band is reached by generating until the logical rating level is in it
+    """
+
+    def __init__(
+        self,
+        *,
+        symmetry: ClueSymmetry = ClueSymmetry.NONE,
+        levels: Collection[Level] | None = None,
+        max_attempts: int = 1000,
+        seed: int | None = None,
+    ):
+        self._logger = getLogger(__name__)
+        if max_attempts < 1 or (levels is not None and not levels):
+            raise SolverException(f"{self}: Unexpected max attempts {max_attempts} or levels {levels}")
+        self._orbits = symmetry.orbits
+        self._levels = frozenset(levels) if levels is not None else None
+        self._max_attempts = max_attempts
+        self._random = random.Random(seed)
+        self._rater = DifficultyRater(failure_level=INFO)  # puzzles not solved logically are just rejected
+
+    def __str__(self) -> str:
+        return "PuzzleGenerator"
+
+    def generate(self) -> GeneratedPuzzle:
+        if self._levels is None:
+            solution = self.create_solution()
+            return GeneratedPuzzle(self._remove_clues(solution), solution, None)
+        for attempt in range(1, self._max_attempts + 1):
+            solution = self.create_solution()
+            quiz = self._remove_clues(solution)
+            rating = self._rater.rate(quiz)
+            if rating.level in self._levels:
+                self._logger.info("%s: Attempt %d: %s rated %d", self, attempt, quiz, rating.score)
+                return GeneratedPuzzle(quiz, solution, rating)
+        levels = ", ".join(level.value for level in self._levels)
+        raise SolverException(f"{self}: No {levels} puzzle generated in {self._max_attempts} attempts")
+
+    def create_solution(self) -> str:
+        """Random full grid: the diagonal boxes are independent, they are filled randomly and the rest is searched.
+        Search order is deterministic, random lines permutations, transposition and relabeling make up for it
+        """
+        values = [0] * 81
+        for box in range(3):
+            for idx, value in enumerate(self._random.sample(range(1, 10), 9)):
+                values[(box * 3 + idx // 3) * 9 + box * 3 + idx % 3] = value
+        solution = BitboardSolver("".join(map(str, values))).create_solution()
+        if not solution:
+            raise SolverException(f"{self}: Diagonal boxes {values} have no solution")
+        digits = (0,) + tuple(self._random.sample(range(1, 10), 9))
+        rows, columns = self._random.choice(LINE_PERMUTATIONS), self._random.choice(LINE_PERMUTATIONS)
+        return Symmetry(self._random.random() < 0.5, rows, columns, digits).apply(solution)
+
+    def _remove_clues(self, solution: str) -> str:
+        values = [int(char) for char in solution]
+        orbits = list(self._orbits)
+        self._random.shuffle(orbits)
+        for orbit in orbits:
+            for idx in orbit:
+                values[idx] = 0
+            if self._has_other_solution(values, solution, orbit):
+                for idx in orbit:
+                    values[idx] = int(solution[idx])
+        return "".join(map(str, values))
+
+    @staticmethod
+    def _has_other_solution(values: list[int], solution: str, cells: tuple[int, ...]) -> bool:
+        return _UniquenessChecker("".join(map(str, values))).has_other_solution(solution, cells)
+
+
+class _UniquenessChecker(BitboardSolver):
+    """Searches only for the solutions with another value in one of the emptied cells: the givens state is built once,
+    the first cell gets each of its other candidates, the next cells do the same with the previous ones fixed
+    """
+
+    def has_other_solution(self, solution: str, cells: tuple[int, ...]) -> bool:
+        values = self._values[:]
+        used = [0] * 27
+        for idx, value in enumerate(values):
+            if value:
+                for house in CELL_HOUSES[idx]:
+                    used[house] |= CANDIDATE_BITS[value]
+        for idx in cells:
+            expected = int(solution[idx])
+            row, column, box = CELL_HOUSES[idx]
+            for value in MASK_DIGITS[ALL_CANDIDATES_MASK & ~(used[row] | used[column] | used[box])]:
+                if value == expected:
+                    continue
+                branch_values, branch_used = values[:], used[:]
+                self._place(branch_values, branch_used, idx, value)
+                if next(self._search(branch_values, branch_used), None) is not None:
+                    return True
+            self._place(values, used, idx, expected)
+        return False
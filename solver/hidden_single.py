@@ -1,6 +1,6 @@
 from typing import Iterable
 
-from sudoku import Cell, Container
+from sudoku import MASK_POSITIONS, MASK_SIZES, Container
 
 from .basic_strategy import BasicStrategy
 
@@ -12,18 +12,14 @@ class HiddenSingle(BasicStrategy):
         return "Hidden single"
 
     def _get_base_containers(self) -> Iterable[Container]:
-        return self._grid.rows + self._grid.columns + self._grid.boxes
+        return self._grid.containers
 
     def _solve_container(self, container: Container) -> bool:
         for cand in range(1, 10):
-            cell: Cell | None = None
-            for cont_cell in container.filter_cells(has_candidate=cand):
-                if cell:
-                    cell = None
-                    break
-                cell = cont_cell
-            if not cell:
+            positions = self._grid.get_candidate_positions(container, cand)
+            if MASK_SIZES[positions] != 1:
                 continue
+            cell = container.cells[MASK_POSITIONS[positions][0]]
             self._logger.info("%s: %s = %d. Base: %s", self, cell, cand, container)
             self._grid.set_value(cell, cand)
             return True
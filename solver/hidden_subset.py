@@ -1,7 +1,7 @@
 from itertools import combinations
 from typing import Iterable
 
-from sudoku import Container, Grid
+from sudoku import Container, Grid, candidates_to_mask
 
 from .basic_strategy import BasicStrategy
 from .exceptions import SolverException
@@ -20,7 +20,7 @@ class HiddenSubset(BasicStrategy):
         return f"Hidden {self._SUBSET_NAME.get(self._subset_length, 'SUBSET')}"
 
     def _get_base_containers(self) -> Iterable[Container]:
-        for cont in self._grid.rows + self._grid.columns + self._grid.boxes:
+        for cont in self._grid.containers:
             if len(tuple(cont.filter_cells(solved=False))) > self._subset_length:
                 yield cont
 
@@ -32,12 +32,13 @@ class HiddenSubset(BasicStrategy):
             # Main rule: N candidates appers only in N cells
             if len(cells) != self._subset_length:
                 continue
+            cands_mask = candidates_to_mask(cands)
             # Subset cells with additional candidates
-            affected_cells = [cell for cell in cells if cell.candidates - set(cands)]
+            affected_cells = [cell for cell in cells if cell.candidates_mask & ~cands_mask]
             if not affected_cells:
                 continue
             self._logger.info("%s: %s. Base: %s %s. Affected: %s", self, cands, container, cells, affected_cells)
             for cell in affected_cells:
-                cell.candidates &= set(cands)
+                cell.candidates_mask &= cands_mask
             return True
         return False
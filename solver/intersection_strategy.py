@@ -1,6 +1,6 @@
 from abc import abstractmethod
 
-from sudoku import Cell, Container
+from sudoku import CANDIDATE_BITS, MASK_POSITIONS, Cell, Container
 
 from .basic_strategy import BasicStrategy
 
@@ -15,9 +15,8 @@ class IntersectionStrategy(BasicStrategy):
             affected_cont = self._get_affected_container(cells)
             if not affected_cont:
                 continue
-            affected_cells = set(affected_cont.filter_cells(has_candidate=cand)) - set(
-                container.filter_cells(solved=False)
-            )
+            positions = self._grid.get_candidate_positions(affected_cont, cand)
+            affected_cells = {affected_cont.cells[pos] for pos in MASK_POSITIONS[positions]} - set(cells)
             if not affected_cells:
                 continue
             self._logger.info(
@@ -31,6 +30,6 @@ class IntersectionStrategy(BasicStrategy):
                 affected_cells,
             )
             for cell in affected_cells:
-                cell.candidates -= {cand}
+                cell.candidates_mask &= ~CANDIDATE_BITS[cand]
             return True
         return False
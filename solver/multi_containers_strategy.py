@@ -1,18 +1,23 @@
 from abc import abstractmethod
 from typing import Iterable
 
-from sudoku import Cell, Container, Grid
+from sudoku import MASK_POSITIONS, MASK_SIZES, Cell, Container, Grid
 
 from .exceptions import SolverException
 from .strategy import Strategy
 
 
 class MultiContainersStrategy(Strategy):
+    """Single candidate strategy: result depends only on the candidate layout.
+    Candidates that gave no result are skipped until their layout is changed
+    """
+
     def __init__(self, grid: Grid, subset_length: int):
         super().__init__(grid)
         self._subset_length = subset_length
         if self._subset_length < 2:
             raise SolverException(f"{self}: unexpected subset length {self._subset_length}")
+        self._idle_versions: dict[int, int] = {}
 
     @abstractmethod
     def _get_containers_subsets(self) -> Iterable[tuple[str, Iterable[Container]]]:
@@ -23,19 +28,21 @@ class MultiContainersStrategy(Strategy):
         pass
 
     def solve(self) -> bool:
-        for conts_type, conts in self._get_containers_subsets():
-            cand_subsets_map = self._get_cand_subsets_map(conts)
-            for cand, subsets in cand_subsets_map.items():
-                if self._solve_cell_subsets(conts_type, cand, subsets):
+        for cand in range(1, 10):
+            version = self._grid.get_candidate_version(cand)
+            if self._idle_versions.get(cand) == version:
+                continue
+            for conts_type, conts in self._get_containers_subsets():
+                subsets = self._get_cand_subsets(conts, cand)
+                if subsets and self._solve_cell_subsets(conts_type, cand, subsets):
                     return True
+            self._idle_versions[cand] = version
         return False
 
-    def _get_cand_subsets_map(self, containers: Iterable[Container]) -> dict[int, list[set[Cell]]]:
-        result: dict[int, list[set[Cell]]] = {}
+    def _get_cand_subsets(self, containers: Iterable[Container], candidate: int) -> list[set[Cell]]:
+        result: list[set[Cell]] = []
         for cont in containers:
-            cand_cells_map = self._get_candidate_cells_map(cont, min_cells=2, max_cells=self._subset_length)
-            for cand, cells in cand_cells_map.items():
-                if cand not in result:
-                    result[cand] = []
-                result[cand].append(set(cells))
-        return {cand: subsets for cand, subsets in result.items() if len(subsets) >= self._subset_length}
+            positions = self._grid.get_candidate_positions(cont, candidate)
+            if 2 <= MASK_SIZES[positions] <= self._subset_length:
+                result.append({cont.cells[pos] for pos in MASK_POSITIONS[positions]})
+        return result if len(result) >= self._subset_length else []
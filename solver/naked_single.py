@@ -1,6 +1,6 @@
 from typing import Iterable
 
-from sudoku import Container
+from sudoku import MASK_DIGITS, MASK_SIZES, Container
 
 from .basic_strategy import BasicStrategy
 
@@ -16,9 +16,9 @@ class NakedSingle(BasicStrategy):
 
     def _solve_container(self, container: Container) -> bool:
         for cell in container.cells:
-            if len(cell.candidates) != 1:
+            if MASK_SIZES[cell.candidates_mask] != 1:
                 continue
-            value = next(iter(cell.candidates))
+            value = MASK_DIGITS[cell.candidates_mask][0]
             self._logger.info("%s: %s = %d", self, cell, value)
             self._grid.set_value(cell, value)
             return True
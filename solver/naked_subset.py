@@ -1,7 +1,7 @@
 from itertools import combinations
 from typing import Iterable
 
-from sudoku import Container, Grid
+from sudoku import Container, Grid, candidates_to_mask
 
 from .basic_strategy import BasicStrategy
 from .exceptions import SolverException
@@ -20,7 +20,7 @@ class NakedSubset(BasicStrategy):
         return f"Naked {self._SUBSET_NAME.get(self._subset_length, 'SUBSET')}"
 
     def _get_base_containers(self) -> Iterable[Container]:
-        for cont in self._grid.rows + self._grid.columns + self._grid.boxes:
+        for cont in self._grid.containers:
             if len(tuple(cont.filter_cells(solved=False))) > self._subset_length:
                 yield cont
 
@@ -29,8 +29,9 @@ class NakedSubset(BasicStrategy):
         for cands in combinations(cand_cells_map, self._subset_length):
             # Cells that have at least one combination candidate
             cells = {cell for cand in cands for cell in cand_cells_map[cand]}
+            cands_mask = candidates_to_mask(cands)
             # Cells that have only subset candidates
-            naked_subset_cells = [cell for cell in cells if not cell.candidates - set(cands)]
+            naked_subset_cells = [cell for cell in cells if not cell.candidates_mask & ~cands_mask]
             # Main rule: N cells share same N candidates
             if len(naked_subset_cells) != self._subset_length:
                 continue
@@ -42,6 +43,6 @@ class NakedSubset(BasicStrategy):
                 "%s: %s. Base: %s %s. Affected: %s", self, cands, container, naked_subset_cells, affected_cells
             )
             for cell in affected_cells:
-                cell.candidates -= set(cands)
+                cell.candidates_mask &= ~cands_mask
             return True
         return False
@@ -18,6 +18,9 @@ class PointingSubset(IntersectionStrategy):
             if len(tuple(cont.filter_cells(solved=False))) > 1:
                 yield cont
 
+    def _get_dependent_containers(self, container: Container) -> Iterable[Container]:
+        return {cont for cell in container.cells for cont in self._grid.get_containers(cell)}
+
     def _get_affected_container(self, cells: tuple[Cell, ...]) -> Container | None:  # TODO
         rows = {self._grid.get_row(cell) for cell in cells}
         if len(rows) == 1:
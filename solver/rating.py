@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+from enum import Enum
+from logging import WARNING, getLogger
+from typing import Mapping
+
+from sudoku import Grid
+
+from .solver import Solver
+from .stats import SolverStats
+
+
+class Level(Enum):
+    EASY = "Easy"
+    MEDIUM = "Medium"
+    HARD = "Hard"
+    UNFAIR = "Unfair"
+    EXTREME = "Extreme"  # not solved by the strategies
+
+
+_SINGLES = "Singles propagation"
+# Strategy name -> score of one application and level, HoDoKu-like. Singles are scored per placed value
+TECHNIQUES: Mapping[str, tuple[int, Level]] = {
+    _SINGLES: (10, Level.EASY),
+    "Pointing Subset": (50, Level.MEDIUM),
+    "Box/Line Reduction": (50, Level.MEDIUM),
+    "Naked pair": (60, Level.MEDIUM),
+    "Hidden pair": (70, Level.MEDIUM),
+    "Naked triple": (80, Level.MEDIUM),
+    "Hidden triple": (100, Level.MEDIUM),
+    "Naked quadruple": (120, Level.HARD),
+    "X-Wing": (140, Level.HARD),
+    "Hidden quadruple": (150, Level.HARD),
+    "Swordfish": (150, Level.HARD),
+    "Single Chain/Simple Coloring": (150, Level.HARD),
+    "Jelyfish": (160, Level.HARD),
+    "Y-Wing/XY-Wing": (160, Level.HARD),
+    "XYZ-Wing": (180, Level.HARD),
+    "X-Chain": (260, Level.UNFAIR),
+}
+
+
+@dataclass(frozen=True)
+class Rating:
+    score: int
+    level: Level
+    technique: str | None  # the hardest technique used, None if nothing was applied
+    solution: str | None  # None if the puzzle is not solved by the strategies
+    techniques: Mapping[str, int]  # technique -> applications (placed values for singles)
+
+    @property
+    def solved(self) -> bool:
+        return self.solution is not None
+
+
+class DifficultyRater:
+    """Rates a puzzle by solving it logically: every applied technique adds its score,
+    the level is the one of the hardest technique. Applications are taken from the solver stats hooks.
+    `failure_level` is the log level of the puzzles not solved by the strategies
+    """
+
+    def __init__(self, *, failure_level: int = WARNING) -> None:
+        self._logger = getLogger(__name__)
+        self._failure_level = failure_level
+
+    def __str__(self) -> str:
+        return "DifficultyRater"
+
+    def rate(self, quiz: Grid | str) -> Rating:
+        if isinstance(quiz, Grid):
+            quiz = "".join(str(cell.value) if cell.is_given else "0" for cell in quiz.cells)
+        grid = Grid(quiz, observable=False)
+        grid.init_candidates()
+        stats = SolverStats()
+        Solver(grid, stats=stats, failure_level=self._failure_level).solve()
+        solved = grid.is_solved  # solve() reports no progress for an already complete grid
+        techniques = {
+            name: strategy.placements if name == _SINGLES else strategy.hits
+            for name, strategy in stats.strategies.items()
+            if strategy.hits
+        }
+        score = sum(TECHNIQUES[name][0] * count for name, count in techniques.items())
+        technique = max(techniques, key=lambda name: TECHNIQUES[name][0], default=None)
+        level = Level.EXTREME if not solved else TECHNIQUES[technique][1] if technique else Level.EASY
+        self._logger.info("%s: %s rated %d (%s, %s)", self, quiz, score, level.value, technique)
+        solution = "".join(str(cell.value) for cell in grid.cells) if solved else None
+        return Rating(score, level, technique, solution, techniques)
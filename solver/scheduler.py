@@ -0,0 +1,78 @@
+import math
+import os
+from logging import getLogger
+from typing import Iterable, Self
+
+from .stats import SolverStats, StrategyStats
+from .strategy import Strategy
+
+
+class StrategyScheduler:
+    """Orders strategies by measured cost: run time per eliminated candidate/placed value.
+    Strategies that never made progress go last (ordered by time per call),
+    strategies with less than `min_invocations` measurements keep their default (ladder) positions,
+    measured ones are reordered among the remaining positions.
+    Measured strategies costing more than `max_cost` are gated: solver runs them only when the others make no progress.
+    Measurements are accumulated across runs and can be persisted in a JSON profile file.
+    Any order leads to the same solution: scheduler changes only the time spent to find it
+    """
+
+    def __init__(self, stats: SolverStats | None = None, *, min_invocations: int = 10, max_cost: float | None = None):
+        self._logger = getLogger(__name__)
+        self._stats = stats or SolverStats()
+        self._min_invocations = min_invocations
+        self._max_cost = max_cost
+
+    def __str__(self) -> str:
+        return "StrategyScheduler"
+
+    @property
+    def stats(self) -> SolverStats:
+        return self._stats
+
+    @classmethod
+    def load(cls, path: str, *, min_invocations: int = 10, max_cost: float | None = None) -> Self:
+        """Missing profile file means no measurements yet"""
+        if not os.path.exists(path):
+            return cls(min_invocations=min_invocations, max_cost=max_cost)
+        with open(path) as file:
+            return cls(SolverStats.from_json(file.read()), min_invocations=min_invocations, max_cost=max_cost)
+
+    def save(self, path: str) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as file:
+            file.write(self._stats.to_json())
+        os.replace(tmp_path, path)
+        self._logger.info("%s: Profile saved to %s", self, path)
+
+    def record(self, strategy: str, time: float, hit: bool, eliminations: int, placements: int) -> None:
+        self._stats.record(strategy, time, hit, eliminations, placements)
+
+    def record_puzzle(self, solved: bool) -> None:
+        self._stats.record_puzzle(solved)
+
+    def order(self, strategies: Iterable[Strategy]) -> tuple[Strategy, ...]:
+        result = list(strategies)
+        # Rarely reached strategies are not tried first just because they are not measured yet
+        positions = [pos for pos, strategy in enumerate(result) if self._is_measured(str(strategy))]
+        measured = sorted(positions, key=lambda pos: (*self._get_cost(str(result[pos])), pos))
+        for pos, strategy in zip(positions, [result[pos] for pos in measured]):
+            result[pos] = strategy
+        self._logger.debug("%s: Order: %s", self, result)
+        return tuple(result)
+
+    def is_gated(self, strategy: Strategy) -> bool:
+        """Time per progress exceeds `max_cost` (strategies that never made progress cost infinitely)"""
+        if self._max_cost is None or not self._is_measured(str(strategy)):
+            return False
+        cost, _ = self._get_cost(str(strategy))
+        return cost > self._max_cost
+
+    def _is_measured(self, strategy: str) -> bool:
+        stats = self._stats.strategies.get(strategy)
+        return stats is not None and stats.invocations >= max(self._min_invocations, 1)
+
+    def _get_cost(self, strategy: str) -> tuple[float, float]:
+        stats = self._stats.strategies.get(strategy) or StrategyStats()
+        time_per_call = stats.time / stats.invocations
+        return (stats.time / stats.progress if stats.progress else math.inf), time_per_call
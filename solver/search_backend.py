@@ -0,0 +1,80 @@
+from abc import ABC, abstractmethod
+from itertools import islice
+from logging import getLogger
+from typing import Generator
+
+from sudoku import Grid
+
+from .exceptions import SolverException
+from .solution_cache import SolutionCache
+
+
+class SearchBackend(ABC):
+    """Common interface of the solution searches. Backends differ only in the way the search is implemented.
+    Optional cache (can be shared by many backends) returns the first solution of an already solved isomorphic puzzle
+    """
+
+    def __init__(self, quiz: Grid | str, *, cache: SolutionCache | None = None) -> None:
+        self._logger = getLogger(__name__)
+        self._values = self._get_values(quiz)
+        self._cache = cache
+        self._solutions: Generator[str, None, None] | None = None  # create_solution progress
+
+    @abstractmethod
+    def __str__(self) -> str:
+        pass
+
+    @abstractmethod
+    def iter_solutions(self) -> Generator[str, None, None]:
+        """Lazily yields all solutions of one search as 81 digits strings. Every call starts a new independent search"""
+
+    @abstractmethod
+    def _iter_raw_solutions(self) -> Generator[object, None, None]:
+        """Same search as `iter_solutions`, solutions are yielded in the backend own state and not formatted"""
+
+    def create_solution(self) -> str | None:
+        """Each call returns the next solution, None when there are no more solutions"""
+        self._logger.info("%s: Creating solution", self)
+        if self._solutions is None:
+            solutions = self._solutions = self.iter_solutions()
+            if self._cache:
+                solution = self._cache.get_or_solve(self._values, lambda: next(solutions, None))
+                # Cached solution is not necessarily the first one of the search: it is skipped in the search
+                self._solutions = (other for other in solutions if other != solution)
+            else:
+                solution = next(self._solutions, None)
+        else:
+            solution = next(self._solutions, None)
+        if solution is None:
+            self._logger.warning("%s: Solution not found", self)
+            return None
+        self._logger.info("%s: Solution found", self)
+        return solution
+
+    def count_solutions(self, limit: int | None = None) -> int:
+        """Number of solutions, the search stops as soon as `limit` solutions are found"""
+        if limit is not None and limit < 1:
+            raise SolverException(f"{self}: Unexpected limit {limit}")
+        count = sum(1 for _ in islice(self._iter_raw_solutions(), limit))
+        self._logger.info("%s: %d solutions found (limit: %s)", self, count, limit)
+        return count
+
+    def is_unique(self) -> bool:
+        return self.count_solutions(limit=2) == 1
+
+    def _get_values(self, quiz: Grid | str) -> list[int]:
+        """Given values of a grid or of an 81 characters quiz string ("0" or "." for empty cells)"""
+        if isinstance(quiz, Grid):
+            return [cell.value if cell.is_given else 0 for cell in quiz.cells]
+        if len(quiz) != 81 or any(char not in "0123456789." for char in quiz):
+            raise SolverException(f"{self}: Unexpected quiz {quiz!r}")
+        return [int(char) if char != "." else 0 for char in quiz]
+
+    def reset(self) -> None:
+        """Next `create_solution` call starts from the first solution"""
+        if self._solutions is None:
+            self._logger.info("%s: Nothing to reset", self)
+            return
+        self._logger.info("%s: Resetting", self)
+        self._solutions.close()
+        self._solutions = None
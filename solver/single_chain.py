@@ -1,6 +1,6 @@
 from typing import Collection, Iterable, Mapping
 
-from sudoku import Cell, Container, Grid
+from sudoku import CANDIDATE_BITS, Cell, Container, Grid
 
 from .exceptions import SolverException
 from .multi_containers_strategy import MultiContainersStrategy
@@ -22,7 +22,7 @@ class SingleChain(MultiContainersStrategy):
         return "Single Chain/Simple Coloring"
 
     def _get_containers_subsets(self) -> Iterable[tuple[str, Iterable[Container]]]:
-        return [("all", self._grid.rows + self._grid.columns + self._grid.boxes)]
+        return [("all", self._grid.containers)]
 
     def _solve_cell_subsets(self, containers_type: str, candidate: int, cells_subsets: list[set[Cell]]) -> bool:
         for chain in self._build_chains(cells_subsets):
@@ -72,7 +72,7 @@ class SingleChain(MultiContainersStrategy):
     def _split_chain(self, chain: Collection[tuple[Cell, bool]]) -> dict[Container, list[tuple[Cell, bool]]]:
         result: dict[Container, list[tuple[Cell, bool]]] = {}
         for cell, color in chain:
-            for cont in (self._grid.get_row(cell), self._grid.get_column(cell), self._grid.get_box(cell)):
+            for cont in self._grid.get_containers(cell):
                 if cont not in result:
                     result[cont] = []
                 result[cont].append((cell, color))
@@ -105,7 +105,7 @@ class SingleChain(MultiContainersStrategy):
                 affected_cells,
             )
             for cell in affected_cells:
-                cell.candidates -= {candidate}
+                cell.candidates_mask &= ~CANDIDATE_BITS[candidate]
             return True
         return False
 
@@ -121,7 +121,7 @@ class SingleChain(MultiContainersStrategy):
             if cell in cells:
                 continue
             colors: set[bool] = set()
-            for cont in (self._grid.get_row(cell), self._grid.get_column(cell), self._grid.get_box(cell)):
+            for cont in self._grid.get_containers(cell):
                 if cont not in splitted_chain:
                     continue
                 colors |= {color for _, color in splitted_chain[cont]}
@@ -132,5 +132,5 @@ class SingleChain(MultiContainersStrategy):
             return False
         self._logger.info("%s: %d. Witness removal: %s can see both colors", self, candidate, affected_cells)
         for cell in affected_cells:
-            cell.candidates -= {candidate}
+            cell.candidates_mask &= ~CANDIDATE_BITS[candidate]
         return True
@@ -0,0 +1,74 @@
+from collections import deque
+from typing import Collection, Iterable
+
+from sudoku import (
+    CANDIDATE_BITS,
+    CELL_HOUSES,
+    MASK_DIGITS,
+    MASK_POSITIONS,
+    MASK_SIZES,
+    Cell,
+)
+
+from .strategy import Strategy
+
+
+class SinglesPropagator(Strategy):
+    """Naked and hidden singles propagation.
+    All singles are placed in one call: placing a value updates peers candidates,
+    singles that appear after that are queued and placed as well until the queue is drained.
+    Stops on contradiction (cell without candidates) leaving it to the caller
+    """
+
+    def __str__(self) -> str:
+        return "Singles propagation"
+
+    def solve(self) -> bool:
+        queue = deque(self._find_naked_singles())
+        queue.extend(self._find_hidden_singles(range(27), range(1, 10)))
+        placed = False
+        while queue:
+            cell, value = queue.popleft()
+            if cell.is_solved or not cell.candidates_mask & CANDIDATE_BITS[value]:
+                continue  # stale: already placed or eliminated by a previous placement
+            if not self._place(cell, value, queue):
+                return True
+            placed = True
+        return placed
+
+    def _place(self, cell: Cell, value: int, queue: deque[tuple[Cell, int]]) -> bool:
+        """Returns False on contradiction"""
+        bit = CANDIDATE_BITS[value]
+        former_cands = cell.candidates_mask & ~bit
+        peers = [peer for peer in self._grid.get_peers(cell) if peer.candidates_mask & bit]
+        self._logger.info("%s: %s = %d", self, cell, value)
+        self._grid.set_value(cell, value)
+        for peer in peers:
+            if not peer.candidates_mask:
+                self._logger.debug("%s: %s has no candidates", self, peer)
+                return False
+            if MASK_SIZES[peer.candidates_mask] == 1:
+                queue.append((peer, MASK_DIGITS[peer.candidates_mask][0]))
+        # Candidates positions changed only in the houses of the cell (former candidates)
+        # and in the houses of the peers (placed value)
+        queue.extend(self._find_hidden_singles(CELL_HOUSES[cell.index], MASK_DIGITS[former_cands]))
+        houses = {house for peer in peers for house in CELL_HOUSES[peer.index]}
+        queue.extend(self._find_hidden_singles(houses, (value,)))
+        return True
+
+    def _find_naked_singles(self) -> list[tuple[Cell, int]]:
+        return [
+            (cell, MASK_DIGITS[cell.candidates_mask][0])
+            for cell in self._grid.cells
+            if MASK_SIZES[cell.candidates_mask] == 1
+        ]
+
+    def _find_hidden_singles(self, houses: Iterable[int], candidates: Collection[int]) -> list[tuple[Cell, int]]:
+        result: list[tuple[Cell, int]] = []
+        for house in houses:
+            container = self._grid.containers[house]
+            for cand in candidates:
+                positions = self._grid.get_candidate_positions(container, cand)
+                if MASK_SIZES[positions] == 1:
+                    result.append((container.cells[MASK_POSITIONS[positions][0]], cand))
+        return result
@@ -0,0 +1,118 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Callable, Sequence
+
+from sudoku import CANDIDATE_BITS, MASK_DIGITS, CellState, Grid, Symmetry, canonicalize
+
+from .exceptions import SolverException
+
+
+@dataclass(frozen=True)
+class _LogicalOutcome:
+    source: tuple[CellState, ...]  # grid state before solving: the outcome is reused only for the same state
+    result: tuple[CellState, ...]
+    solved: bool
+
+
+_Entry = str | None | _LogicalOutcome
+_SOLUTION = "solution"
+_LOGICAL = "logical"
+
+
+class SolutionCache:
+    """LRU cache of search solutions and logical solving outcomes keyed by the canonical puzzle form.
+    Results are stored in the canonical space: isomorphic puzzles share entries,
+    cached results are mapped back through the symmetry of the requested puzzle
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self._logger = getLogger(__name__)
+        if max_size < 1:
+            raise SolverException(f"{self}: Unexpected max size {max_size}")
+        self._max_size = max_size
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __str__(self) -> str:
+        return "SolutionCache"
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self._hits + self._misses
+        return self._hits / requests if requests else 0.0
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._hits = self._misses = 0
+
+    def get_or_solve(self, values: Sequence[int], solve: Callable[[], str | None]) -> str | None:
+        """Cached solution of the puzzle (None if it has no solution), `solve` is called on a miss"""
+        canonical, symmetry = canonicalize("".join(map(str, values)))
+        key = (_SOLUTION, canonical)
+        if key in self._entries:
+            entry = self._get(key)
+            return symmetry.revert(entry) if isinstance(entry, str) else None
+        solution = solve()
+        self._put(key, symmetry.apply(solution) if solution else None)
+        return solution
+
+    def get_or_solve_logically(self, grid: Grid, solve: Callable[[], bool]) -> bool:
+        """Cached logical outcome is restored to the grid, `solve` is called on a miss (it has to change the grid)"""
+        canonical, symmetry = canonicalize("".join(str(cell.value) for cell in grid.cells))
+        key = (_LOGICAL, canonical)
+        source = self._to_canonical(grid, symmetry)
+        entry = self._entries.get(key)
+        if isinstance(entry, _LogicalOutcome) and entry.source == source:
+            self._get(key)
+            inverted_digits = symmetry.inverted_digits
+            states = symmetry.unpermute([_map_state(state, inverted_digits) for state in entry.result])
+            grid.restore({cell: state for cell, state in zip(grid.cells, states) if cell.get_state() != state})
+            return entry.solved
+        solved = solve()
+        self._put(key, _LogicalOutcome(source, self._to_canonical(grid, symmetry), solved))
+        return solved
+
+    def _get(self, key: tuple[str, str]) -> _Entry:
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def _put(self, key: tuple[str, str], entry: _Entry) -> None:
+        self._misses += 1
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            evicted, _ = self._entries.popitem(last=False)
+            self._logger.debug("%s: Evicted %s", self, evicted)
+
+    @staticmethod
+    def _to_canonical(grid: Grid, symmetry: Symmetry) -> tuple[CellState, ...]:
+        return tuple(
+            _map_state(state, symmetry.digits) for state in symmetry.permute([c.get_state() for c in grid.cells])
+        )
+
+
+def _map_state(state: CellState, digits: tuple[int, ...]) -> CellState:
+    value, mask = state
+    new_mask = 0
+    for digit in MASK_DIGITS[mask]:
+        new_mask |= CANDIDATE_BITS[digits[digit]]
+    return digits[value], new_mask
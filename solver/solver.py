@@ -1,4 +1,5 @@
-from logging import getLogger
+from logging import WARNING, getLogger
+from time import perf_counter
 
 from sudoku import Grid
 
@@ -9,7 +10,11 @@ from .hidden_subset import HiddenSubset
 from .naked_single import NakedSingle
 from .naked_subset import NakedSubset
 from .pointing_subset import PointingSubset
+from .scheduler import StrategyScheduler
 from .single_chain import SingleChain
+from .singles_propagator import SinglesPropagator
+from .solution_cache import SolutionCache
+from .stats import SolverStats
 from .strategy import Strategy
 from .x_chain import XChain
 from .xyz_wing import XYZWing
@@ -17,12 +22,34 @@ from .y_wing import YWing
 
 
 class Solver:
-    def __init__(self, grid: Grid):
+    """Logical solver. Optional stats instrument every strategy run (can be shared by many solvers).
+    Optional scheduler orders strategies by their measured cost and learns from every strategy run
+    (its stats can be the solver stats as well, every run is recorded once).
+    Optional cache restores the outcome of an already solved puzzle (or of its isomorph) without solving.
+    `failure_level` is the log level of a solving stopped for lack of progress: lower it where failures are expected
+    """
+
+    def __init__(
+        self,
+        grid: Grid,
+        *,
+        stats: SolverStats | None = None,
+        scheduler: StrategyScheduler | None = None,
+        cache: SolutionCache | None = None,
+        failure_level: int = WARNING,
+    ):
         self._logger = getLogger(__name__)
+        self._failure_level = failure_level
         self._grid = grid
-        self._solvers: tuple[Strategy, ...] = (
-            NakedSingle(self._grid),
-            HiddenSingle(self._grid),
+        self._stats = stats
+        self._scheduler = scheduler
+        self._cache = cache
+        recorders = [stats] if stats else []
+        if scheduler and scheduler.stats is not stats:
+            recorders.append(scheduler.stats)
+        self._recorders = tuple(recorders)
+        self._singles: tuple[Strategy, ...] = (NakedSingle(self._grid), HiddenSingle(self._grid))
+        self._strategies: tuple[Strategy, ...] = (
             NakedSubset(self._grid, 2),
             HiddenSubset(self._grid, 2),
             NakedSubset(self._grid, 3),
@@ -39,14 +66,46 @@ class Solver:
             XYZWing(self._grid),
             XChain(self._grid),
         )
+        # Solving drains all singles at once, step by step solving places one value at a time
+        strategies = self._scheduler.order(self._strategies) if self._scheduler else self._strategies
+        # Gated strategies run only when the others make no progress: solution stays the same, it may come faster
+        gated = tuple(strategy for strategy in strategies if self._scheduler and self._scheduler.is_gated(strategy))
+        self._solvers = (SinglesPropagator(self._grid),) + tuple(s for s in strategies if s not in gated)
+        self._fallback_solvers = gated
+        self._step_solvers = self._singles + self._strategies
 
     def __str__(self) -> str:
         return "Solver"
 
+    @property
+    def stats(self) -> SolverStats | None:
+        return self._stats
+
     def solve(self) -> bool:
-        if not self._grid.history_manager.is_complex_action:
+        if self._grid.is_observable and not self._grid.history_manager.is_complex_action:
             return self._grid.history_manager.as_complex_action(self.solve)
         self._logger.info("%s: Solving", self)
+        result = self._cache.get_or_solve_logically(self._grid, self._solve) if self._cache else self._solve()
+        for recorder in self._recorders:
+            recorder.record_puzzle(result)
+        return result
+
+    def solve_step(self) -> bool:
+        if self._grid.is_observable and not self._grid.history_manager.is_complex_action:
+            return self._grid.history_manager.as_complex_action(self.solve_step)
+        self._logger.info("%s: Solving step", self)
+        if not self._grid.is_consistent:
+            self._logger.warning("%s: %s is inconsistent", self, self._grid)
+            return False
+        if any(self._grid.filter_cells(solved=False, candidates=frozenset())):
+            self._logger.warning("%s: %s has no candidates cells", self, self._grid)
+            return False
+        if self._grid.is_solved:
+            self._logger.warning("%s: %s is solved", self, self._grid)
+            return False
+        return any(self._run(solver) for solver in self._step_solvers)
+
+    def _solve(self) -> bool:
         if not self._grid.is_consistent:
             self._logger.warning("%s: %s is inconsistent", self, self._grid)
             return False
@@ -57,23 +116,27 @@ class Solver:
             if any(self._grid.filter_cells(solved=False, candidates=frozenset())):
                 self._logger.warning("%s: %s has no candidates cells", self, self._grid)
                 return False
-            if not any(solver.solve() for solver in self._solvers):
-                self._logger.warning("%s: no step %d progress", self, step)
+            if not any(self._run(solver) for solver in self._solvers) and not any(
+                self._run(solver) for solver in self._fallback_solvers
+            ):
+                self._logger.log(self._failure_level, "%s: no step %d progress", self, step)
                 return False
         self._logger.info("%s: Total steps %d", self, step)
         return bool(step)
 
-    def solve_step(self) -> bool:
-        if not self._grid.history_manager.is_complex_action:
-            return self._grid.history_manager.as_complex_action(self.solve_step)
-        self._logger.info("%s: Solving step", self)
-        if not self._grid.is_consistent:
-            self._logger.warning("%s: %s is inconsistent", self, self._grid)
-            return False
-        if any(self._grid.filter_cells(solved=False, candidates=frozenset())):
-            self._logger.warning("%s: %s has no candidates cells", self, self._grid)
-            return False
-        if self._grid.is_solved:
-            self._logger.warning("%s: %s is solved", self, self._grid)
-            return False
-        return any(solver.solve() for solver in self._solvers)
+    def _run(self, strategy: Strategy) -> bool:
+        if not self._recorders:
+            return strategy.solve()
+        eliminations, placements = self._grid.eliminations_count, self._grid.placements_count
+        start = perf_counter()
+        result = strategy.solve()
+        measurement = (
+            str(strategy),
+            perf_counter() - start,
+            result,
+            self._grid.eliminations_count - eliminations,
+            self._grid.placements_count - placements,
+        )
+        for recorder in self._recorders:
+            recorder.record(*measurement)
+        return result
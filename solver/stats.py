@@ -0,0 +1,138 @@
+import json
+from dataclasses import asdict, dataclass, fields
+from typing import Mapping, Self
+
+from .exceptions import SolverException
+
+
+@dataclass
+class StrategyStats:
+    invocations: int = 0
+    hits: int = 0
+    time: float = 0.0
+    eliminations: int = 0
+    placements: int = 0
+
+    @property
+    def progress(self) -> int:
+        return self.eliminations + self.placements
+
+    def merge(self, other: "StrategyStats") -> None:
+        self.invocations += other.invocations
+        self.hits += other.hits
+        self.time += other.time
+        self.eliminations += other.eliminations
+        self.placements += other.placements
+
+
+class SolverStats:
+    """Per strategy counters: invocations, hits, wall time, eliminations and placed values.
+    One instance can be shared by many solvers to aggregate a whole dataset
+    """
+
+    def __init__(self) -> None:
+        self._strategies: dict[str, StrategyStats] = {}
+        self._puzzles = 0
+        self._solved = 0
+
+    def __str__(self) -> str:
+        return "SolverStats"
+
+    @property
+    def strategies(self) -> Mapping[str, StrategyStats]:
+        """Strategy name -> stats in order of the first invocation"""
+        return self._strategies
+
+    @property
+    def puzzles(self) -> int:
+        return self._puzzles
+
+    @property
+    def solved(self) -> int:
+        return self._solved
+
+    @property
+    def time(self) -> float:
+        return sum(stats.time for stats in self._strategies.values())
+
+    def get(self, strategy: str) -> StrategyStats:
+        return self._strategies.get(strategy) or StrategyStats()
+
+    def record(self, strategy: str, time: float, hit: bool, eliminations: int, placements: int) -> None:
+        stats = self._strategies.get(strategy)
+        if not stats:
+            stats = self._strategies[strategy] = StrategyStats()
+        stats.invocations += 1
+        stats.hits += hit
+        stats.time += time
+        stats.eliminations += eliminations
+        stats.placements += placements
+
+    def record_puzzle(self, solved: bool) -> None:
+        self._puzzles += 1
+        self._solved += solved
+
+    def merge(self, other: "SolverStats") -> None:
+        for name, stats in other.strategies.items():
+            if name not in self._strategies:
+                self._strategies[name] = StrategyStats()
+            self._strategies[name].merge(stats)
+        self._puzzles += other.puzzles
+        self._solved += other.solved
+
+    def to_dict(self) -> dict[str, int | dict[str, dict[str, int | float]]]:
+        return {
+            "puzzles": self._puzzles,
+            "solved": self._solved,
+            "strategies": {name: asdict(stats) for name, stats in self._strategies.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, object]) -> Self:
+        result = cls()
+        puzzles, solved, strategies = data.get("puzzles", 0), data.get("solved", 0), data.get("strategies", {})
+        if not isinstance(puzzles, int) or not isinstance(solved, int) or not isinstance(strategies, dict):
+            raise SolverException(f"{result}: Unexpected stats format")
+        result._puzzles, result._solved = puzzles, solved
+        names = {field.name for field in fields(StrategyStats)}
+        for name, stats in strategies.items():
+            if not isinstance(stats, dict) or not set(stats) <= names:
+                raise SolverException(f"{result}: Unexpected {name} stats format")
+            result._strategies[str(name)] = StrategyStats(**stats)
+        return result
+
+    @classmethod
+    def from_json(cls, data: str) -> Self:
+        loaded = json.loads(data)
+        if not isinstance(loaded, dict):
+            raise SolverException(f"{cls.__name__}: Unexpected stats format")
+        return cls.from_dict(loaded)
+
+    def to_json(self, *, indent: int | None = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def format_table(self) -> str:
+        header = ("Strategy", "Calls", "Hits", "Time, ms", "Elims", "Values", "ms/progress")
+        rows: list[tuple[str, ...]] = [header]
+        for name, stats in self._strategies.items():
+            cost = f"{stats.time * 1000 / stats.progress:.3f}" if stats.progress else "-"
+            rows.append(
+                (
+                    name,
+                    str(stats.invocations),
+                    str(stats.hits),
+                    f"{stats.time * 1000:.1f}",
+                    str(stats.eliminations),
+                    str(stats.placements),
+                    cost,
+                )
+            )
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        lines = [
+            "  ".join(
+                col.ljust(width) if not i else col.rjust(width) for i, (col, width) in enumerate(zip(row, widths))
+            )
+            for row in rows
+        ]
+        lines.append(f"Puzzles: {self._puzzles}. Solved: {self._solved}. Time: {self.time * 1000:.1f} ms")
+        return "\n".join(lines)
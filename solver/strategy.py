@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from logging import getLogger
 from typing import Iterable
 
-from sudoku import Cell, Container, Grid
+from sudoku import MASK_POSITIONS, MASK_SIZES, Cell, Container, Grid
 
 
 class Strategy(ABC):
@@ -22,8 +22,9 @@ class Strategy(ABC):
         self, container: Container, *, min_cells: int = 1, max_cells: int = 9, candidates: Iterable[int] = range(1, 10)
     ) -> dict[int, tuple[Cell, ...]]:
         result: dict[int, tuple[Cell, ...]] = {}
+        cells = container.cells
         for cand in candidates:
-            cells = tuple(container.filter_cells(has_candidate=cand))
-            if len(cells) in range(min_cells, max_cells + 1):
-                result[cand] = cells
+            positions = self._grid.get_candidate_positions(container, cand)
+            if min_cells <= MASK_SIZES[positions] <= max_cells:
+                result[cand] = tuple(cells[pos] for pos in MASK_POSITIONS[positions])
         return result
@@ -3,7 +3,7 @@ from functools import reduce
 from itertools import combinations, product
 from typing import Iterable
 
-from sudoku import Cell
+from sudoku import CANDIDATE_BITS, MASK_DIGITS, MASK_SIZES, Cell
 
 from .exceptions import SolverException
 from .strategy import Strategy
@@ -20,7 +20,7 @@ class WingStrategy(Strategy):
 
     def solve(self) -> bool:
         for pivot in self._grid.filter_cells(solved=False):
-            if len(pivot.candidates) != self._get_pivot_cands_count():
+            if MASK_SIZES[pivot.candidates_mask] != self._get_pivot_cands_count():
                 continue
             pincers = self._get_pincers(pivot)
             if not pincers:
@@ -34,12 +34,16 @@ class WingStrategy(Strategy):
     def _get_pincers(self, pivot: Cell) -> dict[tuple[int, ...], set[Cell]]:
         result: dict[tuple[int, ...], set[Cell]] = {}
         cands_combinations = tuple(combinations(pivot.candidates, self._get_pivot_cands_count() - 1))
-        for cont in (self._grid.get_row(pivot), self._grid.get_column(pivot), self._grid.get_box(pivot)):
+        for cont in self._grid.get_containers(pivot):
             cand_cells_map = self._get_candidate_cells_map(cont, min_cells=2, candidates=pivot.candidates)
             for cands_combination in cands_combinations:
                 cands_combination_cells = [set(cand_cells_map[cand]) for cand in cands_combination]
                 cells = reduce(lambda cells1, cells2: cells1 & cells2, cands_combination_cells)
-                pincers = {cell for cell in cells if cell.candidates != pivot.candidates and len(cell.candidates) == 2}
+                pincers = {
+                    cell
+                    for cell in cells
+                    if cell.candidates_mask != pivot.candidates_mask and MASK_SIZES[cell.candidates_mask] == 2
+                }
                 if not pincers:
                     continue
                 if cands_combination not in result:
@@ -49,18 +53,14 @@ class WingStrategy(Strategy):
 
     def _solve(self, pivot: Cell, pincer1: Cell, pincer2: Cell) -> bool:
         # No sense to process pincers sharing same container
-        if (
-            self._grid.get_row(pincer1) == self._grid.get_row(pincer2)
-            or self._grid.get_column(pincer1) == self._grid.get_column(pincer2)
-            or self._grid.get_box(pincer1) == self._grid.get_box(pincer2)
-        ):
+        if pincer1 is pincer2 or pincer2 in self._grid.get_peers(pincer1):
             return False
-        pincers_common_cands = pincer1.candidates & pincer2.candidates
+        pincers_common_cands = pincer1.candidates_mask & pincer2.candidates_mask
         if not pincers_common_cands:
             return False
-        if len(pincers_common_cands) > 1:
+        if MASK_SIZES[pincers_common_cands] > 1:
             raise SolverException(f"{self}: Internal error. Incorrect pincers")
-        cand = next(iter((pincers_common_cands)))
+        cand = MASK_DIGITS[pincers_common_cands][0]
         affected_cells = self._get_affected_cells(cand, pivot, (pincer1, pincer2))
         if not affected_cells:
             return False
@@ -78,7 +78,7 @@ class WingStrategy(Strategy):
         )
         for cell in affected_cells:
             self._logger.debug("%s: %s %s", self, cell, cell.candidates)
-            cell.candidates -= {cand}
+            cell.candidates_mask &= ~CANDIDATE_BITS[cand]
         return True
 
     def _get_affected_cells(self, candidate: int, pivot: Cell, pincers: tuple[Cell, Cell]) -> set[Cell]:
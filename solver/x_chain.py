@@ -1,6 +1,6 @@
 from typing import Collection, Iterable, Sequence
 
-from sudoku import Cell, Container, Grid
+from sudoku import CANDIDATE_BITS, Cell, Container, Grid
 
 from .exceptions import SolverException
 from .multi_containers_strategy import MultiContainersStrategy
@@ -20,7 +20,7 @@ class XChain(MultiContainersStrategy):
         return "X-Chain"
 
     def _get_containers_subsets(self) -> Iterable[tuple[str, Iterable[Container]]]:
-        return [("all", self._grid.rows + self._grid.columns + self._grid.boxes)]
+        return [("all", self._grid.containers)]
 
     def _solve_cell_subsets(self, containers_type: str, candidate: int, cells_subsets: list[set[Cell]]) -> bool:
         for chain in self._build_x_chains(cells_subsets):
@@ -30,7 +30,7 @@ class XChain(MultiContainersStrategy):
             self._logger.info("%s: %d. Affected cells: %s", self, candidate, cells)
             self._logger.debug("%s: Chain: %s", self, chain)
             for cell in cells:
-                cell.candidates -= {candidate}
+                cell.candidates_mask &= ~CANDIDATE_BITS[candidate]
             return True
         return False
 
@@ -57,7 +57,7 @@ class XChain(MultiContainersStrategy):
     def _find_links(self, cell: Cell, cells: set[Cell], cells_pairs: Collection[set[Cell]], link: bool) -> list[Cell]:
         if link:
             return [c for c in cells if {c, cell} in cells_pairs]
-        neighbors = self._grid.get_neighbors(cell, solved=False) & cells
+        neighbors = cells.intersection(self._grid.get_peers(cell))
         return [neighbor for neighbor in neighbors if {neighbor, cell} not in cells_pairs]
 
     def _adjust_chains(self, chains: Iterable[tuple[Cell, ...]]) -> list[tuple[Cell, ...]]:
@@ -85,7 +85,7 @@ class XChain(MultiContainersStrategy):
         """
         if cell in chain:
             return False
-        endpoints = self._grid.get_neighbors(cell, solved=False) & set(chain)
+        endpoints = set(chain).intersection(self._grid.get_peers(cell))
         idxs = [chain.index(cell) for cell in endpoints]
         try:
             max_odd = max(filter(lambda idx: idx % 2, idxs))
@@ -1,6 +1,50 @@
-__all__ = ["Cell", "Container", "Grid", "HistoryManagerException", "SudokuException"]
+__all__ = [
+    "ALL_CANDIDATES_MASK",
+    "CANDIDATE_BITS",
+    "CELL_BOX",
+    "CELL_COLUMN",
+    "CELL_HOUSES",
+    "CELL_PEERS",
+    "CELL_ROW",
+    "HOUSE_CELLS",
+    "LINE_PERMUTATIONS",
+    "MASK_POSITIONS",
+    "MASK_CANDIDATES",
+    "MASK_DIGITS",
+    "MASK_SIZES",
+    "Cell",
+    "CellState",
+    "Container",
+    "Grid",
+    "GridOverlay",
+    "HistoryManagerException",
+    "SudokuException",
+    "Symmetry",
+    "candidates_to_mask",
+    "canonical_form",
+    "canonicalize",
+]
 
-from .cell import Cell
+from .candidates import (
+    ALL_CANDIDATES_MASK,
+    CANDIDATE_BITS,
+    MASK_CANDIDATES,
+    MASK_DIGITS,
+    MASK_SIZES,
+    candidates_to_mask,
+)
+from .canonical import LINE_PERMUTATIONS, Symmetry, canonical_form, canonicalize
+from .cell import Cell, CellState
 from .container import Container
 from .exceptions import HistoryManagerException, SudokuException
 from .grid import Grid
+from .grid_overlay import GridOverlay
+from .tables import (
+    CELL_BOX,
+    CELL_COLUMN,
+    CELL_HOUSES,
+    CELL_PEERS,
+    CELL_ROW,
+    HOUSE_CELLS,
+    MASK_POSITIONS,
+)
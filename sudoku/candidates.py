@@ -0,0 +1,28 @@
+from typing import Iterable
+
+from .exceptions import SudokuException
+
+ALL_CANDIDATES_MASK = 0x1FF
+
+CANDIDATE_BITS: tuple[int, ...] = (0,) + tuple(1 << (cand - 1) for cand in range(1, 10))
+"""Candidate -> mask bit (index 0 is a placeholder for an empty cell value)"""
+
+MASK_CANDIDATES: tuple[frozenset[int], ...] = tuple(
+    frozenset(cand for cand in range(1, 10) if mask & CANDIDATE_BITS[cand]) for mask in range(ALL_CANDIDATES_MASK + 1)
+)
+"""Mask -> candidates frozenset. Shared instances: reading candidates view never allocates"""
+
+MASK_DIGITS: tuple[tuple[int, ...], ...] = tuple(tuple(sorted(cands)) for cands in MASK_CANDIDATES)
+"""Mask -> candidates in ascending order"""
+
+MASK_SIZES: tuple[int, ...] = tuple(len(cands) for cands in MASK_CANDIDATES)
+"""Mask -> candidates count"""
+
+
+def candidates_to_mask(candidates: Iterable[int]) -> int:
+    mask = 0
+    for cand in candidates:
+        if cand not in range(1, 10):
+            raise SudokuException(f"Illegal candidate {cand}")
+        mask |= CANDIDATE_BITS[cand]
+    return mask
@@ -0,0 +1,86 @@
+from typing import Self
+
+from .candidates import MASK_DIGITS, MASK_SIZES
+from .tables import CELL_HOUSE_POSITIONS, CELL_HOUSES
+
+
+class CandidatesIndex:
+    """Positions of every candidate in every house: 9-bit mask per (house, candidate).
+    House version: number of changes of the house cells, it never decreases.
+    Candidate version: number of changes of the candidate layout (cells having it), it never decreases.
+    Eliminations/placements: total number of removed candidates/set values.
+    Trail (when enabled): cells states before each change, for cheap rollback.
+    Maintained incrementally by cells on each value or candidates change
+    """
+
+    def __init__(self) -> None:
+        self._positions = [0] * (27 * 9)
+        self._house_versions = [0] * 27
+        self._candidate_versions = [0] * 10
+        self._eliminations = 0
+        self._placements = 0
+        self._trail: list[tuple[int, int, int]] | None = None
+
+    def __str__(self) -> str:
+        return "CandidatesIndex"
+
+    def copy(self) -> Self:
+        result = type(self)()
+        result._positions = self._positions.copy()
+        result._house_versions = self._house_versions.copy()
+        result._candidate_versions = self._candidate_versions.copy()
+        result._eliminations = self._eliminations
+        result._placements = self._placements
+        return result
+
+    @property
+    def eliminations(self) -> int:
+        return self._eliminations
+
+    @property
+    def placements(self) -> int:
+        return self._placements
+
+    @property
+    def trail(self) -> list[tuple[int, int, int]] | None:
+        """(cell index, old value, old candidates mask) per change, None if trail is disabled"""
+        return self._trail
+
+    @trail.setter
+    def trail(self, trail: list[tuple[int, int, int]] | None) -> None:
+        self._trail = trail
+
+    def get_positions(self, house_idx: int, candidate: int) -> int:
+        return self._positions[house_idx * 9 + candidate - 1]
+
+    def get_house_version(self, house_idx: int) -> int:
+        return self._house_versions[house_idx]
+
+    def get_candidate_version(self, candidate: int) -> int:
+        return self._candidate_versions[candidate]
+
+    def update_candidates(self, cell_idx: int, old_mask: int, new_mask: int) -> None:
+        """Only not solved cell candidates can be changed"""
+        if self._trail is not None:
+            self._trail.append((cell_idx, 0, old_mask))
+        self._eliminations += MASK_SIZES[old_mask & ~new_mask]
+        self._update(cell_idx, old_mask, new_mask)
+
+    def update_value(self, cell_idx: int, old_value: int, value: int, old_mask: int) -> None:
+        """Cell value change clears its candidates"""
+        if self._trail is not None:
+            self._trail.append((cell_idx, old_value, old_mask))
+        if value:
+            self._placements += 1
+        self._update(cell_idx, old_mask, 0)
+
+    def _update(self, cell_idx: int, old_mask: int, new_mask: int) -> None:
+        positions = self._positions
+        houses = CELL_HOUSES[cell_idx]
+        for house in houses:
+            self._house_versions[house] += 1
+        house_positions = CELL_HOUSE_POSITIONS[cell_idx]
+        for cand in MASK_DIGITS[old_mask ^ new_mask]:
+            self._candidate_versions[cand] += 1
+            for house, pos in zip(houses, house_positions):
+                positions[house * 9 + cand - 1] ^= 1 << pos
@@ -0,0 +1,206 @@
+"""Canonical form of a puzzle under the validity preserving symmetries:
+digits relabeling, rows/columns permutations inside bands/stacks, bands/stacks permutations and transposition.
+Canonical form is the lexicographically minimal (empty cells as 0) image of the puzzle: isomorphic puzzles
+have the same canonical form
+"""
+
+from dataclasses import dataclass
+from itertools import permutations, product
+from typing import Collection, Iterable, Sequence, TypeVar
+
+from .exceptions import SudokuException
+from .grid import Grid
+
+T = TypeVar("T")
+
+LINE_PERMUTATIONS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(3 * group + line for group, group_lines in zip(groups, lines) for line in group_lines)
+    for groups in permutations(range(3))
+    for lines in product(permutations(range(3)), repeat=3)
+)
+"""1296 permutations of 9 lines (rows or columns) keeping the bands (stacks): new line -> old line"""
+
+
+@dataclass(frozen=True)
+class Symmetry:
+    """Puzzle transformation: optional transposition, then rows and columns permutations (new -> old line),
+    then digits relabeling (old digit -> new digit, 0 stays for empty cells)
+    """
+
+    transposed: bool
+    rows: tuple[int, ...]
+    columns: tuple[int, ...]
+    digits: tuple[int, ...]
+
+    @property
+    def inverted_digits(self) -> tuple[int, ...]:
+        """New digit -> old digit"""
+        result = [0] * 10
+        for digit, new_digit in enumerate(self.digits):
+            result[new_digit] = digit
+        return tuple(result)
+
+    def apply(self, field: str) -> str:
+        return "".join(str(self.digits[value]) for value in self.permute(_to_values(field)))
+
+    def revert(self, field: str) -> str:
+        """Inverse transformation: original puzzle (or its solution) from the transformed one"""
+        inverted_digits = self.inverted_digits
+        return "".join(str(inverted_digits[value]) for value in self.unpermute(_to_values(field)))
+
+    def permute(self, items: Sequence[T]) -> list[T]:
+        """81 cells items (in row by row order) moved to the transformed positions, digits are not changed"""
+        source = _transpose(items) if self.transposed else items
+        return [source[row * 9 + column] for row in self.rows for column in self.columns]
+
+    def unpermute(self, items: Sequence[T]) -> list[T]:
+        result = list(items)
+        for new_row, row in enumerate(self.rows):
+            for new_column, column in enumerate(self.columns):
+                result[row * 9 + column] = items[new_row * 9 + new_column]
+        return _transpose(result) if self.transposed else result
+
+
+# Search state: transposed, chosen rows, columns permutation, digits relabeling, next free label
+_State = tuple[bool, tuple[int, ...], tuple[int, ...], tuple[int, ...], int]
+
+
+def canonicalize(quiz: Grid | str) -> tuple[str, Symmetry]:
+    """Canonical form and the symmetry transforming the quiz to it (`symmetry.revert` maps canonical back)"""
+    if isinstance(quiz, Grid):
+        values = [cell.value if cell.is_given else 0 for cell in quiz.cells]
+    else:
+        values = _to_values(quiz)
+    variants = {False: values, True: _transpose(values)}
+    # Swapping two empty rows of a band (or two empty bands) does not change the puzzle: one order of them is searched
+    empty_rows = {transposed: _get_empty_rows(variant) for transposed, variant in variants.items()}
+    # The first row is labeled 1, 2, 3... in order: the minimal one has the least given cells in the first stack,
+    # then in the second one, given cells go last inside stacks. Only columns permutations giving it are searched
+    first_rows = [
+        (sorted(_get_stacks_givens(variants[transposed], row)), transposed, row)
+        for transposed in (False, True)
+        for row in _get_next_rows((), 0, empty_rows[transposed])
+    ]
+    min_counts = min(counts for counts, _, _ in first_rows)
+    states: list[_State] = []
+    result: list[int] = []
+    for counts, transposed, row in first_rows:
+        if counts == min_counts:
+            empty_columns = empty_rows[not transposed]
+            for columns in _get_first_row_columns(variants[transposed], row, empty_columns):
+                result, digits, label = _relabel(variants[transposed], row, columns, (0,) * 10, 1)
+                states.append((transposed, (row,), columns, digits, label))
+    # The other rows are chosen one by one: only the states giving the minimal prefix survive
+    for position in range(1, 9):
+        best: list[int] | None = None
+        next_states: dict[tuple[bool, frozenset[int], tuple[int, ...], tuple[int, ...]], _State] = {}
+        for transposed, rows, columns, digits, label in states:
+            source = variants[transposed]
+            for row in _get_next_rows(rows, position, empty_rows[transposed]):
+                line, new_digits, new_label = _relabel(source, row, columns, digits, label)
+                if best is None or line < best:
+                    best, next_states = line, {}
+                if line == best:
+                    # Chosen rows order does not matter for the rest: states differing only in it are equivalent
+                    key = (transposed, frozenset(rows + (row,)), columns, new_digits)
+                    next_states.setdefault(key, (transposed, rows + (row,), columns, new_digits, new_label))
+        states = list(next_states.values())
+        result += best or []
+    transposed, rows, columns, digits, label = states[0]
+    # Digits not used in the quiz get the remaining labels: symmetry maps solutions as well
+    free_labels = iter(range(label, 10))
+    digits = tuple(digit_label or next(free_labels) if digit else 0 for digit, digit_label in enumerate(digits))
+    return "".join(map(str, result)), Symmetry(transposed, rows, columns, digits)
+
+
+def canonical_form(quiz: Grid | str) -> str:
+    return canonicalize(quiz)[0]
+
+
+def _get_stacks_givens(values: list[int], row: int) -> list[int]:
+    return [sum(1 for column in range(3 * stack, 3 * stack + 3) if values[row * 9 + column]) for stack in range(3)]
+
+
+def _get_first_row_columns(values: list[int], row: int, empty_columns: frozenset[int]) -> list[tuple[int, ...]]:
+    """Columns permutations putting the stacks with less given cells first and given cells last inside stacks.
+    Empty columns (stacks) are interchangeable: only the permutations keeping their order are searched
+    """
+    counts = _get_stacks_givens(values, row)
+    empty_stacks = [stack for stack in range(3) if _is_empty(range(3 * stack, 3 * stack + 3), empty_columns)]
+    stacks_orders = [
+        stacks
+        for stacks in permutations(range(3))
+        if sorted(counts) == [counts[s] for s in stacks] and _is_ordered(stacks, empty_stacks)
+    ]
+    result: list[tuple[int, ...]] = []
+    for stacks in stacks_orders:
+        stacks_columns = [
+            [
+                columns
+                for columns in permutations(range(3 * stack, 3 * stack + 3))
+                if sorted(columns, key=lambda column: bool(values[row * 9 + column])) == list(columns)
+                and _is_ordered(columns, empty_columns)
+            ]
+            for stack in stacks
+        ]
+        result += [sum(columns, ()) for columns in product(*stacks_columns)]
+    return result
+
+
+def _get_next_rows(rows: tuple[int, ...], position: int, empty_rows: frozenset[int]) -> tuple[int, ...]:
+    """Empty rows (bands) are interchangeable: only the first remaining one of them is a candidate"""
+    if position % 3:  # the rest of the current band
+        band = rows[-1] // 3
+        candidates = [row for row in range(3 * band, 3 * band + 3) if row not in rows]
+    else:
+        used_bands = {row // 3 for row in rows}
+        bands = [band for band in range(3) if band not in used_bands]
+        empty_bands = [band for band in bands if _is_empty(range(3 * band, 3 * band + 3), empty_rows)]
+        bands = [band for band in bands if band not in empty_bands[1:]]
+        candidates = [row for band in bands for row in range(3 * band, 3 * band + 3)]
+    # The first remaining empty row of each band
+    first_empty = {
+        band: min((row for row in candidates if row // 3 == band and row in empty_rows), default=-1)
+        for band in range(3)
+    }
+    return tuple(row for row in candidates if row not in empty_rows or row == first_empty[row // 3])
+
+
+def _get_empty_rows(values: list[int]) -> frozenset[int]:
+    return frozenset(row for row in range(9) if not any(values[row * 9 : row * 9 + 9]))
+
+
+def _is_empty(lines: Iterable[int], empty_lines: frozenset[int]) -> bool:
+    return all(line in empty_lines for line in lines)
+
+
+def _is_ordered(items: Sequence[int], chosen: Collection[int]) -> bool:
+    """Chosen items keep their relative order"""
+    selected = [item for item in items if item in chosen]
+    return selected == sorted(selected)
+
+
+def _relabel(
+    values: list[int], row: int, columns: tuple[int, ...], digits: tuple[int, ...], label: int
+) -> tuple[list[int], tuple[int, ...], int]:
+    line: list[int] = []
+    new_digits: list[int] | None = None
+    offset = row * 9
+    for column in columns:
+        value = values[offset + column]
+        if value and not (new_digits or digits)[value]:
+            new_digits = new_digits or list(digits)
+            new_digits[value] = label
+            label += 1
+        line.append((new_digits or digits)[value])
+    return line, tuple(new_digits) if new_digits else digits, label
+
+
+def _to_values(field: str) -> list[int]:
+    if len(field) != 81 or any(char not in "0123456789." for char in field):
+        raise SudokuException(f"Unexpected field {field!r}")
+    return [int(char) if char != "." else 0 for char in field]
+
+
+def _transpose(items: Sequence[T]) -> list[T]:
+    return [items[column * 9 + row] for row in range(9) for column in range(9)]
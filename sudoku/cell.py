@@ -3,19 +3,38 @@ from typing import Callable, Iterable, Self
 
 from events import Events  # type: ignore[import-untyped]
 
+from .candidates import ALL_CANDIDATES_MASK, CANDIDATE_BITS, MASK_CANDIDATES
+from .candidates_index import CandidatesIndex
 from .exceptions import SudokuException
 
+CellState = tuple[int, int]
+"""Cell value and candidates mask"""
+
 
 class Cell:
-    def __init__(self, value: int, i: int, j: int):
-        self._logger = getLogger(__name__)
-        self._events = Events()
+    """Grid cell. Not observable cell (headless grids) has no events: changes can not be subscribed to"""
+
+    __slots__ = ("_events", "_candidates_index", "_coordinates", "_index", "_candidates", "_value", "_is_given")
+    _logger = getLogger(__name__)  # shared by all cells: no logger lookup per cell
+
+    def __init__(
+        self,
+        value: int,
+        i: int,
+        j: int,
+        candidates_index: CandidatesIndex | None = None,
+        *,
+        observable: bool = True,
+    ):
+        self._events = Events() if observable else None
+        self._candidates_index = candidates_index
         self._coordinates = i, j
-        self._candidates: frozenset[int] = frozenset()
+        self._index = i + j * 9
+        self._candidates = 0
         self._check_value(value)
         self._value = value
         self._is_given = self._value != 0
-        if any(idx not in range(9) for idx in self._coordinates):
+        if i not in range(9) or j not in range(9):
             raise SudokuException(f"{self}: Invalid coordinates {self._coordinates}")
 
     def __str__(self) -> str:
@@ -28,23 +47,44 @@ class Cell:
     def coordinates(self) -> tuple[int, int]:
         return self._coordinates
 
+    @property
+    def index(self) -> int:
+        """Position in the grid: `column + row * 9`"""
+        return self._index
+
     @property
     def candidates(self) -> frozenset[int]:
-        return self._candidates
+        """Read-only view of the candidates mask"""
+        return MASK_CANDIDATES[self._candidates]
 
     @candidates.setter
     def candidates(self, candidates: Iterable[int]) -> None:
-        cands = frozenset(candidates)
-        if self._candidates == cands:
+        mask = 0
+        for cand in candidates:
+            self._check_value(cand, allow_zero=False)
+            mask |= CANDIDATE_BITS[cand]
+        self.candidates_mask = mask
+
+    @property
+    def candidates_mask(self) -> int:
+        """Candidates as 9-bit mask: candidate N is bit N-1"""
+        return self._candidates
+
+    @candidates_mask.setter
+    def candidates_mask(self, mask: int) -> None:
+        if self._candidates == mask:
             return
-        self._logger.info("%s: Updating candidates %s -> %s", self, self._candidates, cands)
+        if mask & ~ALL_CANDIDATES_MASK:
+            raise SudokuException(f"{self}: Attempt to set illegal candidates mask {mask:#x}")
+        self._logger.info(
+            "%s: Updating candidates %s -> %s", self, MASK_CANDIDATES[self._candidates], MASK_CANDIDATES[mask]
+        )
         self._verify_cell_change()
         self._verify_candidates_change()
-        for cand in cands:
-            self._check_value(cand, allow_zero=False)
-        self._candidates = cands
-        self._logger.debug("%s: On change: set candidates", self)
-        self._events.on_change(self)
+        if self._candidates_index is not None:
+            self._candidates_index.update_candidates(self._index, self._candidates, mask)
+        self._candidates = mask
+        self._emit_on_change("set candidates")
 
     @property
     def value(self) -> int:
@@ -57,10 +97,15 @@ class Cell:
         self._logger.info("%s: Updating value %d -> %d", self, self._value, value)
         self._verify_cell_change()
         self._check_value(value)
+        if self._candidates_index is not None:
+            self._candidates_index.update_value(self._index, self._value, value, self._candidates)
         self._value = value
-        self._candidates = frozenset()
-        self._logger.debug("%s: On change: set value", self)
-        self._events.on_change(self)
+        self._candidates = 0
+        self._emit_on_change("set value")
+
+    @property
+    def is_observable(self) -> bool:
+        return self._events is not None
 
     @property
     def is_given(self) -> bool:
@@ -71,25 +116,44 @@ class Cell:
         return self._value != 0
 
     def add_on_change_handler(self, handler: Callable[[Self], None]) -> None:
+        if self._events is None:
+            raise SudokuException(f"{self}: Cell is not observable")
         self._events.on_change += handler
 
     def remove_on_change_handler(self, handler: Callable[[Self], None]) -> None:
+        if self._events is None:
+            raise SudokuException(f"{self}: Cell is not observable")
         self._events.on_change -= handler
 
-    def get_state(self) -> tuple[int, frozenset[int]]:
+    def copy(self, candidates_index: CandidatesIndex | None = None, *, observable: bool = True) -> Self:
+        """Cell with the same state. Candidates index is expected to contain this state already"""
+        cell = type(self)(
+            self._value if self._is_given else 0, *self._coordinates, candidates_index, observable=observable
+        )
+        cell._value = self._value
+        cell._candidates = self._candidates
+        return cell
+
+    def get_state(self) -> CellState:
         return self._value, self._candidates
 
-    def restore(self, state: tuple[int, frozenset[int]]) -> None:
+    def restore(self, state: CellState) -> None:
         self._logger.info("%s: Restoring %s", self, state)
         self._verify_state(state)
-        self.value, self.candidates = state
+        self.value, self.candidates_mask = state
 
     def reset(self) -> None:
         self._logger.info("%s: Resetting", self)
         if self._is_given:
             return
         self.value = 0
-        self.candidates = frozenset()
+        self.candidates_mask = 0
+
+    def _emit_on_change(self, reason: str) -> None:
+        if self._events is None:
+            return
+        self._logger.debug("%s: On change: %s", self, reason)
+        self._events.on_change(self)
 
     def _check_value(self, value: int, *, allow_zero: bool = True) -> None:
         if value not in (range(10) if allow_zero else range(1, 10)):
@@ -103,6 +167,6 @@ class Cell:
         if self.is_given:
             raise SudokuException(f"{self}: Attempt to change given")
 
-    def _verify_state(self, state: tuple[int, frozenset[int]]) -> None:
+    def _verify_state(self, state: CellState) -> None:
         if state[0] and state[1]:
             raise SudokuException(f"{self}: State {state} is inconcistent: solved cell can not have candidates")
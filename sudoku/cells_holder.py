@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Iterable, Iterator, NotRequired, TypedDict
 
+from .candidates import CANDIDATE_BITS, candidates_to_mask
 from .cell import Cell
 from .exceptions import SudokuException
 
@@ -52,7 +53,21 @@ class CellsHolder(ABC):
         has_candidate: int | None = None,
         candidates: Iterable[int] | None = None,
     ) -> Iterator[Cell]:
-        result = iter(self._cells)
+        return self._filter_cells(
+            self._cells, solved=solved, given=given, value=value, has_candidate=has_candidate, candidates=candidates
+        )
+
+    @staticmethod
+    def _filter_cells(
+        cells: Iterable[Cell],
+        *,
+        solved: bool | None = None,
+        given: bool | None = None,
+        value: int | None = None,
+        has_candidate: int | None = None,
+        candidates: Iterable[int] | None = None,
+    ) -> Iterator[Cell]:
+        result = iter(cells)
         if solved is not None:
             result = filter(lambda cell: cell.is_solved == solved, result)
         if given is not None:
@@ -60,7 +75,9 @@ class CellsHolder(ABC):
         if value:
             result = filter(lambda cell: cell.value == value, result)
         if has_candidate:
-            result = filter(lambda cell: has_candidate in cell.candidates, result)
+            bit = CANDIDATE_BITS[has_candidate]
+            result = filter(lambda cell: cell.candidates_mask & bit, result)
         if candidates is not None:
-            result = filter(lambda cell: cell.candidates == frozenset(candidates), result)
+            mask = candidates_to_mask(candidates)
+            result = filter(lambda cell: cell.candidates_mask == mask, result)
         return result
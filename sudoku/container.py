@@ -4,6 +4,7 @@ from typing import Iterable
 from .cell import Cell
 from .cells_holder import CellsHolder
 from .exceptions import SudokuException
+from .tables import BOXES_OFFSET, COLUMNS_OFFSET, ROWS_OFFSET
 
 
 class ContainerType(Enum):
@@ -12,11 +13,19 @@ class ContainerType(Enum):
     BOX = "Box"
 
 
+_HOUSES_OFFSETS = {
+    ContainerType.ROW: ROWS_OFFSET,
+    ContainerType.COLUMN: COLUMNS_OFFSET,
+    ContainerType.BOX: BOXES_OFFSET,
+}
+
+
 class Container(CellsHolder):
     def __init__(self, cells: Iterable[Cell], idx: int, container_type: ContainerType):
         super().__init__(cells)
         self._idx = idx
         self._container_type = container_type
+        self._house_idx = _HOUSES_OFFSETS[container_type] + idx
         if len(self._cells) != 9:
             raise SudokuException(f"{self}: Invalid cells count {len(self._cells)}")
         if self._idx not in range(9):
@@ -32,6 +41,11 @@ class Container(CellsHolder):
     def idx(self) -> int:
         return self._idx
 
+    @property
+    def house_idx(self) -> int:
+        """Index among all 27 grid houses: rows, columns, boxes"""
+        return self._house_idx
+
     @property
     def is_consistent(self) -> bool:
         values = tuple(cell.value for cell in self.filter_cells(solved=True))
@@ -1,33 +1,55 @@
 from logging import getLogger
-from typing import Iterable, Unpack
+from operator import itemgetter
+from typing import Iterable, Mapping, Self, Unpack
 
-from .cell import Cell
+from .candidates import ALL_CANDIDATES_MASK, CANDIDATE_BITS
+from .candidates_index import CandidatesIndex
+from .cell import Cell, CellState
 from .cells_holder import CellsFilter, CellsHolder
 from .container import Container, ContainerType
 from .exceptions import SudokuException
 from .history_manager import HistoryManager
+from .tables import (
+    BOXES_OFFSET,
+    CELL_BOX,
+    CELL_COLUMN,
+    CELL_PEERS,
+    CELL_ROW,
+    COLUMNS_OFFSET,
+    HOUSE_CELLS,
+    ROWS_OFFSET,
+)
+
+_PEERS_GETTERS = tuple(itemgetter(*peers) for peers in CELL_PEERS)
 
 
 class Grid(CellsHolder):
-    def __init__(self, field: Iterable[int | str]):
-        super().__init__(self._create_cells(field))
-        self._logger = getLogger(__name__)
-        self._history_manager = HistoryManager(self.filter_cells(given=False))
-        self._rows = tuple(self._create_row(i) for i in range(9))
-        self._columns = tuple(self._create_column(i) for i in range(9))
-        self._boxes = tuple(self._create_box(i) for i in range(9))
+    """Not observable (headless) grid is meant for batch solving:
+    its cells have no events and it has no history manager
+    """
+
+    def __init__(self, field: Iterable[int | str], *, observable: bool = True):
+        self._candidates_index = CandidatesIndex()
+        self._is_observable = observable
+        self._setup(self._create_cells(field))
 
     def __str__(self) -> str:
         return "Grid"
 
     @property
     def history_manager(self) -> HistoryManager:
+        if not self._history_manager:
+            raise SudokuException(f"{self}: Headless grid has no history manager")
         return self._history_manager
 
+    @property
+    def is_observable(self) -> bool:
+        return self._is_observable
+
     @property
     def is_consistent(self) -> bool:
         self._logger.info("%s: Running consistency check", self)
-        return all(cont.is_consistent for cont in self._rows + self._columns + self._boxes)
+        return all(cont.is_consistent for cont in self._containers)
 
     @property
     def rows(self) -> tuple[Container, ...]:
@@ -41,6 +63,33 @@ class Grid(CellsHolder):
     def boxes(self) -> tuple[Container, ...]:
         return self._boxes
 
+    @property
+    def eliminations_count(self) -> int:
+        """Total number of candidates removed from the grid cells"""
+        return self._candidates_index.eliminations
+
+    @property
+    def placements_count(self) -> int:
+        """Total number of values set to the grid cells"""
+        return self._candidates_index.placements
+
+    @property
+    def is_trail_enabled(self) -> bool:
+        return self._candidates_index.trail is not None
+
+    @property
+    def trail_size(self) -> int:
+        """Number of changes recorded in the trail: rollback mark"""
+        trail = self._candidates_index.trail
+        if trail is None:
+            raise SudokuException(f"{self}: Trail is disabled")
+        return len(trail)
+
+    @property
+    def containers(self) -> tuple[Container, ...]:
+        """All houses in house index order: rows, columns, boxes"""
+        return self._containers
+
     @property
     def console_representation(self) -> str:
         result = ""
@@ -55,70 +104,131 @@ class Grid(CellsHolder):
         return result
 
     def get_row(self, cell: Cell) -> Container:
-        try:
-            return self._rows[cell.coordinates[1]]
-        except IndexError:
-            raise SudokuException(f"{self}: Illegal row index {cell.coordinates[1]} for {cell=}")
+        return self._rows[CELL_ROW[cell.index]]
 
     def get_column(self, cell: Cell) -> Container:
-        try:
-            return self._columns[cell.coordinates[0]]
-        except IndexError:
-            raise SudokuException(f"{self}: Illegal column index {cell.coordinates[0]} for {cell=}")
+        return self._columns[CELL_COLUMN[cell.index]]
 
     def get_box(self, cell: Cell) -> Container:
-        column, row = cell.coordinates
-        block_idx = 3 * (row // 3) + (column // 3)
-        try:
-            return self._boxes[block_idx]
-        except IndexError:
-            raise SudokuException(f"{self}: Illegal block index {block_idx} for {cell=}")
+        return self._boxes[CELL_BOX[cell.index]]
+
+    def get_containers(self, cell: Cell) -> tuple[Container, Container, Container]:
+        """Cell row, column and box"""
+        index = cell.index
+        return self._rows[CELL_ROW[index]], self._columns[CELL_COLUMN[index]], self._boxes[CELL_BOX[index]]
+
+    def get_peers(self, cell: Cell) -> tuple[Cell, ...]:
+        """20 cells sharing a container with the cell. Precomputed: no filtering, no allocation"""
+        return self._peers[cell.index]
+
+    def get_candidate_positions(self, container: Container, candidate: int) -> int:
+        """Mask of container cells positions (bit N is `container.cells[N]`) that have the candidate"""
+        return self._candidates_index.get_positions(container.house_idx, candidate)
+
+    def get_version(self, container: Container) -> int:
+        """Container changes counter: same version means container cells were not changed"""
+        return self._candidates_index.get_house_version(container.house_idx)
+
+    def get_candidate_version(self, candidate: int) -> int:
+        """Candidate layout changes counter: same version means no cell gained or lost the candidate"""
+        return self._candidates_index.get_candidate_version(candidate)
 
     def get_neighbors(self, cell: Cell, /, **kwargs: Unpack[CellsFilter]) -> set[Cell]:
-        conts = (self.get_row(cell), self.get_column(cell), self.get_box(cell))
-        return {cont_cell for cont in conts for cont_cell in cont.filter_cells(**kwargs)} - {cell}
+        return set(self._filter_cells(self._peers[cell.index], **kwargs))
 
     def set_value(self, cell: Cell, value: int) -> None:
-        if not self.history_manager.is_complex_action:
-            return self.history_manager.as_complex_action(self.set_value, cell, value)
+        if self._history_manager and not self._history_manager.is_complex_action:
+            return self._history_manager.as_complex_action(self.set_value, cell, value)
         self._logger.info("%s: Setting cell value: %s = %d", self, cell, value)
         cell.value = value
-        for neighbor in self.get_neighbors(cell, has_candidate=cell.value):
-            neighbor.candidates -= {cell.value}
+        bit = CANDIDATE_BITS[cell.value]
+        for neighbor in self._peers[cell.index]:
+            if neighbor.candidates_mask & bit:
+                neighbor.candidates_mask &= ~bit
+
+    def clone(self, *, observable: bool = False) -> Self:
+        """Copy of the grid state: cells and candidates index are copied, not recomputed. History is not copied"""
+        grid = type(self).__new__(type(self))
+        grid._candidates_index = self._candidates_index.copy()
+        grid._is_observable = observable
+        grid._setup(cell.copy(grid._candidates_index, observable=observable) for cell in self._cells)
+        return grid
+
+    def restore(self, states: Mapping[Cell, CellState]) -> None:
+        if self._history_manager and not self._history_manager.is_complex_action:
+            return self._history_manager.as_complex_action(self.restore, states)
+        self._logger.info("%s: Restoring %d cells", self, len(states))
+        for cell, state in states.items():
+            cell.restore(state)
+
+    def enable_trail(self) -> None:
+        """Start recording cells states before each change: undo log for backtracking searches"""
+        if self._candidates_index.trail is None:
+            self._candidates_index.trail = []
+
+    def disable_trail(self) -> None:
+        self._candidates_index.trail = None
+
+    def rollback_trail(self, size: int) -> None:
+        """Restore only the cells changed after the trail had `size` records"""
+        trail = self._candidates_index.trail
+        if trail is None:
+            raise SudokuException(f"{self}: Trail is disabled")
+        if size not in range(len(trail) + 1):
+            raise SudokuException(f"{self}: Trail size {size} out of range")
+        self._logger.debug("%s: Rolling back %d changes", self, len(trail) - size)
+        self._candidates_index.trail = None  # rollback itself is not recorded
+        try:
+            while len(trail) > size:
+                idx, value, mask = trail.pop()
+                self._cells[idx].restore((value, mask))
+        finally:
+            self._candidates_index.trail = trail
 
     def reset(self) -> None:
-        if not self.history_manager.is_complex_action:
-            return self.history_manager.as_complex_action(self.reset)
+        if self._history_manager and not self._history_manager.is_complex_action:
+            return self._history_manager.as_complex_action(self.reset)
         self._logger.info("%s: Resetting", self)
         for cell in self.filter_cells(given=False):
             cell.reset()
 
     def init_candidates(self) -> None:
-        if not self.history_manager.is_complex_action:
-            return self.history_manager.as_complex_action(self.init_candidates)
+        if self._history_manager and not self._history_manager.is_complex_action:
+            return self._history_manager.as_complex_action(self.init_candidates)
         self._logger.info("%s: Creating candidates", self)
         for cell in self.filter_cells(solved=False):
-            cands = self._prepare_candidates(cell)
-            if not cands:
+            mask = self._prepare_candidates(cell)
+            if not mask:
                 self._logger.warning("%s: No candidates found for %s", self, cell)
-            cell.candidates = cands
+            cell.candidates_mask = mask
+
+    def _setup(self, cells: Iterable[Cell]) -> None:
+        super().__init__(cells)
+        self._logger = getLogger(__name__)
+        self._history_manager = HistoryManager(self.filter_cells(given=False)) if self._is_observable else None
+        self._rows = tuple(self._create_row(i) for i in range(9))
+        self._columns = tuple(self._create_column(i) for i in range(9))
+        self._boxes = tuple(self._create_box(i) for i in range(9))
+        self._containers = self._rows + self._columns + self._boxes
+        self._peers: tuple[tuple[Cell, ...], ...] = tuple(getter(self._cells) for getter in _PEERS_GETTERS)
 
     def _create_cells(self, field: Iterable[int | str]) -> tuple[Cell, ...]:
         values = self._adjust_field(field)
-        return tuple(Cell(value, i % 9, i // 9) for i, value in enumerate(values))
+        return tuple(
+            Cell(value, i % 9, i // 9, self._candidates_index, observable=self._is_observable)
+            for i, value in enumerate(values)
+        )
 
     def _create_row(self, idx: int) -> Container:
-        cells = [self.get_cell(i, idx) for i in range(9)]
+        cells = [self._cells[i] for i in HOUSE_CELLS[ROWS_OFFSET + idx]]
         return Container(cells, idx, ContainerType.ROW)
 
     def _create_column(self, idx: int) -> Container:
-        cells = [self.get_cell(idx, i) for i in range(9)]
+        cells = [self._cells[i] for i in HOUSE_CELLS[COLUMNS_OFFSET + idx]]
         return Container(cells, idx, ContainerType.COLUMN)
 
     def _create_box(self, idx: int) -> Container:
-        row = 3 * (idx % 3)
-        column = 3 * (idx // 3)
-        cells = [self.get_cell(row + j, column + i) for i in range(3) for j in range(3)]
+        cells = [self._cells[i] for i in HOUSE_CELLS[BOXES_OFFSET + idx]]
         return Container(cells, idx, ContainerType.BOX)
 
     def _adjust_field(self, field: Iterable[int | str]) -> tuple[int, ...]:
@@ -130,6 +240,8 @@ class Grid(CellsHolder):
             raise SudokuException(f"{self}: Unexpected cells count {len(result)}")
         return result
 
-    def _prepare_candidates(self, cell: Cell) -> frozenset[int]:
-        values = {neighbor.value for neighbor in self.get_neighbors(cell, solved=True)}
-        return frozenset(range(1, 10)) - values
+    def _prepare_candidates(self, cell: Cell) -> int:
+        mask = ALL_CANDIDATES_MASK
+        for neighbor in self._peers[cell.index]:
+            mask &= ~CANDIDATE_BITS[neighbor.value]
+        return mask
@@ -0,0 +1,114 @@
+from logging import getLogger
+from typing import Mapping
+
+from .candidates import ALL_CANDIDATES_MASK, CANDIDATE_BITS, MASK_CANDIDATES
+from .cell import Cell, CellState
+from .exceptions import SudokuException
+from .grid import Grid
+
+
+class GridOverlay:
+    """Copy-on-write view of a grid (or of another overlay).
+    Changed cells states are stored in the overlay, everything else is read from the parent.
+    Base grid is never changed until commit: cheap trial eliminations, what-if previews and branches.
+    Parent states are remembered when first read: commit fails if the parent has changed them since
+    """
+
+    def __init__(self, parent: "Grid | GridOverlay"):
+        self._logger = getLogger(__name__)
+        self._parent = parent
+        self._grid: Grid = parent if isinstance(parent, Grid) else parent.grid
+        self._states: dict[Cell, CellState] = {}
+        self._read_states: dict[Cell, CellState] = {}  # parent states the changes are based on
+
+    def __str__(self) -> str:
+        return "GridOverlay"
+
+    @property
+    def grid(self) -> Grid:
+        return self._grid
+
+    @property
+    def parent(self) -> "Grid | GridOverlay":
+        return self._parent
+
+    @property
+    def changes(self) -> Mapping[Cell, CellState]:
+        """Cells changed in this overlay (not in its parents)"""
+        return self._states
+
+    def get_state(self, cell: Cell) -> CellState:
+        state = self._states.get(cell)
+        if state is not None:
+            return state
+        return self._read_states.setdefault(cell, self._get_parent_state(cell))
+
+    def _get_parent_state(self, cell: Cell) -> CellState:
+        return self._parent.get_state(cell) if isinstance(self._parent, GridOverlay) else cell.get_state()
+
+    def get_value(self, cell: Cell) -> int:
+        return self.get_state(cell)[0]
+
+    def get_candidates_mask(self, cell: Cell) -> int:
+        return self.get_state(cell)[1]
+
+    def get_candidates(self, cell: Cell) -> frozenset[int]:
+        return MASK_CANDIDATES[self.get_state(cell)[1]]
+
+    def set_candidates_mask(self, cell: Cell, mask: int) -> None:
+        value, cands = self.get_state(cell)
+        if cands == mask:
+            return
+        if value:
+            raise SudokuException(f"{self}: Attempt to change solved cell {cell} candidates")
+        if mask & ~ALL_CANDIDATES_MASK:
+            raise SudokuException(f"{self}: Attempt to set illegal candidates mask {mask:#x} to {cell}")
+        self._states[cell] = value, mask
+
+    def set_value(self, cell: Cell, value: int) -> None:
+        """Same as `Grid.set_value`: value is removed from peers candidates"""
+        if cell.is_given:
+            raise SudokuException(f"{self}: Attempt to change given {cell}")
+        if value not in range(1, 10):
+            raise SudokuException(f"{self}: Attempt to set illegal value {value} to {cell}")
+        self.get_state(cell)  # the overwritten state is checked on commit as well
+        self._states[cell] = value, 0
+        bit = CANDIDATE_BITS[value]
+        for peer in self._grid.get_peers(cell):
+            peer_value, peer_cands = self.get_state(peer)
+            if peer_cands & bit:
+                self._states[peer] = peer_value, peer_cands & ~bit
+
+    def overlay(self) -> "GridOverlay":
+        return GridOverlay(self)
+
+    def commit(self) -> None:
+        """Apply changes to parent and clear them.
+        Nothing is applied if the parent has changed a cell state read by this overlay
+        """
+        conflicts = [cell for cell, state in self._read_states.items() if self._get_parent_state(cell) != state]
+        if conflicts:
+            raise SudokuException(f"{self}: Parent changed {', '.join(map(str, conflicts))} since overlay read")
+        self._logger.info("%s: Committing %d cells", self, len(self._states))
+        if isinstance(self._parent, GridOverlay):
+            self._parent._states.update(self._states)
+        else:
+            self._parent.restore(self._states)
+        self._states = {}
+        self._read_states = {}
+
+    def rollback(self) -> None:
+        self._states.clear()
+        self._read_states.clear()
+
+    def to_grid(self, *, observable: bool = False) -> Grid:
+        """Standalone grid with overlay state"""
+        grid = self._grid.clone(observable=observable)
+        states: dict[Cell, CellState] = {}
+        overlay: GridOverlay | None = self
+        while overlay:  # the nearest overlay state wins
+            for cell, state in overlay.changes.items():
+                states.setdefault(cell, state)
+            overlay = overlay.parent if isinstance(overlay.parent, GridOverlay) else None
+        grid.restore({grid.cells[cell.index]: state for cell, state in states.items()})
+        return grid
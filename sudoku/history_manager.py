@@ -4,7 +4,7 @@ from typing import Callable, Iterable, Mapping, ParamSpec, TypeVar
 
 from events import Events  # type: ignore[import-untyped]
 
-from .cell import Cell
+from .cell import Cell, CellState
 from .exceptions import HistoryManagerException
 
 _T = TypeVar("_T")
@@ -16,10 +16,10 @@ class HistoryManager:
         self._logger = getLogger(__name__)
         self._cells = frozenset(cells)
         self._events = Events()
-        self._state: dict[Cell, tuple[int, frozenset[int]]] = {}
-        self._undo_stack: deque[Mapping[Cell, tuple[int, frozenset[int]]]] = deque()
-        self._redo_stack: deque[Mapping[Cell, tuple[int, frozenset[int]]]] = deque()
-        self._action: dict[Cell, tuple[int, frozenset[int]]] = {}
+        self._state: dict[Cell, CellState] = {}
+        self._undo_stack: deque[Mapping[Cell, CellState]] = deque()
+        self._redo_stack: deque[Mapping[Cell, CellState]] = deque()
+        self._action: dict[Cell, CellState] = {}
         self._is_history_frozen = False
         self._is_complex_action = False
 
@@ -98,7 +98,7 @@ class HistoryManager:
     def remove_on_change_handler(self, handler: Callable[[], None]) -> None:
         self._events.on_change -= handler
 
-    def _restore(self, state: Mapping[Cell, tuple[int, frozenset[int]]]) -> None:
+    def _restore(self, state: Mapping[Cell, CellState]) -> None:
         self._is_history_frozen = True
         try:
             for cell, cell_state in state.items():
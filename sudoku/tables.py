@@ -0,0 +1,38 @@
+"""Static grid topology. Cell index is `column + row * 9`, house index is Row: 0-8, Column: 9-17, Box: 18-26"""
+
+ROWS_OFFSET = 0
+COLUMNS_OFFSET = 9
+BOXES_OFFSET = 18
+
+CELL_ROW: tuple[int, ...] = tuple(idx // 9 for idx in range(81))
+CELL_COLUMN: tuple[int, ...] = tuple(idx % 9 for idx in range(81))
+CELL_BOX: tuple[int, ...] = tuple(3 * (idx // 27) + (idx % 9) // 3 for idx in range(81))
+
+CELL_HOUSES: tuple[tuple[int, int, int], ...] = tuple(
+    (ROWS_OFFSET + CELL_ROW[idx], COLUMNS_OFFSET + CELL_COLUMN[idx], BOXES_OFFSET + CELL_BOX[idx]) for idx in range(81)
+)
+"""Cell index -> (row, column, box) house indexes"""
+
+HOUSE_CELLS: tuple[tuple[int, ...], ...] = (
+    tuple(tuple(column + row * 9 for column in range(9)) for row in range(9))
+    + tuple(tuple(column + row * 9 for row in range(9)) for column in range(9))
+    + tuple(
+        tuple(3 * (box % 3) + j + (3 * (box // 3) + i) * 9 for i in range(3) for j in range(3)) for box in range(9)
+    )
+)
+"""House index -> 9 cell indexes (boxes are ordered row by row)"""
+
+CELL_HOUSE_POSITIONS: tuple[tuple[int, int, int], ...] = tuple(
+    (CELL_COLUMN[idx], CELL_ROW[idx], 3 * (CELL_ROW[idx] % 3) + CELL_COLUMN[idx] % 3) for idx in range(81)
+)
+"""Cell index -> cell position inside its (row, column, box) houses"""
+
+MASK_POSITIONS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(pos for pos in range(9) if mask >> pos & 1) for mask in range(512)
+)
+"""House positions mask -> positions in ascending order"""
+
+CELL_PEERS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(sorted({peer for house in CELL_HOUSES[idx] for peer in HOUSE_CELLS[house]} - {idx})) for idx in range(81)
+)
+"""Cell index -> 20 cell indexes sharing a house with it"""
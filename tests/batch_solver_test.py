@@ -0,0 +1,41 @@
+import unittest
+from os import path
+
+from solver import BatchSolver, ExactCoverSolver, SolverException
+
+
+class BatchSolverTest(unittest.TestCase):
+    def test_solutions(self) -> None:
+        for file_name in ("kaggle_small.txt", "topn87_hr.txt", "top87_ez.txt"):
+            lines = self._read_lines(file_name)
+            solutions = BatchSolver().solve([quiz for quiz, _ in lines])
+            self.assertEqual(solutions, [solution for _, solution in lines], file_name)
+
+    def test_backend(self) -> None:
+        lines = self._read_lines("topn87_hr.txt")
+        solutions = BatchSolver(ExactCoverSolver).solve([quiz for quiz, _ in lines])
+        self.assertEqual(solutions, [solution for _, solution in lines])
+
+    def test_multiple_solutions(self) -> None:
+        lines = self._read_lines("multiple_solutions.txt")
+        for (_, *solutions), result in zip(lines, BatchSolver().solve([quiz for quiz, *_ in lines])):
+            self.assertIn(result, solutions)
+
+    def test_no_solutions(self) -> None:
+        quizzes = [quiz for quiz, in self._read_lines("no_solutions.txt")]
+        self.assertEqual(BatchSolver().solve(quizzes), [None] * len(quizzes))
+
+    def test_illegal_quizzes(self) -> None:
+        self.assertEqual(BatchSolver().solve([]), [])
+        for quizzes in (["123"], ["x" * 81], ["0" * 81, "0" * 80]):
+            with self.assertRaises(SolverException):
+                BatchSolver().solve(quizzes)
+
+    @staticmethod
+    def _read_lines(file_name: str) -> list[list[str]]:
+        with open(path.join(path.dirname(__file__), "datasets", file_name)) as file:
+            return [line.strip().split(",") for line in file]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from logging import WARNING
+from os import path
+
+from batch import BatchException, BatchPipeline, Engine, load_dataset
+from batch.pipeline import solve_chunk
+
+
+class BatchTest(unittest.TestCase):
+    def test_load_dataset(self) -> None:
+        puzzles = load_dataset(self._get_path("test.txt"))
+        self.assertTrue(puzzles)
+        self.assertTrue(all(len(quiz) == 81 and len(solutions) == 1 for quiz, solutions in puzzles))
+        quiz, solutions = load_dataset(self._get_path("multiple_solutions.txt"))[0]
+        self.assertEqual(len(solutions), 2)
+        self.assertEqual(load_dataset(self._get_path("no_solutions.txt"))[0][1], ())
+
+    def test_engines(self) -> None:
+        puzzles = load_dataset(self._get_path("kaggle_small.txt"))[:60]
+        quizzes = [quiz for quiz, _ in puzzles]
+        expected = [solutions[0] for _, solutions in puzzles]
+        for engine in Engine:
+            self.assertEqual(BatchPipeline(engine, workers=2, chunk_size=7).solve(quizzes), expected, engine)
+
+    def test_chunks_order(self) -> None:
+        quizzes = [quiz for quiz, _ in load_dataset(self._get_path("top87_ez.txt"))]
+        chunks = list(BatchPipeline(workers=3, chunk_size=5).iter_chunks(quizzes))
+        self.assertEqual([chunk.index for chunk in chunks], list(range(9)))
+        self.assertEqual([chunk.start for chunk in chunks], list(range(0, 44, 5)))
+        self.assertEqual(sum(len(chunk.solutions) for chunk in chunks), len(quizzes))
+        self.assertTrue(all(chunk.time > 0 for chunk in chunks))
+
+    def test_no_solutions(self) -> None:
+        quizzes = [quiz for quiz, _ in load_dataset(self._get_path("no_solutions.txt"))]
+        for engine in (Engine.BITBOARD, Engine.VECTORIZED):
+            self.assertEqual(BatchPipeline(engine, workers=2).solve(quizzes), [None] * len(quizzes))
+
+    def test_invalid_quizzes(self) -> None:
+        puzzles = load_dataset(self._get_path("kaggle_small.txt"))[:4]
+        quizzes = [quiz for quiz, _ in puzzles] + ["123", "x" * 81, puzzles[0][1][0]]
+        expected: list[str | None] = [solutions[0] for _, solutions in puzzles]
+        expected += [None, None, puzzles[0][1][0]]
+        for engine in Engine:
+            with self.assertLogs(level=WARNING):
+                self.assertEqual(solve_chunk(engine, 0, 0, quizzes).solutions, expected, engine)
+        self.assertEqual(BatchPipeline(workers=2, chunk_size=2).solve(quizzes), expected)
+
+    def test_illegal_arguments(self) -> None:
+        with self.assertRaises(BatchException):
+            BatchPipeline(workers=0)
+        with self.assertRaises(BatchException):
+            BatchPipeline(chunk_size=0)
+
+    @staticmethod
+    def _get_path(file_name: str) -> str:
+        return path.join(path.dirname(__file__), "datasets", file_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,17 @@
 import unittest
+from itertools import islice
 from logging import WARNING
 from os import path
+from typing import Generator
 
-from solver import BruteForcer
+from solver import (
+    BitboardSolver,
+    BranchingHeuristic,
+    BruteForcer,
+    ExactCoverSolver,
+    SearchBackend,
+    SolverException,
+)
 from sudoku import Grid
 
 
@@ -10,6 +19,9 @@ class BruteForcerTest(unittest.TestCase):
     def test_solutions(self) -> None:
         self._test_solutions("topn87_hr.txt")
 
+    def test_first_cell_branching(self) -> None:
+        self._test_solutions("topn87_hr.txt", branching=BranchingHeuristic.FIRST)
+
     def test_multiple_solutions(self) -> None:
         file_path = path.join(path.dirname(__file__), "datasets", "multiple_solutions.txt")
         with open(file_path) as file:
@@ -26,6 +38,19 @@ class BruteForcerTest(unittest.TestCase):
                     self.assertIsNone(brute_forcer.create_solution(), f"{quiz} too much solutions found")
                 self.assertEqual(sorted(results), sorted(solutions), f"{quiz} wrong solutions")
 
+    def test_iter_solutions(self) -> None:
+        file_path = path.join(path.dirname(__file__), "datasets", "multiple_solutions.txt")
+        with open(file_path) as file:
+            for line in file:
+                quiz, *solutions = line.strip().split(",")
+                brute_forcer = BruteForcer(Grid(quiz))
+                self.assertEqual(sorted(brute_forcer.iter_solutions()), sorted(solutions), f"{quiz} wrong solutions")
+                first = next(brute_forcer.iter_solutions())
+                self.assertEqual(list(islice(brute_forcer.iter_solutions(), 1)), [first], quiz)
+                # Searches are independent from each other and from create_solution progress
+                self.assertEqual(brute_forcer.create_solution(), first, quiz)
+                self.assertEqual(next(brute_forcer.iter_solutions()), first, quiz)
+
     def test_no_solutions(self) -> None:
         file_path = path.join(path.dirname(__file__), "datasets", "no_solutions.txt")
         num_of_attempts = 5
@@ -37,12 +62,51 @@ class BruteForcerTest(unittest.TestCase):
                     with self.assertLogs(level=WARNING):
                         self.assertIsNone(brute_forcer.create_solution(), f"{quiz} should be unsolvable")
 
-    def _test_solutions(self, file_name: str) -> None:
+    def test_count_solutions(self) -> None:
+        datasets = path.join(path.dirname(__file__), "datasets")
+        with open(path.join(datasets, "multiple_solutions.txt")) as file:
+            for line in file:
+                quiz, *solutions = line.strip().split(",")
+                brute_forcer = BruteForcer(Grid(quiz))
+                self.assertEqual(brute_forcer.count_solutions(), len(solutions), quiz)
+                self.assertEqual(brute_forcer.count_solutions(limit=1), 1, quiz)
+                self.assertFalse(brute_forcer.is_unique(), quiz)
+                # Counting does not affect solutions enumeration
+                self.assertIn(brute_forcer.create_solution(), solutions, quiz)
+                self.assertEqual(brute_forcer.count_solutions(), len(solutions), quiz)
+        with open(path.join(datasets, "no_solutions.txt")) as file:
+            for line in file:
+                quiz = line.strip()
+                self.assertEqual(BruteForcer(Grid(quiz)).count_solutions(), 0, quiz)
+        with open(path.join(datasets, "top87_ez.txt")) as file:
+            for line in file:
+                quiz = line.strip().split(",")[0]
+                self.assertTrue(BruteForcer(Grid(quiz)).is_unique(), quiz)
+        for limit in (0, -1):
+            with self.assertRaises(SolverException):
+                BruteForcer(Grid(quiz)).count_solutions(limit=limit)
+
+    def test_counting_without_formatting(self) -> None:
+        datasets = path.join(path.dirname(__file__), "datasets")
+        with open(path.join(datasets, "multiple_solutions.txt")) as file:
+            lines = [line.strip().split(",") for line in file]
+        for backend in (BruteForcer, ExactCoverSolver, BitboardSolver):
+
+            class Counter(backend):  # type: ignore[valid-type, misc]
+                def iter_solutions(self) -> Generator[str, None, None]:
+                    raise AssertionError("Solutions are formatted")
+
+            for quiz, *solutions in lines:
+                counter: SearchBackend = Counter(quiz)
+                self.assertEqual(counter.count_solutions(), len(solutions), f"{backend.__name__} {quiz}")
+                self.assertFalse(counter.is_unique(), f"{backend.__name__} {quiz}")
+
+    def _test_solutions(self, file_name: str, *, branching: BranchingHeuristic = BranchingHeuristic.MRV) -> None:
         file_path = path.join(path.dirname(__file__), "datasets", file_name)
         with open(file_path) as file:
             for line in file:
                 quiz, solution = line.strip().split(",")
-                brute_forcer = BruteForcer(Grid(quiz))
+                brute_forcer = BruteForcer(Grid(quiz), branching=branching)
                 with self.assertNoLogs(level=WARNING):
                     self.assertEqual(brute_forcer.create_solution(), solution, f"{quiz}: wrong solution")
                 self.assertIsNone(brute_forcer.create_solution(), f"{quiz} multiple solutions found")
@@ -0,0 +1,69 @@
+import random
+import unittest
+from os import path
+from time import perf_counter
+
+from sudoku import Grid, SudokuException, Symmetry, canonical_form, canonicalize
+from sudoku.canonical import LINE_PERMUTATIONS
+
+
+class CanonicalTest(unittest.TestCase):
+    def test_isomorphic_puzzles(self) -> None:
+        rnd = random.Random(0)
+        for quiz, solution in self._read_lines("kaggle_small.txt")[:100]:
+            canonical = canonical_form(quiz)
+            for _ in range(3):
+                symmetry = self._get_random_symmetry(rnd)
+                self.assertEqual(canonical_form(symmetry.apply(quiz)), canonical, quiz)
+                self.assertEqual(symmetry.revert(symmetry.apply(solution)), solution, quiz)
+            self.assertEqual(canonical_form(canonical), canonical, quiz)
+            self.assertEqual(canonical_form(Grid(quiz)), canonical, quiz)
+
+    def test_symmetry(self) -> None:
+        for quiz, solution in self._read_lines("topn87_hr.txt"):
+            canonical, symmetry = canonicalize(quiz)
+            self.assertEqual(symmetry.apply(quiz), canonical, quiz)
+            self.assertEqual(symmetry.revert(canonical), quiz, quiz)
+            canonical_solution = symmetry.apply(solution)
+            self.assertTrue(all(a == b for a, b in zip(canonical, canonical_solution) if a != "0"), quiz)
+            self.assertEqual(symmetry.revert(canonical_solution), solution, quiz)
+
+    def test_different_puzzles(self) -> None:
+        quizzes = [quiz for quiz, _ in self._read_lines("kaggle_small.txt")[:100]]
+        self.assertEqual(len({canonical_form(quiz) for quiz in quizzes}), len(set(quizzes)))
+
+    def test_sparse_puzzles(self) -> None:
+        solution = self._read_lines("kaggle_small.txt")[0][1]
+        quizzes = [
+            "0" * 81,
+            "11" + "0" * 79,
+            solution[:17] + "0" * 64,
+            "".join(char if idx % 9 < 2 else "0" for idx, char in enumerate(solution)),
+        ]
+        rnd = random.Random(0)
+        for quiz in quizzes:
+            start_time = perf_counter()
+            canonical, symmetry = canonicalize(quiz)
+            self.assertLess(perf_counter() - start_time, 1.0, quiz)
+            self.assertEqual(symmetry.apply(quiz), canonical, quiz)
+            self.assertEqual(canonical_form(self._get_random_symmetry(rnd).apply(quiz)), canonical, quiz)
+        self.assertEqual(canonical_form("0" * 81), "0" * 81)
+
+    def test_illegal_field(self) -> None:
+        for field in ("123", "x" * 81):
+            with self.assertRaises(SudokuException):
+                canonicalize(field)
+
+    @staticmethod
+    def _get_random_symmetry(rnd: random.Random) -> Symmetry:
+        digits = (0,) + tuple(rnd.sample(range(1, 10), 9))
+        return Symmetry(rnd.random() < 0.5, rnd.choice(LINE_PERMUTATIONS), rnd.choice(LINE_PERMUTATIONS), digits)
+
+    @staticmethod
+    def _read_lines(file_name: str) -> list[list[str]]:
+        with open(path.join(path.dirname(__file__), "datasets", file_name)) as file:
+            return [line.strip().split(",") for line in file]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from logging import WARNING
+from os import path
+
+from solver import BitboardSolver, BruteForcer, ExactCoverSolver, SolverException
+from sudoku import Grid
+
+
+class ExactCoverSolverTest(unittest.TestCase):
+    def test_solutions(self) -> None:
+        for file_name in ("topn87_hr.txt", "kaggle_small.txt"):
+            for quiz, solution in self._read_lines(file_name):
+                solver = ExactCoverSolver(quiz)
+                with self.assertNoLogs(level=WARNING):
+                    self.assertEqual(solver.create_solution(), solution, f"{quiz}: wrong solution")
+                self.assertIsNone(solver.create_solution(), f"{quiz} multiple solutions found")
+
+    def test_multiple_solutions(self) -> None:
+        for quiz, *solutions in self._read_lines("multiple_solutions.txt"):
+            solver = ExactCoverSolver(quiz)
+            self.assertEqual(sorted(solver.iter_solutions()), sorted(solutions), f"{quiz} wrong solutions")
+            self.assertEqual(solver.count_solutions(), len(solutions), quiz)
+            self.assertEqual(solver.count_solutions(limit=1), 1, quiz)
+            self.assertFalse(solver.is_unique(), quiz)
+
+    def test_no_solutions(self) -> None:
+        for (quiz,) in self._read_lines("no_solutions.txt"):
+            solver = ExactCoverSolver(quiz)
+            self.assertEqual(solver.count_solutions(), 0, quiz)
+            with self.assertLogs(level=WARNING):
+                self.assertIsNone(solver.create_solution(), f"{quiz} should be unsolvable")
+
+    def test_backends(self) -> None:
+        for quiz, solution in self._read_lines("top87_ez.txt"):
+            grid = Grid(quiz)
+            for backend in (BruteForcer(grid), ExactCoverSolver(grid), BitboardSolver(quiz)):
+                self.assertTrue(backend.is_unique(), f"{backend}: {quiz}")
+                self.assertEqual(backend.create_solution(), solution, f"{backend}: {quiz}")
+                backend.reset()
+                self.assertEqual(backend.create_solution(), solution, f"{backend}: {quiz}")
+
+    def test_illegal_quiz(self) -> None:
+        for quiz in ("123", "x" * 81):
+            with self.assertRaises(SolverException):
+                ExactCoverSolver(quiz)
+
+    @staticmethod
+    def _read_lines(file_name: str) -> list[list[str]]:
+        with open(path.join(path.dirname(__file__), "datasets", file_name)) as file:
+            return [line.strip().split(",") for line in file]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from logging import WARNING
+
+from solver import BitboardSolver, ClueSymmetry, Level, PuzzleGenerator, SolverException
+
+
+class GeneratorTest(unittest.TestCase):
+    def test_unique_puzzles(self) -> None:
+        for symmetry in ClueSymmetry:
+            generator = PuzzleGenerator(symmetry=symmetry, seed=0)
+            for _ in range(5):
+                puzzle = generator.generate()
+                self.assertEqual(BitboardSolver(puzzle.quiz).count_solutions(limit=2), 1, puzzle.quiz)
+                self.assertEqual(BitboardSolver(puzzle.quiz).create_solution(), puzzle.solution, puzzle.quiz)
+                self.assertIsNone(puzzle.rating)
+                for orbit in symmetry.orbits:
+                    self.assertEqual(len({puzzle.quiz[idx] == "0" for idx in orbit}), 1, f"{puzzle.quiz} {symmetry}")
+                # Minimal: no clue (group of clues) can be removed
+                for orbit in symmetry.orbits:
+                    if puzzle.quiz[orbit[0]] != "0":
+                        values = ["0" if idx in orbit else char for idx, char in enumerate(puzzle.quiz)]
+                        self.assertEqual(BitboardSolver("".join(values)).count_solutions(limit=2), 2, puzzle.quiz)
+
+    def test_solutions(self) -> None:
+        generator = PuzzleGenerator(seed=1)
+        solutions = [generator.create_solution() for _ in range(10)]
+        self.assertEqual(len(set(solutions)), len(solutions))
+        for solution in solutions:
+            self.assertEqual(BitboardSolver(solution).create_solution(), solution)
+        self.assertEqual(PuzzleGenerator(seed=1).generate(), PuzzleGenerator(seed=1).generate())
+
+    def test_levels(self) -> None:
+        for level in (Level.EASY, Level.MEDIUM):
+            with self.assertNoLogs(level=WARNING):
+                puzzle = PuzzleGenerator(levels=[level], seed=2).generate()
+            assert puzzle.rating
+            self.assertEqual(puzzle.rating.level, level, puzzle.quiz)
+        with self.assertRaises(SolverException):
+            PuzzleGenerator(levels=[Level.HARD], max_attempts=1, seed=0).generate()
+        with self.assertRaises(SolverException):
+            PuzzleGenerator(levels=[])
+
+
+if __name__ == "__main__":
+    unittest.main()
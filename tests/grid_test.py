@@ -0,0 +1,163 @@
+import unittest
+
+from sudoku import CANDIDATE_BITS, Grid, GridOverlay, SudokuException
+
+QUIZ = "004300209005009001070060043006002087190007400050083000600000105003508690042910300"
+
+
+class GridTest(unittest.TestCase):
+    def test_candidates_mask(self) -> None:
+        grid = Grid(QUIZ)
+        grid.init_candidates()
+        cell = grid.get_cell(0, 0)
+        self.assertEqual(cell.candidates, frozenset({8}))
+        self.assertEqual(cell.candidates_mask, CANDIDATE_BITS[8])
+        cell = grid.get_cell(1, 0)
+        cell.candidates = frozenset({1, 2})
+        self.assertEqual(cell.candidates_mask, 0b11)
+        cell.candidates_mask &= ~CANDIDATE_BITS[1]
+        self.assertEqual(cell.candidates, frozenset({2}))
+        other = grid.get_cell(0, 1)
+        other.candidates_mask = 0b10
+        self.assertIs(cell.candidates, other.candidates)
+        with self.assertRaises(SudokuException):
+            cell.candidates = frozenset({0})
+        with self.assertRaises(SudokuException):
+            cell.candidates_mask = 1 << 9
+
+    def test_peers(self) -> None:
+        grid = Grid(QUIZ)
+        for cell in grid.cells:
+            conts = (grid.get_row(cell), grid.get_column(cell), grid.get_box(cell))
+            expected = {cont_cell for cont in conts for cont_cell in cont.cells} - {cell}
+            self.assertEqual(conts, grid.get_containers(cell))
+            self.assertTrue(all(cell in cont.cells for cont in conts))
+            self.assertEqual(grid.get_box(cell).idx, 3 * (cell.coordinates[1] // 3) + cell.coordinates[0] // 3)
+            self.assertEqual(len(grid.get_peers(cell)), 20)
+            self.assertEqual(set(grid.get_peers(cell)), expected)
+            self.assertEqual(grid.get_neighbors(cell, solved=True), {c for c in expected if c.is_solved})
+        for cont in grid.containers:
+            self.assertEqual(len(set(cont.cells)), 9)
+
+    def test_candidate_positions(self) -> None:
+        grid = Grid(QUIZ)
+        grid.init_candidates()
+        grid.set_value(grid.get_cell(0, 0), 8)
+        grid.get_cell(1, 0).candidates_mask &= ~CANDIDATE_BITS[6]
+        grid.get_cell(0, 5).reset()
+        self._assert_candidate_positions(grid)
+
+    def test_versions(self) -> None:
+        grid = Grid(QUIZ)
+        grid.init_candidates()
+        cell = grid.get_cell(1, 0)
+        versions = [grid.get_version(cont) for cont in grid.containers]
+        cand_versions = [grid.get_candidate_version(cand) for cand in range(1, 10)]
+        cell.candidates_mask &= ~CANDIDATE_BITS[6]
+        for cand, version in zip(range(1, 10), cand_versions):
+            self.assertEqual(grid.get_candidate_version(cand) > version, cand == 6, f"{cand}")
+        for cont, version in zip(grid.containers, versions):
+            if cont in grid.get_containers(cell):
+                self.assertGreater(grid.get_version(cont), version, f"{cont}")
+            else:
+                self.assertEqual(grid.get_version(cont), version, f"{cont}")
+
+    def test_trail(self) -> None:
+        grid = Grid(QUIZ, observable=False)
+        grid.init_candidates()
+        grid.enable_trail()
+        states = [cell.get_state() for cell in grid.cells]
+        mark = grid.trail_size
+        grid.set_value(grid.get_cell(1, 0), 6)
+        grid.get_cell(1, 1).candidates_mask &= ~CANDIDATE_BITS[2]
+        self.assertGreater(grid.trail_size, mark)
+        grid.rollback_trail(mark)
+        self.assertEqual(grid.trail_size, mark)
+        self.assertEqual([cell.get_state() for cell in grid.cells], states)
+        self._assert_candidate_positions(grid)
+
+    def test_headless(self) -> None:
+        grid = Grid(QUIZ, observable=False)
+        self.assertFalse(grid.is_observable)
+        with self.assertRaises(SudokuException):
+            grid.history_manager
+        with self.assertRaises(SudokuException):
+            grid.cells[0].add_on_change_handler(lambda cell: None)
+        grid.init_candidates()
+        grid.set_value(grid.get_cell(0, 0), 8)
+        self.assertEqual(grid.get_cell(0, 0).value, 8)
+        self.assertNotIn(8, grid.get_cell(1, 0).candidates)
+
+    def test_clone(self) -> None:
+        grid = Grid(QUIZ)
+        grid.init_candidates()
+        grid.set_value(grid.get_cell(0, 0), 8)
+        clone = grid.clone()
+        self.assertFalse(clone.is_observable)
+        self.assertEqual([cell.get_state() for cell in clone.cells], [cell.get_state() for cell in grid.cells])
+        self.assertEqual([cell.is_given for cell in clone.cells], [cell.is_given for cell in grid.cells])
+        clone.set_value(clone.get_cell(1, 0), 6)
+        self.assertEqual(grid.get_cell(1, 0).value, 0)
+        self.assertIn(6, grid.get_cell(1, 1).candidates)
+        self.assertNotIn(6, clone.get_cell(1, 1).candidates)
+        self._assert_candidate_positions(grid)
+        self._assert_candidate_positions(clone)
+
+    def test_overlay(self) -> None:
+        grid = Grid(QUIZ)
+        grid.init_candidates()
+        cell = grid.get_cell(1, 0)
+        peer = grid.get_cell(1, 1)
+        overlay = GridOverlay(grid)
+        overlay.set_value(cell, 6)
+        self.assertEqual(overlay.get_value(cell), 6)
+        self.assertNotIn(6, overlay.get_candidates(peer))
+        self.assertIn(6, peer.candidates)
+        self.assertEqual(cell.value, 0)
+        nested = overlay.overlay()
+        nested.set_candidates_mask(peer, CANDIDATE_BITS[2])
+        self.assertEqual(overlay.get_candidates(peer), peer.candidates - {6})
+        preview = nested.to_grid()
+        self.assertEqual(preview.get_cell(1, 0).value, 6)
+        self.assertEqual(preview.get_cell(1, 1).candidates, frozenset({2}))
+        nested.commit()
+        self.assertEqual(overlay.get_candidates(peer), frozenset({2}))
+        overlay.commit()
+        self.assertEqual(cell.value, 6)
+        self.assertEqual(peer.candidates, frozenset({2}))
+
+    def test_overlay_conflicts(self) -> None:
+        grid = Grid(QUIZ)
+        grid.init_candidates()
+        cell = grid.get_cell(1, 0)
+        peer = grid.get_cell(1, 1)
+        overlay = GridOverlay(grid)
+        nested = overlay.overlay()
+        nested.set_candidates_mask(peer, CANDIDATE_BITS[2])
+        overlay.set_value(peer, 2)
+        with self.assertRaises(SudokuException):
+            nested.commit()
+        self.assertEqual(nested.get_candidates(peer), frozenset({2}))  # nothing applied
+        nested.rollback()
+        overlay.commit()
+        # Unrelated changes of the parent do not conflict
+        overlay.set_value(cell, 6)
+        other = grid.get_cell(7, 4)
+        other.candidates_mask &= ~CANDIDATE_BITS[5]
+        overlay.commit()
+        self.assertEqual(cell.value, 6)
+        # Changes overwriting the ones of the parent do
+        overlay.set_candidates_mask(other, CANDIDATE_BITS[2])
+        other.candidates_mask &= ~CANDIDATE_BITS[6]
+        with self.assertRaises(SudokuException):
+            overlay.commit()
+
+    def _assert_candidate_positions(self, grid: Grid) -> None:
+        for cont in grid.containers:
+            for cand in range(1, 10):
+                expected = sum(1 << pos for pos, cell in enumerate(cont.cells) if cand in cell.candidates)
+                self.assertEqual(grid.get_candidate_positions(cont, cand), expected, f"{cont} {cand}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import tempfile
+import unittest
+from dataclasses import replace
+from logging import INFO
+from os import path
+
+from batch import RatingPipeline, SolutionStore, StoreRecord, load_dataset
+from batch.rating import rate_chunk
+from solver import DifficultyRater, Level
+from solver.rating import TECHNIQUES
+from sudoku import Grid
+
+
+class RatingTest(unittest.TestCase):
+    def test_levels(self) -> None:
+        rater = DifficultyRater()
+        for quiz, solutions in load_dataset(self._get_path("kaggle_small.txt"))[:50]:
+            rating = rater.rate(quiz)
+            self.assertEqual((rating.level, rating.technique), (Level.EASY, "Singles propagation"), quiz)
+            self.assertEqual(rating.solution, solutions[0], quiz)
+            self.assertEqual(rating.score, 10 * quiz.count("0"), quiz)
+        for quiz, solutions in load_dataset(self._get_path("top87_ez.txt")):
+            rating = rater.rate(quiz)
+            self.assertEqual(rating.solution, solutions[0], quiz)
+            self.assertNotEqual(rating.level, Level.EASY, quiz)
+            self.assertEqual(rating.level, TECHNIQUES[str(rating.technique)][1], quiz)
+            self.assertEqual(
+                rating.score, sum(TECHNIQUES[name][0] * count for name, count in rating.techniques.items())
+            )
+            self.assertEqual(rater.rate(Grid(quiz)), rating, quiz)
+
+    def test_complete_grid(self) -> None:
+        solution = load_dataset(self._get_path("kaggle_small.txt"))[0][1][0]
+        rating = DifficultyRater().rate(solution)
+        self.assertEqual((rating.score, rating.level, rating.technique), (0, Level.EASY, None))
+        self.assertEqual(rating.solution, solution)
+
+    def test_unsolved(self) -> None:
+        quiz = load_dataset(self._get_path("topn87_hr.txt"))[0][0]
+        with self.assertLogs(level="WARNING"):
+            rating = DifficultyRater().rate(quiz)
+        self.assertEqual(rating.level, Level.EXTREME)
+        self.assertFalse(rating.solved)
+        self.assertGreater(rating.score, 0)
+        # Expected failures are not warned about
+        with self.assertNoLogs(level="WARNING"):
+            self.assertEqual(DifficultyRater(failure_level=INFO).rate(quiz), rating)
+
+    def test_pipeline(self) -> None:
+        quizzes = [quiz for quiz, _ in load_dataset(self._get_path("top87_ez.txt"))[:20]]
+        rater = DifficultyRater()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with SolutionStore(path.join(tmp_dir, "store.db")) as store:
+                ratings = RatingPipeline(workers=2, chunk_size=3, store=store).rate(quizzes)
+                self.assertEqual(ratings, [rater.rate(quiz) for quiz in quizzes])
+                for quiz, rating in zip(quizzes, ratings):
+                    record = store.get(quiz)
+                    assert record and rating
+                    self.assertEqual((record.rating, record.technique), (rating.score, rating.technique), quiz)
+                # Stored ratings are not computed again: they come without per technique applications
+                stored_ratings = RatingPipeline(workers=2, chunk_size=3, store=store).rate(quizzes)
+                self.assertEqual(stored_ratings, [replace(rating, techniques={}) for rating in ratings if rating])
+
+    def test_stored_unsolved(self) -> None:
+        quiz, solutions = load_dataset(self._get_path("topn87_hr.txt"))[0]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with SolutionStore(path.join(tmp_dir, "store.db")) as store:
+                store.put(quiz, StoreRecord(solutions[0]))  # found by a search
+                for _ in range(2):
+                    (rating,) = RatingPipeline(workers=1, store=store).rate([quiz])
+                    assert rating
+                    self.assertEqual((rating.level, rating.solution), (Level.EXTREME, None))
+                self.assertEqual(store.get(quiz).solution, solutions[0])  # type: ignore[union-attr]
+
+    def test_invalid_quizzes(self) -> None:
+        quiz = load_dataset(self._get_path("top87_ez.txt"))[0][0]
+        with self.assertLogs(level="WARNING"):
+            chunk = rate_chunk(0, 0, ["123", quiz, "x" * 81])
+        self.assertEqual(chunk.ratings, [None, DifficultyRater().rate(quiz), None])
+
+    @staticmethod
+    def _get_path(file_name: str) -> str:
+        return path.join(path.dirname(__file__), "datasets", file_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import asyncio
+import tempfile
+import unittest
+from os import path
+from typing import Awaitable
+
+from batch import INVALID, UNSOLVED, load_dataset
+from service import BUSY, SOLVED, TIMEOUT, SolverService
+
+
+class ServiceTest(unittest.IsolatedAsyncioTestCase):
+    async def test_tcp(self) -> None:
+        puzzles = load_dataset(self._get_path("kaggle_small.txt"))[:20]
+        no_solutions = load_dataset(self._get_path("no_solutions.txt"))
+        quiz, solutions = puzzles[0]
+        service = SolverService(workers=2)
+        await service.start(port=0)
+        try:
+            host, port = service.addresses[0].split(":")
+            requests = [quiz for quiz, _ in puzzles] + [
+                no_solutions[0][0],
+                "123456780000000009" + "0" * 63,
+                "123",
+                f"unknown {quiz}",
+                f"logical {quiz}",
+            ]
+            responses = await self._request(asyncio.open_connection(host, int(port)), requests)
+        finally:
+            await service.close()
+        expected = [f"{SOLVED} {solutions[0]}" for _, solutions in puzzles]
+        expected += [INVALID, UNSOLVED, INVALID, INVALID, f"{SOLVED} {solutions[0]}"]
+        self.assertEqual(responses, expected)
+        self.assertEqual(service.pending, 0)
+
+    async def test_unix_socket(self) -> None:
+        quiz, solutions = load_dataset(self._get_path("topn87_hr.txt"))[0]
+        service = SolverService(workers=1, timeout=0.001)
+        with tempfile.TemporaryDirectory() as directory:
+            socket_path = path.join(directory, "service.sock")
+            await service.start(path=socket_path)
+            try:
+                responses = await self._request(asyncio.open_unix_connection(socket_path), [f"brute-force {quiz}"])
+                self.assertEqual(service.addresses, [socket_path])
+                self.assertEqual(responses, [TIMEOUT])
+            finally:
+                await service.close()
+
+    async def test_timed_out_requests_pending(self) -> None:
+        quiz = (
+            "001000007000890000000000600260030000000500074900000000000104050830000000000000100"  # ~0.5 s, no solution
+        )
+        service = SolverService(workers=1, timeout=0.05)
+        await service.start(port=0)
+        try:
+            self.assertEqual(await service.solve(f"brute-force {quiz}"), TIMEOUT)
+            self.assertEqual(service.pending, 1)  # the worker is still busy with it
+            while service.pending:
+                await asyncio.sleep(0.01)
+        finally:
+            await service.close()
+
+    async def test_close_connections(self) -> None:
+        quiz = load_dataset(self._get_path("topn87_hr.txt"))[0][0]
+        service = SolverService(workers=1)
+        await service.start(port=0)
+        host, port = service.addresses[0].split(":")
+        reader, writer = await asyncio.open_connection(host, int(port))
+        try:
+            writer.write(f"brute-force {quiz}\n".encode())
+            await writer.drain()
+            while not service.connections:
+                await asyncio.sleep(0)
+        finally:
+            await service.close()
+        self.assertEqual(service.connections, 0)
+        # The connection is closed by the service: reading ends, the response may have been sent before
+        try:
+            self.assertLessEqual((await reader.read()).count(b"\n"), 1)
+        except ConnectionResetError:
+            pass
+        writer.close()
+
+    async def test_queue_limit(self) -> None:
+        quizzes = [quiz for quiz, _ in load_dataset(self._get_path("topn87_hr.txt"))[:10]]
+        service = SolverService(workers=1, queue_limit=2)
+        await service.start(port=0)
+        try:
+            responses = await asyncio.gather(*(service.solve(f"brute-force {quiz}") for quiz in quizzes))
+        finally:
+            await service.close()
+        self.assertEqual(responses.count(BUSY), len(quizzes) - 2)
+        self.assertTrue(all(response.startswith(SOLVED) for response in responses[:2]))
+
+    @staticmethod
+    async def _request(
+        connection: Awaitable[tuple[asyncio.StreamReader, asyncio.StreamWriter]], requests: list[str]
+    ) -> list[str]:
+        reader, writer = await connection
+        writer.write("".join(f"{request}\n" for request in requests).encode())
+        await writer.drain()
+        writer.write_eof()
+        responses = [line.decode().strip() async for line in reader]
+        writer.close()
+        return responses
+
+    @staticmethod
+    def _get_path(file_name: str) -> str:
+        return path.join(path.dirname(__file__), "datasets", file_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import random
+import unittest
+from logging import WARNING
+from os import path
+
+from solver import BitboardSolver, BruteForcer, SolutionCache, Solver, SolverException
+from sudoku import Grid, Symmetry
+from sudoku.canonical import LINE_PERMUTATIONS
+
+
+class SolutionCacheTest(unittest.TestCase):
+    def test_isomorphic_puzzles(self) -> None:
+        rnd = random.Random(0)
+        cache = SolutionCache()
+        lines = self._read_lines("kaggle_small.txt")[:50]
+        for quiz, solution in lines:
+            self.assertEqual(BitboardSolver(quiz, cache=cache).create_solution(), solution, quiz)
+        self.assertEqual((cache.hits, cache.misses, cache.size), (0, len(lines), len(lines)))
+        for quiz, solution in lines:
+            symmetry = self._get_random_symmetry(rnd)
+            result = BitboardSolver(symmetry.apply(quiz), cache=cache).create_solution()
+            self.assertEqual(result, symmetry.apply(solution), quiz)
+        self.assertEqual((cache.hits, cache.misses), (len(lines), len(lines)))
+        self.assertEqual(cache.hit_rate, 0.5)
+
+    def test_eviction(self) -> None:
+        cache = SolutionCache(max_size=2)
+        quizzes = [quiz for quiz, _ in self._read_lines("kaggle_small.txt")[:3]]
+        for quiz in quizzes:
+            BitboardSolver(quiz, cache=cache).create_solution()
+        BitboardSolver(quizzes[2], cache=cache).create_solution()
+        BitboardSolver(quizzes[0], cache=cache).create_solution()
+        self.assertEqual((cache.hits, cache.misses, cache.size), (1, 4, 2))
+        cache.clear()
+        self.assertEqual((cache.hits, cache.misses, cache.size), (0, 0, 0))
+        with self.assertRaises(SolverException):
+            SolutionCache(max_size=0)
+
+    def test_multiple_solutions(self) -> None:
+        cache = SolutionCache()
+        lines = self._read_lines("multiple_solutions.txt")
+        for _ in range(2):
+            for quiz, *solutions in lines:
+                brute_forcer = BruteForcer(Grid(quiz), cache=cache)
+                results = [brute_forcer.create_solution() for _ in solutions]
+                with self.assertLogs(level=WARNING):
+                    self.assertIsNone(brute_forcer.create_solution(), f"{quiz} too much solutions found")
+                self.assertEqual(sorted(map(str, results)), sorted(solutions), f"{quiz} wrong solutions")
+        self.assertEqual((cache.hits, cache.misses), (len(lines), len(lines)))
+
+    def test_no_solutions(self) -> None:
+        cache = SolutionCache()
+        quiz = "444300209005009001070060043006002087190007400050083000600000105003508690042910300"  # two 4 in a row
+        for _ in range(2):
+            with self.assertLogs(level=WARNING):
+                self.assertIsNone(BitboardSolver(quiz, cache=cache).create_solution())
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        # Sparse puzzles are cached as well
+        for _ in range(2):
+            with self.assertLogs(level=WARNING):
+                self.assertIsNone(BitboardSolver("11" + "0" * 79, cache=cache).create_solution())
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_logical_outcomes(self) -> None:
+        rnd = random.Random(1)
+        cache = SolutionCache()
+        for quiz, _ in self._read_lines("top87_ez.txt")[:20]:
+            for variant in (quiz, self._get_random_symmetry(rnd).apply(quiz)):
+                expected_grid = Grid(variant, observable=False)
+                expected_grid.init_candidates()
+                expected = Solver(expected_grid).solve()
+                grid = Grid(variant, observable=False)
+                grid.init_candidates()
+                self.assertEqual(Solver(grid, cache=cache).solve(), expected, variant)
+                self.assertEqual(
+                    [cell.get_state() for cell in grid.cells], [cell.get_state() for cell in expected_grid.cells]
+                )
+        self.assertEqual((cache.hits, cache.misses), (20, 20))
+
+    @staticmethod
+    def _get_random_symmetry(rnd: random.Random) -> Symmetry:
+        digits = (0,) + tuple(rnd.sample(range(1, 10), 9))
+        return Symmetry(rnd.random() < 0.5, rnd.choice(LINE_PERMUTATIONS), rnd.choice(LINE_PERMUTATIONS), digits)
+
+    @staticmethod
+    def _read_lines(file_name: str) -> list[list[str]]:
+        with open(path.join(path.dirname(__file__), "datasets", file_name)) as file:
+            return [line.strip().split(",") for line in file if not line.startswith("#")]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,15 @@
+import tempfile
 import unittest
 from logging import WARNING
 from os import path
+from typing import Iterable
 
-from solver import Solver
-from sudoku import Grid
+from solver import Solver, SolverStats, StrategyScheduler
+from solver.basic_fish import BasicFish
+from solver.hidden_subset import HiddenSubset
+from solver.naked_subset import NakedSubset
+from solver.singles_propagator import SinglesPropagator
+from sudoku import CANDIDATE_BITS, Cell, Container, Grid
 
 
 class SolverTest(unittest.TestCase):
@@ -16,6 +22,49 @@ class SolverTest(unittest.TestCase):
     def test_solutions3(self) -> None:
         self._test_solutions("top87_ez.txt")
 
+    def test_headless(self) -> None:
+        self._test_solutions("test.txt", observable=False)
+
+    def test_singles_propagation(self) -> None:
+        file_path = path.join(path.dirname(__file__), "datasets", "kaggle_small.txt")
+        with open(file_path) as file:
+            for line in file:
+                quiz, solution = line.strip().split(",")
+                grid = Grid(quiz, observable=False)
+                grid.init_candidates()
+                self.assertTrue(SinglesPropagator(grid).solve(), f"{quiz}: no singles found")
+                result = "".join(str(cell.value) for cell in grid.cells)
+                self.assertEqual(result, solution, f"{quiz}: not solved in one propagation")
+
+    def test_stats(self) -> None:
+        file_path = path.join(path.dirname(__file__), "datasets", "test.txt")
+        stats = SolverStats()
+        placements, eliminations = 0, 0
+        with open(file_path) as file:
+            for line in file:
+                if line.startswith("#"):
+                    continue
+                grid = Grid(line.strip().split(",")[0], observable=False)
+                grid.init_candidates()
+                self.assertTrue(Solver(grid, stats=stats).solve())
+                placements += grid.placements_count
+                eliminations += grid.eliminations_count
+        self.assertEqual(stats.puzzles, stats.solved)
+        self.assertEqual(sum(strategy.placements for strategy in stats.strategies.values()), placements)
+        self.assertEqual(sum(strategy.eliminations for strategy in stats.strategies.values()), eliminations)
+        self.assertGreater(stats.get("X-Wing").hits, 0)
+        self.assertEqual(SolverStats.from_dict(stats.to_dict()).to_dict(), stats.to_dict())
+        self.assertIn("Singles propagation", stats.format_table())
+
+    def test_scheduler(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            profile_path = path.join(tmp_dir, "profile.json")
+            for _ in range(2):
+                scheduler = StrategyScheduler.load(profile_path, min_invocations=1)
+                self._test_solutions("top87_ez.txt", scheduler=scheduler)
+                scheduler.save(profile_path)
+            self.assertEqual(StrategyScheduler.load(profile_path).stats.puzzles, 2 * 44)
+
     def test_unsolvable(self) -> None:
         file_path = path.join(path.dirname(__file__), "datasets", "multiple_solutions.txt")
         with open(file_path) as file:
@@ -28,20 +77,163 @@ class SolverTest(unittest.TestCase):
                 self.assertFalse(grid.is_solved, f"{quiz}: should not be solved")
                 self.assertTrue(grid.is_consistent, f"{quiz}: is inconsistent")
 
-    def _test_solutions(self, file_name: str) -> None:
+    def test_scheduler_gating(self) -> None:
+        stats = SolverStats()
+        for _ in range(10):
+            stats.record("Naked pair", 1000.0, True, 1, 0)
+        scheduler = StrategyScheduler(stats, min_invocations=1, max_cost=1.0)
+        grid = Grid("0" * 81, observable=False)
+        self.assertTrue(scheduler.is_gated(NakedSubset(grid, 2)))
+        self.assertFalse(scheduler.is_gated(HiddenSubset(grid, 2)))
+        self.assertFalse(StrategyScheduler(stats, min_invocations=1).is_gated(NakedSubset(grid, 2)))
+        gated_stats, default_stats = SolverStats(), SolverStats()
+        self._test_solutions("top87_ez.txt", scheduler=scheduler, stats=gated_stats)
+        self._test_solutions("top87_ez.txt", stats=default_stats)
+        # Gated strategy runs only when nothing else makes progress
+        self.assertLess(gated_stats.get("Naked pair").invocations, default_stats.get("Naked pair").invocations)
+        self.assertEqual(gated_stats.solved, default_stats.solved)
+
+    def test_scheduler_order(self) -> None:
+        grid = Grid("0" * 81, observable=False)
+        strategies = (NakedSubset(grid, 2), HiddenSubset(grid, 2), BasicFish(grid, 4), NakedSubset(grid, 3))
+        stats = SolverStats()
+        for _ in range(2):
+            stats.record("Naked pair", 2.0, True, 1, 0)
+            stats.record("Naked triple", 1.0, True, 1, 0)
+        stats.record("Jelyfish", 0.5, True, 1, 0)  # cheap, but not measured enough: stays in place
+        order = StrategyScheduler(stats, min_invocations=2).order(strategies)
+        self.assertEqual(
+            [str(strategy) for strategy in order], ["Naked triple", "Hidden pair", "Jelyfish", "Naked pair"]
+        )
+        self.assertEqual(StrategyScheduler(stats, min_invocations=3).order(strategies), strategies)
+
+    def test_shared_stats(self) -> None:
+        quiz, _ = self._read_lines("top87_ez.txt")[0]
+        shared_stats, stats = SolverStats(), SolverStats()
+        for solver_stats, scheduler in ((shared_stats, StrategyScheduler(shared_stats)), (stats, None)):
+            grid = Grid(quiz, observable=False)
+            grid.init_candidates()
+            Solver(grid, stats=solver_stats, scheduler=scheduler).solve()
+        self.assertEqual(shared_stats.puzzles, 1)
+        self.assertEqual(
+            {name: strategy.invocations for name, strategy in shared_stats.strategies.items()},
+            {name: strategy.invocations for name, strategy in stats.strategies.items()},
+        )
+
+    def test_clean_containers_skipped(self) -> None:
+        quiz, _ = self._read_lines("top87_ez.txt")[0]
+        grid = Grid(quiz, observable=False)
+        grid.init_candidates()
+        SinglesPropagator(grid).solve()
+        strategy = _CountingNakedSubset(grid, 2)
+        while strategy.solve():
+            pass
+        self.assertGreater(strategy.calls, 0)
+        # Nothing changed since the last pass: every house is clean
+        strategy.calls = 0
+        self.assertFalse(strategy.solve())
+        self.assertEqual(strategy.calls, 0)
+        # Only the houses of a changed cell are solved again
+        cell = next(cell for cell in grid.cells if len(cell.candidates) > 2)
+        cell.candidates_mask &= ~CANDIDATE_BITS[min(cell.candidates)]
+        strategy.solve()
+        self.assertIn(strategy.calls, range(1, 4))
+
+    def test_unchanged_digits_skipped(self) -> None:
+        quiz, _ = self._read_lines("top87_ez.txt")[0]
+        grid = Grid(quiz, observable=False)
+        grid.init_candidates()
+        SinglesPropagator(grid).solve()
+        strategy = _CountingFish(grid, 2)
+        while strategy.solve():
+            pass
+        self.assertTrue(strategy.candidates)
+        # Nothing changed since the last pass: every digit is skipped
+        strategy.candidates.clear()
+        self.assertFalse(strategy.solve())
+        self.assertEqual(strategy.candidates, set())
+        # Only the digit of a changed candidate is searched again
+        cell = next(cell for cell in grid.cells if len(cell.candidates) > 2)
+        cand = min(cell.candidates)
+        cell.candidates_mask &= ~CANDIDATE_BITS[cand]
+        strategy.solve()
+        self.assertEqual(strategy.candidates, {cand})
+
+    def test_digits_skip_solutions(self) -> None:
+        hits = 0
+        for file_name in ("top87_ez.txt", "topn87_hr.txt", "test.txt"):
+            for quiz, *_ in self._read_lines(file_name):
+                results = []
+                for fish in (BasicFish, _NotSkippingFish):
+                    grid = Grid(quiz, observable=False)
+                    grid.init_candidates()
+                    propagator, fishes = SinglesPropagator(grid), [fish(grid, size) for size in (2, 3, 4)]
+                    fish_hits = 0
+                    while True:
+                        if propagator.solve():
+                            continue
+                        if not any(strategy.solve() for strategy in fishes):
+                            break
+                        fish_hits += 1
+                    results.append((fish_hits, [cell.get_state() for cell in grid.cells]))
+                self.assertEqual(results[0], results[1], quiz)
+                hits += results[0][0]
+        self.assertGreater(hits, 0)  # fishes are found: the skipping is exercised
+
+    @staticmethod
+    def _read_lines(file_name: str) -> list[list[str]]:
+        with open(path.join(path.dirname(__file__), "datasets", file_name)) as file:
+            return [line.strip().split(",") for line in file if not line.startswith("#")]
+
+    def _test_solutions(
+        self,
+        file_name: str,
+        *,
+        observable: bool = True,
+        scheduler: StrategyScheduler | None = None,
+        stats: SolverStats | None = None,
+    ) -> None:
         file_path = path.join(path.dirname(__file__), "datasets", file_name)
         with open(file_path) as file:
             for line in file:
                 if line.startswith("#"):
                     continue
                 quiz, solution = line.strip().split(",")
-                grid = Grid(quiz)
+                grid = Grid(quiz, observable=observable)
                 with self.assertNoLogs(level=WARNING):
                     grid.init_candidates()
-                    self.assertTrue(Solver(grid).solve(), f"{quiz} solution not found")
+                    self.assertTrue(
+                        Solver(grid, scheduler=scheduler, stats=stats).solve(), f"{quiz} solution not found"
+                    )
                 result = "".join(str(cell.value) for cell in grid.cells)
                 self.assertEqual(result, solution, f"{quiz}: wrong solution")
 
 
+class _CountingNakedSubset(NakedSubset):
+    def __init__(self, grid: Grid, subset_length: int):
+        super().__init__(grid, subset_length)
+        self.calls = 0
+
+    def _solve_container(self, container: Container) -> bool:
+        self.calls += 1
+        return super()._solve_container(container)
+
+
+class _CountingFish(BasicFish):
+    def __init__(self, grid: Grid, subset_length: int):
+        super().__init__(grid, subset_length)
+        self.candidates: set[int] = set()
+
+    def _get_cand_subsets(self, containers: Iterable[Container], candidate: int) -> list[set[Cell]]:
+        self.candidates.add(candidate)
+        return super()._get_cand_subsets(containers, candidate)
+
+
+class _NotSkippingFish(BasicFish):
+    def solve(self) -> bool:
+        self._idle_versions.clear()
+        return super().solve()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,90 @@
+import tempfile
+import unittest
+from os import path
+
+from batch import (
+    BatchException,
+    BatchPipeline,
+    Engine,
+    SolutionStore,
+    StoreRecord,
+    load_dataset,
+)
+
+
+class StoreTest(unittest.TestCase):
+    def test_records(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store_path = path.join(tmp_dir, "store.db")
+            quiz, solutions = load_dataset(self._get_path("test.txt"))[0]
+            with SolutionStore(store_path, batch_size=2) as store:
+                self.assertIsNone(store.get(quiz))
+                store.put(quiz, StoreRecord(solutions[0]))
+                store.put(quiz, StoreRecord(solutions_count=1, rating=1.5))
+                store.put(quiz, StoreRecord(technique="X-Wing"))
+                self.assertEqual(store.get(quiz.replace("0", ".")), StoreRecord(solutions[0], 1, 1.5, "X-Wing"))
+                store.put("0" * 81, StoreRecord(rating=2.0))
+                self.assertFalse(store.get("0" * 81).is_solved)  # type: ignore[union-attr]
+                store.put("1" * 81, StoreRecord(solutions_count=0))
+            # Records survive the restart
+            with SolutionStore(store_path) as store:
+                self.assertEqual(store.size, 3)
+                self.assertEqual(store.get(quiz), StoreRecord(solutions[0], 1, 1.5, "X-Wing"))
+                self.assertTrue(store.get("1" * 81).is_solved)  # type: ignore[union-attr]
+
+    def test_pipeline(self) -> None:
+        puzzles = load_dataset(self._get_path("kaggle_small.txt"))[:40]
+        quizzes = [quiz for quiz, _ in puzzles] + [
+            quiz for quiz, _ in load_dataset(self._get_path("no_solutions.txt"))
+        ]
+        expected = [solutions[0] for _, solutions in puzzles] + [None] * (len(quizzes) - len(puzzles))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store_path = path.join(tmp_dir, "store.db")
+            with SolutionStore(store_path) as store:
+                pipeline = BatchPipeline(Engine.BITBOARD, workers=2, chunk_size=7, store=store)
+                self.assertEqual(pipeline.solve(quizzes[::2]), expected[::2])
+                self.assertEqual(store.size, len(quizzes[::2]))
+            with SolutionStore(store_path) as store:
+                chunks = list(
+                    BatchPipeline(Engine.BITBOARD, workers=2, chunk_size=7, store=store).iter_chunks(quizzes)
+                )
+                self.assertEqual([solution for chunk in chunks for solution in chunk.solutions], expected)
+                self.assertEqual(store.size, len(quizzes))
+                # Logical solving failures are not stored as puzzles without solutions
+                hard_quiz = load_dataset(self._get_path("topn87_hr.txt"))[0][0]
+                self.assertEqual(BatchPipeline(Engine.LOGICAL, workers=1, store=store).solve([hard_quiz]), [None])
+                self.assertIsNone(store.get(hard_quiz))
+
+    def test_uniqueness(self) -> None:
+        puzzles = load_dataset(self._get_path("kaggle_small.txt"))[:10]
+        multiple_quiz, multiple_solutions = load_dataset(self._get_path("multiple_solutions.txt"))[0]
+        no_solutions_quiz = load_dataset(self._get_path("no_solutions.txt"))[0][0]
+        quizzes = [quiz for quiz, _ in puzzles] + [multiple_quiz, no_solutions_quiz]
+        expected_counts = [1] * len(puzzles) + [2, 0]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with SolutionStore(path.join(tmp_dir, "store.db")) as store:
+                # Solutions stored without the uniqueness verdicts are solved again
+                BatchPipeline(workers=2, store=store).solve(quizzes)
+                self.assertTrue(
+                    all(record and record.solutions_count is None for record in store.get_many(quizzes[:-1]))
+                )
+                for _ in range(2):
+                    pipeline = BatchPipeline(workers=2, chunk_size=5, store=store, check_uniqueness=True)
+                    chunks = list(pipeline.iter_chunks(quizzes))
+                    self.assertEqual([count for chunk in chunks for count in chunk.solutions_counts], expected_counts)
+                    records = store.get_many(quizzes)
+                    self.assertEqual([record.solutions_count for record in records if record], expected_counts)
+                self.assertIn(store.get(multiple_quiz).solution, multiple_solutions)  # type: ignore[union-attr]
+
+    def test_illegal_arguments(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(BatchException):
+                SolutionStore(path.join(tmp_dir, "store.db"), batch_size=0)
+
+    @staticmethod
+    def _get_path(file_name: str) -> str:
+        return path.join(path.dirname(__file__), "datasets", file_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
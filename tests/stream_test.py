@@ -0,0 +1,53 @@
+import unittest
+from io import StringIO
+from os import path
+
+from batch import INVALID, UNSOLVED, Engine, LatencyHistogram, solve_stream
+
+
+class StreamTest(unittest.TestCase):
+    def test_solve_stream(self) -> None:
+        datasets = path.join(path.dirname(__file__), "datasets")
+        with open(path.join(datasets, "test.txt")) as file:
+            lines = [line for line in file if not line.startswith("#")]
+        with open(path.join(datasets, "no_solutions.txt")) as file:
+            lines += list(file)
+        # Consistent givens without solution: the last cell of the first row can only be 9
+        lines.append("123456780000000009" + "0" * 63 + "\n")
+        lines += ["\n", "# comment\n", "123\n", f"{lines[0].split(',')[0]},{'1' * 81}\n"]
+        for engine in (Engine.BITBOARD, Engine.LOGICAL):
+            output = StringIO()
+            report = solve_stream(iter(lines), output, engine)
+            results = output.getvalue().splitlines()
+            solutions = [line.strip().split(",")[1] for line in lines if "," in line]
+            self.assertEqual(len(results), report.puzzles, engine)
+            self.assertEqual(results[: len(solutions) - 1], solutions[:-1], engine)
+            # Contradictory givens are invalid
+            self.assertEqual(results[len(solutions) - 1 : -3], [INVALID] * 5, engine)
+            self.assertEqual(results[-3:-1], [UNSOLVED, INVALID], engine)
+            self.assertEqual(
+                (report.solved, report.unsolved, report.invalid, report.wrong),
+                (len(solutions), 1, 6, 1),
+                engine,
+            )
+            self.assertEqual(report.latencies.count, report.puzzles, engine)
+            self.assertGreater(report.rate, 0, engine)
+            self.assertIn("Puzzles/s", report.format(), engine)
+
+    def test_latency_histogram(self) -> None:
+        histogram = LatencyHistogram()
+        self.assertEqual(histogram.percentile(50), 0.0)
+        for latency in range(1, 1001):
+            histogram.add(latency / 1000)
+        self.assertEqual(histogram.count, 1000)
+        self.assertEqual(histogram.max, 1.0)
+        for percent in (50, 90, 99):
+            self.assertAlmostEqual(histogram.percentile(percent), percent / 100, delta=percent / 100 * 0.13)
+        self.assertEqual(histogram.percentile(100), 1.0)
+        histogram.add(0)
+        histogram.add(10**6)
+        self.assertEqual(histogram.max, 10**6)
+
+
+if __name__ == "__main__":
+    unittest.main()
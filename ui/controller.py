@@ -1,6 +1,6 @@
 from typing import Iterable
 
-from solver import BruteForcer, Solver, SolverException
+from solver import BitboardSolver, Solver, SolverException
 from sudoku import Cell, Grid, SudokuException
 
 from .grid_frame import Cursor
@@ -13,7 +13,7 @@ class Controller:
         self._grid = grid
         self._grid.history_manager.enable_history()
         self._grid.history_manager.add_on_change_handler(self._on_grid_changed)
-        self._brute_forcer = BruteForcer(self._grid)
+        self._search_backend = BitboardSolver(self._grid)
         self._cell: Cell | None = None
         self._value: int | None = None
         self._update_value_counts()
@@ -69,7 +69,7 @@ class Controller:
         self._grid = grid
         self._grid.history_manager.enable_history()
         self._grid.history_manager.add_on_change_handler(self._on_grid_changed)
-        self._brute_forcer = BruteForcer(self._grid)
+        self._search_backend = BitboardSolver(self._grid)
         self._cell = None
         self._value = None
         self._update_selected_value()
@@ -93,7 +93,7 @@ class Controller:
             self._window.show_info(str(e))
 
     def _on_show_solution(self) -> None:
-        solution = self._brute_forcer.create_solution()
+        solution = self._search_backend.create_solution()
         if not solution:
             self._window.show_info("No solution not found")
         elif solution != "".join(str(cell.value) for cell in self._grid.cells):
@@ -102,15 +102,15 @@ class Controller:
             self._window.show_info("Same solution achieved")
 
     def _on_undo(self) -> None:
-        self._brute_forcer.reset()
+        self._search_backend.reset()
         self._grid.history_manager.undo()
 
     def _on_redo(self) -> None:
-        self._brute_forcer.reset()
+        self._search_backend.reset()
         self._grid.history_manager.redo()
 
     def _on_reset(self) -> None:
-        self._brute_forcer.reset()
+        self._search_backend.reset()
         self._grid.reset()
 
     def _on_grid_changed(self) -> None: